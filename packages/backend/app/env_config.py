@@ -1,6 +1,6 @@
 import os
 import sys
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 ENV_LOCAL = "LOCAL"
 ENV_CLOUD = "CLOUD"
@@ -74,3 +74,105 @@ def is_set_app_config_on_ui_enabled() -> bool:
 
 def is_s3_enabled() -> bool:
     return os.getenv("S3_AWS_ACCESS_KEY_ID") is not None
+
+
+def get_processor_registry_mode() -> str:
+    """
+    How the processor registry is built: "manifest" (generated manifest, lazy imports),
+    "scan" (import and scan every processor module) or "auto" (manifest when it has been generated
+    after the last change to the processor modules).
+    """
+    return os.getenv("PROCESSOR_REGISTRY_MODE", "auto")
+
+
+def get_extensions_whitelist() -> List[str]:
+    raw_whitelist = os.getenv("EXTENSIONS_WHITELIST", "").strip()
+    return raw_whitelist.split(",") if raw_whitelist else []
+
+
+def get_extensions_blacklist() -> List[str]:
+    raw_blacklist = os.getenv("EXTENSIONS_BLACKLIST", "").strip()
+    return raw_blacklist.split(",") if raw_blacklist else []
+
+
+def get_launcher_max_concurrency() -> int:
+    return int(os.getenv("LAUNCHER_MAX_CONCURRENCY", "20"))
+
+
+def get_launcher_provider_concurrency() -> Dict[str, int]:
+    """
+    Per-provider concurrency limits, formatted as a comma separated list of
+    provider=limit pairs, e.g. "openai=10,anthropic=5".
+    """
+    raw_limits = os.getenv("LAUNCHER_PROVIDER_CONCURRENCY", "").strip()
+    limits = {}
+    if not raw_limits:
+        return limits
+    for raw_limit in raw_limits.split(","):
+        provider, _, limit = raw_limit.partition("=")
+        if provider.strip() and limit.strip():
+            limits[provider.strip()] = int(limit)
+    return limits
+
+
+def get_launcher_execution_mode() -> str:
+    return os.getenv("LAUNCHER_EXECUTION_MODE", "fail_fast")
+
+
+def get_launcher_scheduling_policy() -> str:
+    return os.getenv("LAUNCHER_SCHEDULING_POLICY", "critical_path")
+
+
+def is_node_output_cache_enabled() -> bool:
+    return os.getenv("NODE_OUTPUT_CACHE_ENABLED", "false") == "true"
+
+
+def get_node_output_cache_ttl() -> int:
+    return int(os.getenv("NODE_OUTPUT_CACHE_TTL", "600"))
+
+
+def get_node_output_cache_max_size() -> int:
+    return int(os.getenv("NODE_OUTPUT_CACHE_MAX_SIZE", "500"))
+
+
+def get_node_output_cache_backend() -> str:
+    return os.getenv("NODE_OUTPUT_CACHE_BACKEND", "memory")
+
+
+def get_node_output_cache_sqlite_path() -> str:
+    return os.getenv(
+        "NODE_OUTPUT_CACHE_SQLITE_PATH",
+        os.path.join(BACKEND_DIR, "cache", "node_output_cache.sqlite3"),
+    )
+
+
+def get_node_output_cache_redis_url() -> str:
+    return os.getenv("NODE_OUTPUT_CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+
+def get_streaming_flush_interval_ms() -> int:
+    return int(os.getenv("STREAMING_FLUSH_INTERVAL_MS", "50"))
+
+
+def get_streaming_flush_max_bytes() -> int:
+    return int(os.getenv("STREAMING_FLUSH_MAX_BYTES", "4096"))
+
+
+def get_event_queue_max_size() -> int:
+    return int(os.getenv("EVENT_QUEUE_MAX_SIZE", "1000"))
+
+
+def get_event_queue_overflow_policy() -> str:
+    return os.getenv("EVENT_QUEUE_OVERFLOW_POLICY", "drop_streaming")
+
+
+def get_socketio_message_queue() -> Optional[str]:
+    """
+    URL of the message queue shared by the Socket.IO workers, e.g. "redis://redis:6379/1".
+    Required to run more than one worker.
+    """
+    return os.getenv("SOCKETIO_MESSAGE_QUEUE") or None
+
+
+def get_socketio_channel() -> str:
+    return os.getenv("SOCKETIO_CHANNEL", "flask-socketio")
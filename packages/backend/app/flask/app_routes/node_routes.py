@@ -1,8 +1,13 @@
 import json
 
-from flask import Blueprint, request
+from flask import Blueprint, Response, request
 
-from ...utils.node_extension_utils import get_dynamic_extension_config, get_extensions
+from ...root_injector import get_root_injector
+from ...processors.cache.node_output_cache import NodeOutputCache
+from ...utils.node_extension_utils import (
+    get_dynamic_extension_config,
+    get_extensions_catalog,
+)
 
 # from ...utils.openapi_reader import OpenAPIReader
 from ...utils.replicate_utils import (
@@ -18,8 +23,14 @@ node_blueprint = Blueprint("node_blueprint", __name__)
 
 @node_blueprint.route("/node/extensions")
 def get_node_extensions():
-    extensions = get_extensions()
-    return {"extensions": extensions}
+    etag, body = get_extensions_catalog()
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @node_blueprint.route("/node/extensions/dynamic", methods=["POST"])
@@ -37,6 +48,12 @@ def get_dynamic_extension():
     return config.dict()
 
 
+@node_blueprint.route("/node/cache/stats")
+def get_node_output_cache_stats():
+    node_output_cache = get_root_injector().get(NodeOutputCache)
+    return node_output_cache.get_stats()
+
+
 @node_blueprint.route("/node/models")
 def get_public_models():
     cursor = request.args.get("cursor", None)
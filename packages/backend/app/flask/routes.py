@@ -1,6 +1,10 @@
 import logging
+from flask import jsonify
 from app.env_config import is_server_static_files_enabled, is_local_environment
 from app.flask.socketio_init import flask_app
+from app.processors.observer.session_event_dispatcher import SessionEventDispatcher
+from app.processors.observer.streaming_event_coalescer import StreamingEventCoalescer
+from app.root_injector import get_root_injector
 from .utils.constants import HTTP_OK
 
 
@@ -9,6 +13,16 @@ def healthcheck():
     return "OK", HTTP_OK
 
 
+@flask_app.route("/metrics/streaming", methods=["GET"])
+def streaming_metrics():
+    injector = get_root_injector()
+    metrics = {
+        **injector.get(StreamingEventCoalescer).get_metrics(),
+        **injector.get(SessionEventDispatcher).get_metrics(),
+    }
+    return jsonify(metrics), HTTP_OK
+
+
 from .app_routes.node_routes import node_blueprint
 
 flask_app.register_blueprint(node_blueprint)
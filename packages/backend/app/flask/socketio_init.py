@@ -2,8 +2,25 @@ import eventlet
 
 eventlet.monkey_patch(all=False, socket=True)
 
+import logging
 from flask_socketio import SocketIO
 from .flask_app import create_app
+from .socketio_message_queue import check_message_queue_requirements
+from ..env_config import get_socketio_channel, get_socketio_message_queue
 
 flask_app = create_app()
-socketio = SocketIO(flask_app, cors_allowed_origins="*", async_mode="eventlet")
\ No newline at end of file
+
+message_queue = get_socketio_message_queue()
+check_message_queue_requirements(message_queue)
+if message_queue is not None:
+    logging.info(
+        "Socket.IO events are shared with the other workers through the message queue"
+    )
+
+socketio = SocketIO(
+    flask_app,
+    cors_allowed_origins="*",
+    async_mode="eventlet",
+    message_queue=message_queue,
+    channel=get_socketio_channel(),
+)
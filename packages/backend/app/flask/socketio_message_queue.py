@@ -0,0 +1,19 @@
+from typing import Optional
+
+REDIS_URL_SCHEMES = ("redis://", "rediss://")
+
+
+def check_message_queue_requirements(message_queue: Optional[str]) -> None:
+    """
+    Fails at startup when the client library of the message queue is missing, Socket.IO would
+    only fail once it first connects to the queue.
+    """
+    if message_queue is None or not message_queue.startswith(REDIS_URL_SCHEMES):
+        return
+    try:
+        import redis
+    except ImportError:
+        raise RuntimeError(
+            "A Redis SOCKETIO_MESSAGE_QUEUE requires the 'redis' extra, "
+            "install the backend with `poetry install --extras redis`"
+        )
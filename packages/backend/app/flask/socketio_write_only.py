@@ -0,0 +1,29 @@
+from typing import Optional
+
+from flask_socketio import SocketIO
+
+from .socketio_message_queue import check_message_queue_requirements
+from ..env_config import get_socketio_channel, get_socketio_message_queue
+
+
+def create_write_only_socketio(
+    message_queue: Optional[str] = None, **kwargs
+) -> SocketIO:
+    """
+    Creates a Socket.IO instance for a process that does not serve clients, e.g. a worker running flows
+    in the background. Its events are published on the message queue and sent by the worker each client
+    is connected to. Such a process gives it to the root injector once, at startup:
+    `init_root_injector(SocketIOEventEmitter(create_write_only_socketio()))`.
+    """
+    message_queue = message_queue or get_socketio_message_queue()
+    if message_queue is None:
+        raise RuntimeError(
+            "SOCKETIO_MESSAGE_QUEUE must be set to emit events from a process without clients"
+        )
+    check_message_queue_requirements(message_queue)
+    return SocketIO(
+        message_queue=message_queue,
+        channel=get_socketio_channel(),
+        async_mode="eventlet",
+        **kwargs,
+    )
@@ -14,9 +14,18 @@ from ..root_injector import (
     get_root_injector,
     refresh_root_injector,
 )
-from .utils.constants import PARAMETERS_FIELD_NAME, ENV_API_KEYS
+from .utils.constants import (
+    PARAMETERS_FIELD_NAME,
+    ENV_API_KEYS,
+    SESSION_EVENT_ENCODING_KEY,
+)
 
 from ..processors.launcher.processor_launcher import ProcessorLauncher
+from ..processors.launcher.concurrency_limits import ConcurrencyLimits
+from ..processors.launcher.execution_mode import ExecutionMode
+from ..processors.observer.event_encoding import EventEncoding
+from ..processors.observer.session_event_dispatcher import SessionEventDispatcher
+from ..processors.observer.streaming_event_coalescer import StreamingEventCoalescer
 from ..processors.context.processor_context_flask_request import (
     ProcessorContextFlaskRequest,
 )
@@ -24,6 +33,66 @@ import traceback
 import os
 
 
+class RunEventObservers:
+    """
+    Streaming coalescer and session event dispatcher of the injector that built a launcher.
+    A run keeps flushing and waiting on them even if the root injector is refreshed meanwhile.
+    """
+
+    __slots__ = ("coalescer", "dispatcher")
+
+    def __init__(self, injector):
+        self.coalescer = injector.get(StreamingEventCoalescer)
+        self.dispatcher = injector.get(SessionEventDispatcher)
+
+    def discard_cancelled_nodes(self, sid, launcher: ProcessorLauncher):
+        """Nodes cancelled during the run will send no other event, their streaming state is dropped."""
+        report = launcher.get_run_report()
+        if report is None:
+            return
+        for node_name in report["cancelledNodes"]:
+            self.coalescer.discard_node(sid, node_name)
+
+    def wait_until_events_sent(self, sid):
+        """
+        Node events are buffered by the coalescer and sent by a sender green thread, they must all be sent
+        before run_end.
+        """
+        self.coalescer.flush_session(sid)
+        self.dispatcher.wait_until_sent(sid)
+
+    def discard_session(self, sid):
+        self.coalescer.discard_session(sid)
+        self.dispatcher.discard(sid)
+
+
+# Launchers currently running a flow, with their event observers, by Socket.IO session id.
+# They are cancelled when the client disconnects.
+active_launchers = {}
+
+
+def register_active_launcher(
+    sid, launcher: ProcessorLauncher, event_observers: RunEventObservers
+):
+    active_launchers.setdefault(sid, {})[launcher] = event_observers
+
+
+def unregister_active_launcher(sid, launcher: ProcessorLauncher):
+    launchers = active_launchers.get(sid)
+    if launchers is None:
+        return
+    launchers.pop(launcher, None)
+    if not launchers:
+        del active_launchers[sid]
+
+
+def end_run(sid, launcher: ProcessorLauncher, event_observers: RunEventObservers):
+    """Called once a launcher is done, before run_end is emitted."""
+    unregister_active_launcher(sid, launcher)
+    event_observers.discard_cancelled_nodes(sid, launcher)
+    event_observers.wait_until_events_sent(sid)
+
+
 def populate_request_global_object(data):
     """
     This function is responsible for initializing individual request objects either from the
@@ -55,8 +124,23 @@ def populate_request_global_object(data):
 
 
 @socketio.on("connect")
-def handle_connect():
+def handle_connect(auth=None):
+    """
+    Clients can ask for compact binary progress events by connecting with
+    `{"eventEncoding": "binary"}` as auth data, or with the `eventEncoding=binary` query parameter.
+    The encoding is kept in the Socket.IO session, the runs started by the client send it with their events.
+    """
     logging.info("Client connected")
+    encoding = None
+    if isinstance(auth, dict):
+        encoding = auth.get("eventEncoding")
+    if encoding is None:
+        encoding = request.args.get("eventEncoding")
+    try:
+        session[SESSION_EVENT_ENCODING_KEY] = EventEncoding.from_value(encoding).value
+    except ValueError as e:
+        logging.warning(f"{e}, using JSON")
+        session.pop(SESSION_EVENT_ENCODING_KEY, None)
 
 
 @socketio.on("process_file")
@@ -67,21 +151,32 @@ def handle_process_file(data):
 
     Parameters:
         data (dict): A dictionary encompassing the event's payload, which comprises the JSON configuration file
-                    ("jsonFile").
+                    ("jsonFile"), optional concurrency limits for this flow ("concurrency") and
+                    an optional execution mode ("executionMode": "fail_fast" or "continue_on_error").
 
     """
     try:
         populate_request_global_object(data)
         flow_data = json.loads(data.get("jsonFile"))
-        launcher = get_root_injector().get(ProcessorLauncher)
+        injector = get_root_injector()
+        launcher = injector.get(ProcessorLauncher)
+        event_observers = RunEventObservers(injector)
         launcher.set_context(ProcessorContextFlaskRequest(g, session, request.sid))
+        launcher.set_concurrency_limits(
+            ConcurrencyLimits.from_env().with_overrides(data.get("concurrency"))
+        )
+        launcher.set_execution_mode(ExecutionMode.from_value(data.get("executionMode")))
 
         if flow_data:
             processors = launcher.load_processors(flow_data)
-            output = launcher.launch_processors(processors)
+            register_active_launcher(request.sid, launcher, event_observers)
+            try:
+                output = launcher.launch_processors(processors)
+            finally:
+                end_run(request.sid, launcher, event_observers)
 
             logging.debug("Emitting processing_result event with output: %s", output)
-            emit("run_end", {"output": output})
+            emit("run_end", {"output": output, "report": launcher.get_run_report()})
         else:
             logging.warning("Invalid input or missing configuration file")
             emit("error", {"error": "Invalid input or missing configuration file"})
@@ -108,14 +203,24 @@ def handle_run_node(data):
         flow_data = json.loads(data.get("jsonFile"))
         node_name = data.get("nodeName")
 
-        launcher = get_root_injector().get(ProcessorLauncher)
+        injector = get_root_injector()
+        launcher = injector.get(ProcessorLauncher)
+        event_observers = RunEventObservers(injector)
         launcher.set_context(ProcessorContextFlaskRequest(g, session, request.sid))
+        launcher.set_concurrency_limits(
+            ConcurrencyLimits.from_env().with_overrides(data.get("concurrency"))
+        )
+        launcher.set_execution_mode(ExecutionMode.from_value(data.get("executionMode")))
 
         if flow_data and node_name:
             processors = launcher.load_processors_for_node(flow_data, node_name)
-            output = launcher.launch_processors_for_node(processors, node_name)
+            register_active_launcher(request.sid, launcher, event_observers)
+            try:
+                output = launcher.launch_processors_for_node(processors, node_name)
+            finally:
+                end_run(request.sid, launcher, event_observers)
             logging.debug("Emitting processing_result event with output: %s", output)
-            emit("run_end", {"output": output})
+            emit("run_end", {"output": output, "report": launcher.get_run_report()})
         else:
             logging.warning("Invalid input or missing parameters")
             emit("error", {"error": "Invalid input or missing parameters"})
@@ -131,6 +236,15 @@ def handle_run_node(data):
 @socketio.on("disconnect")
 def handle_disconnect():
     logging.info("Client disconnected")
+    launchers = active_launchers.pop(request.sid, {})
+    for launcher in launchers:
+        logging.info("Cancelling flow run of disconnected client")
+        launcher.cancel()
+    for event_observers in [
+        *launchers.values(),
+        RunEventObservers(get_root_injector()),
+    ]:
+        event_observers.discard_session(request.sid)
 
 
 @socketio.on("update_app_config")
@@ -5,6 +5,7 @@ HTTP_UNAUTHORIZED = 401
 
 
 SESSION_USER_ID_KEY = "user_id"
+SESSION_EVENT_ENCODING_KEY = "event_encoding"
 
 PARAMETERS_FIELD_NAME = "parameters"
 
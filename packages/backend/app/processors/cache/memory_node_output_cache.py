@@ -0,0 +1,31 @@
+from copy import deepcopy
+from typing import Any, Optional
+
+from cachetools import TTLCache
+from injector import singleton
+
+from .node_output_cache import NodeOutputCache
+from ...env_config import get_node_output_cache_max_size, get_node_output_cache_ttl
+
+
+@singleton
+class MemoryNodeOutputCache(NodeOutputCache):
+    """In-process node output cache. Entries expire after a TTL and the least recently used
+    entries are evicted once the cache is full. Outputs are copied in and out, so that a node
+    mutating its output never alters the cached entry."""
+
+    def __init__(self, max_size: int = None, ttl: int = None) -> None:
+        super().__init__()
+        self._cache = TTLCache(
+            maxsize=max_size or get_node_output_cache_max_size(),
+            ttl=ttl or get_node_output_cache_ttl(),
+        )
+
+    def _get_entry(self, key: str) -> Optional[Any]:
+        return deepcopy(self._cache.get(key))
+
+    def _set_entry(self, key: str, output: Any) -> None:
+        self._cache[key] = deepcopy(output)
+
+    def clear(self) -> None:
+        self._cache.clear()
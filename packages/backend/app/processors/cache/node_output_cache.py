@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+import logging
+from typing import Any, Dict, Optional
+
+
+class NodeOutputCache(ABC):
+    """Node output cache interface. Stores the outputs of deterministic nodes so they can be reused across runs,
+    indexed by the key built by `build_node_output_cache_key`.
+
+    Implementations store the entries, this base class keeps the hit and miss counters.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            output = self._get_entry(key)
+        except Exception as e:
+            logging.warning(f"Error reading node output cache: {e}")
+            output = None
+
+        if output is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logging.debug(f"Node output cache hit - {key}")
+        return output
+
+    def set(self, key: str, output: Any) -> None:
+        if output is None:
+            return
+        try:
+            self._set_entry(key, output)
+        except Exception as e:
+            logging.warning(f"Error writing node output cache: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    @abstractmethod
+    def _get_entry(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def _set_entry(self, key: str, output: Any) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
@@ -0,0 +1,55 @@
+import hashlib
+import json
+from typing import Any, Dict, List
+
+from ..components.processor import Processor
+from ..context.processor_context import ProcessorContext
+
+NON_CACHE_KEY_FIELDS = [
+    "name",
+    "inputs",
+    "outputData",
+    "config",
+    "x",
+    "y",
+    "lastRun",
+    "isDone",
+]
+
+
+def normalize_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Keeps only the parts of a node config that can change its output (UI state, position and previous outputs are removed)."""
+    return {
+        key: value for key, value in config.items() if key not in NON_CACHE_KEY_FIELDS
+    }
+
+
+def resolve_input_values(processor: Processor) -> List[Any]:
+    inputs = processor.get_inputs() or []
+    input_processors = processor.get_input_processors() or []
+    return [
+        [
+            input.get("inputName"),
+            input_processor.get_output(input.get("inputNodeOutputKey")),
+        ]
+        for input, input_processor in zip(inputs, input_processors)
+    ]
+
+
+def build_node_output_cache_key(
+    processor: Processor, context: ProcessorContext = None
+) -> str:
+    """
+    Builds the content hash of everything a deterministic node output depends on:
+    the processor type, its normalized config and the resolved values of its inputs.
+    Keys are scoped to the current user.
+    """
+    processor_type = processor.processor_type
+    payload = {
+        "processorType": getattr(processor_type, "value", processor_type),
+        "config": normalize_config(processor._config),
+        "inputs": resolve_input_values(processor),
+        "userId": context.get_current_user_id() if context is not None else None,
+    }
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
@@ -0,0 +1,47 @@
+import json
+from typing import Any, Optional
+
+from injector import singleton
+
+from .node_output_cache import NodeOutputCache
+from ...env_config import get_node_output_cache_redis_url, get_node_output_cache_ttl
+
+
+@singleton
+class RedisNodeOutputCache(NodeOutputCache):
+    """Node output cache stored in a Redis-compatible server, shared by every worker and every machine.
+
+    Entries expire after a TTL, LRU eviction is delegated to the server `maxmemory-policy` (e.g. allkeys-lru).
+    Any client exposing `get`, `set(..., ex=...)`, `scan_iter` and `delete` can be provided, which allows
+    using a local fake in tests."""
+
+    KEY_PREFIX = "node_output:"
+
+    def __init__(self, client=None, ttl: int = None) -> None:
+        super().__init__()
+        self.ttl = ttl or get_node_output_cache_ttl()
+        if client is None:
+            try:
+                import redis
+            except ImportError:
+                raise RuntimeError(
+                    "NODE_OUTPUT_CACHE_BACKEND=redis requires the 'redis' extra, "
+                    "install the backend with `poetry install --extras redis`"
+                )
+
+            client = redis.Redis.from_url(get_node_output_cache_redis_url())
+        self.client = client
+
+    def _get_entry(self, key: str) -> Optional[Any]:
+        value = self.client.get(self.KEY_PREFIX + key)
+        if value is None:
+            return None
+        return json.loads(value)
+
+    def _set_entry(self, key: str, output: Any) -> None:
+        self.client.set(self.KEY_PREFIX + key, json.dumps(output), ex=self.ttl)
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.KEY_PREFIX + "*"))
+        if keys:
+            self.client.delete(*keys)
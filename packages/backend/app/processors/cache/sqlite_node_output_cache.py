@@ -0,0 +1,79 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Optional
+
+from injector import singleton
+
+from .node_output_cache import NodeOutputCache
+from ...env_config import (
+    get_node_output_cache_max_size,
+    get_node_output_cache_sqlite_path,
+    get_node_output_cache_ttl,
+)
+
+
+@singleton
+class SqliteNodeOutputCache(NodeOutputCache):
+    """On-disk node output cache backed by a sqlite database. Entries survive restarts and are shared
+    by every worker process of the machine.
+
+    Entries expire after a TTL and the least recently used entries are evicted once the cache is full.
+    """
+
+    def __init__(self, path: str = None, max_size: int = None, ttl: int = None):
+        super().__init__()
+        self.path = path or get_node_output_cache_sqlite_path()
+        self.max_size = max_size or get_node_output_cache_max_size()
+        self.ttl = ttl or get_node_output_cache_ttl()
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._connection = sqlite3.connect(
+            self.path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS node_output ("
+            "key TEXT PRIMARY KEY, output TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+
+    def _get_entry(self, key: str) -> Optional[Any]:
+        now = time.time()
+        row = self._connection.execute(
+            "SELECT output FROM node_output WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._connection.execute(
+            "UPDATE node_output SET last_access = ? WHERE key = ?", (now, key)
+        )
+        return json.loads(row[0])
+
+    def _set_entry(self, key: str, output: Any) -> None:
+        now = time.time()
+        self._connection.execute(
+            "INSERT OR REPLACE INTO node_output (key, output, expires_at, last_access) "
+            "VALUES (?, ?, ?, ?)",
+            (key, json.dumps(output), now + self.ttl, now),
+        )
+        self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        self._connection.execute(
+            "DELETE FROM node_output WHERE expires_at <= ?", (now,)
+        )
+        self._connection.execute(
+            "DELETE FROM node_output WHERE key IN ("
+            "SELECT key FROM node_output ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_size,),
+        )
+
+    def clear(self) -> None:
+        self._connection.execute("DELETE FROM node_output")
@@ -3,8 +3,10 @@ from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
 
 
-from .processor_type_name_utils import ProcessorType
-from openai import OpenAI
+from .processor_type_name_utils import ProcessorProvider, ProcessorType
+from ....utils.lazy_import import lazy_import
+
+openai = lazy_import("openai")
 
 
 def interpret_escape_sequences(separator):
@@ -18,6 +20,7 @@ def interpret_escape_sequences(separator):
 
 class AIDataSplitterProcessor(ContextAwareProcessor):
     processor_type = ProcessorType.AI_DATA_SPLITTER
+    provider = ProcessorProvider.OPENAI
     DEFAULT_SEPARATOR = ";"
     AI_MODE = "ai"
     MANUAL_MODE = "manual"
@@ -30,7 +33,7 @@ class AIDataSplitterProcessor(ContextAwareProcessor):
         self.api_key = context.get_value("openai_api_key")
 
     def get_llm_response(self, messages):
-        client = OpenAI(api_key=self.api_key)
+        client = openai.OpenAI(api_key=self.api_key)
 
         kwargs = {"model": self.model, "input": messages}
         response = client.responses.create(**kwargs)
@@ -1,13 +1,16 @@
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
 
-from openai import OpenAI
+from ....utils.lazy_import import lazy_import
 
-from .processor_type_name_utils import ProcessorType
+from .processor_type_name_utils import ProcessorProvider, ProcessorType
+
+openai = lazy_import("openai")
 
 
 class DallEPromptProcessor(ContextAwareProcessor):
     processor_type = ProcessorType.DALLE_PROMPT
+    provider = ProcessorProvider.OPENAI
 
     DEFAULT_MODEL = "dall-e-3"
     DEFAULT_SIZE = "1024x1024"
@@ -28,7 +31,7 @@ class DallEPromptProcessor(ContextAwareProcessor):
             )
 
         api_key = self._processor_context.get_value("openai_api_key")
-        client = OpenAI(
+        client = openai.OpenAI(
             api_key=api_key,
         )
 
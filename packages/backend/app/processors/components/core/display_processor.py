@@ -4,6 +4,7 @@ from ..processor import BasicProcessor
 
 class DisplayProcessor(BasicProcessor):
     processor_type = "display"
+    runs_inline = True
 
     def __init__(self, config):
         super().__init__(config)
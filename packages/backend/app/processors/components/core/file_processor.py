@@ -4,6 +4,7 @@ from ..processor import BasicProcessor
 
 class FileProcessor(BasicProcessor):
     processor_type = ProcessorType.FILE
+    runs_inline = True
 
     def __init__(self, config):
         super().__init__(config)
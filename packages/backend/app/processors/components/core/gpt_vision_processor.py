@@ -1,17 +1,18 @@
 import re
 from typing import Any, List
 
-from ...launcher.event_type import EventType
-from ...launcher.processor_event import ProcessorEvent
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
-from .processor_type_name_utils import ProcessorType
-from openai import OpenAI
+from .processor_type_name_utils import ProcessorProvider, ProcessorType
+from ....utils.lazy_import import lazy_import
 from urllib.parse import urlparse
 
+openai = lazy_import("openai")
+
 
 class GPTVisionProcessor(ContextAwareProcessor):
     processor_type = ProcessorType.GPT_VISION
+    provider = ProcessorProvider.OPENAI
     DEFAULT_MODEL = "gpt-4o"
 
     def __init__(self, config, context: ProcessorContext):
@@ -56,7 +57,7 @@ class GPTVisionProcessor(ContextAwareProcessor):
                 raise ValueError(f"Invalid URL provided. \n {url}")
 
         api_key = self._processor_context.get_value("openai_api_key")
-        client = OpenAI(
+        client = openai.OpenAI(
             api_key=api_key,
         )
         content = []
@@ -88,15 +89,14 @@ class GPTVisionProcessor(ContextAwareProcessor):
             stream=True,
         )
 
-        final_response = ""
+        deltas = []
         for chunk in response:
             if not chunk.choices[0].delta.content:
                 continue
-            final_response += chunk.choices[0].delta.content
-            event = ProcessorEvent(self, final_response)
-            self.notify(EventType.STREAMING, event)
+            deltas.append(chunk.choices[0].delta.content)
+            self.notify_stream_delta(chunk.choices[0].delta.content)
 
-        return final_response
+        return "".join(deltas)
 
     def is_valid_url(self, url):
         try:
@@ -4,6 +4,7 @@ from ..processor import BasicProcessor
 
 class InputImageProcessor(BasicProcessor):
     processor_type = ProcessorType.INPUT_IMAGE
+    runs_inline = True
 
     def __init__(self, config):
         super().__init__(config)
@@ -4,6 +4,7 @@ from ..processor import BasicProcessor
 
 class InputProcessor(BasicProcessor):
     processor_type = ProcessorType.INPUT_TEXT
+    runs_inline = True
 
     def __init__(self, config):
         super().__init__(config)
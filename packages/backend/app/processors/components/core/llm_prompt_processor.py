@@ -2,18 +2,19 @@ import logging
 
 from app.processors.exceptions import LightException
 
-from ...launcher.processor_event import ProcessorEvent
-from ...launcher.event_type import EventType
 from ....llms.utils.max_token_for_model import max_token_for_model, nb_token_for_input
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
-from openai import OpenAI
+from ....utils.lazy_import import lazy_import
 
-from .processor_type_name_utils import ProcessorType
+from .processor_type_name_utils import ProcessorProvider, ProcessorType
+
+openai = lazy_import("openai")
 
 
 class LLMPromptProcessor(ContextAwareProcessor):
     processor_type = ProcessorType.LLM_PROMPT
+    provider = ProcessorProvider.OPENAI
     DEFAULT_MODEL = "gpt-4o"
     streaming = True
     models_with_web_search = [
@@ -29,10 +30,6 @@ class LLMPromptProcessor(ContextAwareProcessor):
         self.model = config.get("model", LLMPromptProcessor.DEFAULT_MODEL)
         self.prompt = config.get("prompt", None)
 
-    def handle_stream_answer(self, awnser):
-        event = ProcessorEvent(self, awnser)
-        self.notify(EventType.STREAMING, event)
-
     def nb_tokens_from_messages(self, messages, model):
         """
         Calculates the total number of tokens in a list of messages using nb_token_for_input.
@@ -99,7 +96,7 @@ class LLMPromptProcessor(ContextAwareProcessor):
                 )
             raise Exception(message)
 
-        client = OpenAI(api_key=api_key)
+        client = openai.OpenAI(api_key=api_key)
 
         kwargs = {"model": self.model, "input": self.messages, "stream": self.streaming}
 
@@ -113,13 +110,13 @@ class LLMPromptProcessor(ContextAwareProcessor):
 
         stream = client.responses.create(**kwargs)
 
-        final_response = ""
-
+        deltas = []
+        final_response = None
         for event in stream:
             type = event.type
             if type == "response.output_text.delta":
-                final_response += event.delta
-                self.handle_stream_answer(final_response)
+                deltas.append(event.delta)
+                self.notify_stream_delta(event.delta)
             if type == "response.completed":
                 response_data = event.response
                 final_response = response_data.output_text
@@ -135,6 +132,8 @@ class LLMPromptProcessor(ContextAwareProcessor):
             if type == "error":
                 raise LightException(f"Error from OpenAI : {event.message}")
 
+        if final_response is None:
+            final_response = "".join(deltas)
         return final_response
 
     def init_context(self, context: str) -> None:
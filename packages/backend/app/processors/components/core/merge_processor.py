@@ -3,6 +3,7 @@ from .processor_type_name_utils import ProcessorType, MergeModeEnum
 
 class MergeProcessor(ContextAwareProcessor):
     processor_type = ProcessorType.MERGER_PROMPT
+    runs_inline = True
 
     def __init__(self, config, context):
         super().__init__(config, context)
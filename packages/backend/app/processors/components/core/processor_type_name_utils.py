@@ -28,3 +28,14 @@ class ProcessorType(Enum):
     STABILITYAI = "stabilityai-generic-processor"
     CLAUDE = "claude-anthropic-processor"
     REPLACE_TEXT = "replace-text"
+
+
+class ProcessorProvider(Enum):
+    OPENAI = "openai"
+    ANTHROPIC = "anthropic"
+    REPLICATE = "replicate"
+    STABILITYAI = "stabilityai"
+    BROWSER = "browser"
+    DEEPSEEK = "deepseek"
+    OPENROUTER = "openrouter"
+    YOUTUBE = "youtube"
@@ -21,15 +21,18 @@ from ....utils.replicate_utils import (
 
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
-import replicate
-from .processor_type_name_utils import ProcessorType
+from ....utils.lazy_import import lazy_import
+from .processor_type_name_utils import ProcessorProvider, ProcessorType
 from ....tasks.task_exception import TaskAlreadyRegisteredError
 from ....tasks.thread_pool_task_manager import add_task, register_task_processor
 from ....tasks.task_utils import wait_for_result
 
+replicate = lazy_import("replicate")
+
 
 class ReplicateProcessor(ContextAwareProcessor):
     processor_type = ProcessorType.REPLICATE
+    provider = ProcessorProvider.REPLICATE
 
     def __init__(self, config, context: ProcessorContext):
         super().__init__(config, context)
@@ -226,6 +229,8 @@ class ReplicateProcessor(ContextAwareProcessor):
         )
 
     def cancel(self):
+        if getattr(self, "prediction", None) is None:
+            return
         api_key = self._processor_context.get_value("replicate_api_key")
         api = replicate.Client(api_token=api_key)
         api.predictions.cancel(id=self.prediction.id)
@@ -8,11 +8,12 @@ import requests
 import os
 
 
-from .processor_type_name_utils import ProcessorType
+from .processor_type_name_utils import ProcessorProvider, ProcessorType
 
 
 class StableDiffusionStabilityAIPromptProcessor(ContextAwareProcessor):
     processor_type = ProcessorType.STABLE_DIFFUSION_STABILITYAI_PROMPT
+    provider = ProcessorProvider.STABILITYAI
 
     def __init__(self, config, context: ProcessorContext):
         super().__init__(config, context)
@@ -2,13 +2,16 @@ import os
 from urllib.parse import urlparse
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
-import replicate
+from ....utils.lazy_import import lazy_import
 
-from .processor_type_name_utils import ProcessorType
+from .processor_type_name_utils import ProcessorProvider, ProcessorType
+
+replicate = lazy_import("replicate")
 
 
 class StableVideoDiffusionReplicaterocessor(ContextAwareProcessor):
     processor_type = ProcessorType.STABLE_VIDEO_DIFFUSION_REPLICATE
+    provider = ProcessorProvider.REPLICATE
 
     stable_video_diffusion_model = "stability-ai/stable-video-diffusion:3f0457e4619daac51203dedb472816fd4af51f3149fa7a9e0b5ffcf1b8172438"
 
@@ -4,6 +4,7 @@ from ..processor import BasicProcessor
 
 class TransitionProcessor(BasicProcessor):
     processor_type = ProcessorType.TRANSITION
+    runs_inline = True
 
     def __init__(self, config):
         super().__init__(config)
@@ -6,7 +6,7 @@ import requests
 from ....utils.processor_utils import is_valid_url
 from ..processor import BasicProcessor
 
-from .processor_type_name_utils import ProcessorType
+from .processor_type_name_utils import ProcessorProvider, ProcessorType
 import logging
 from markdownify import markdownify
 
@@ -15,6 +15,8 @@ class URLInputProcessor(BasicProcessor):
     WAIT_TIMEOUT = 60
     GET_TIMEOUT = 20
     processor_type = ProcessorType.URL_INPUT
+    provider = ProcessorProvider.BROWSER
+    cacheable = True
 
     USER_AGENTS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",
@@ -5,18 +5,17 @@ from ...utils.retry_mixin import RetryMixin
 from ...exceptions import LightException
 
 from ..processor import BasicProcessor
-from youtube_transcript_api import (
-    YouTubeTranscriptApi,
-    TranscriptsDisabled,
-    NoTranscriptFound,
-    VideoUnavailable,
-)
+from ....utils.lazy_import import lazy_import
 
-from .processor_type_name_utils import ProcessorType
+from .processor_type_name_utils import ProcessorProvider, ProcessorType
+
+youtube_transcript_api = lazy_import("youtube_transcript_api")
 
 
 class YoutubeTranscriptInputProcessor(BasicProcessor, RetryMixin):
     processor_type = ProcessorType.YOUTUBE_TRANSCRIPT_INPUT
+    provider = ProcessorProvider.YOUTUBE
+    cacheable = True
 
     def __init__(self, config):
         super().__init__(config)
@@ -37,14 +36,17 @@ class YoutubeTranscriptInputProcessor(BasicProcessor, RetryMixin):
         try:
             transcript_data = self.get_transcript(video_id)
 
-        except (TranscriptsDisabled, NoTranscriptFound) as e:
+        except (
+            youtube_transcript_api.TranscriptsDisabled,
+            youtube_transcript_api.NoTranscriptFound,
+        ) as e:
             logging.warning(
                 f"Transcript not available or disabled for video {self.url}"
             )
             logging.debug(e)
             raise Exception(f"No transcription found for {self.url}")
 
-        except VideoUnavailable as e:
+        except youtube_transcript_api.VideoUnavailable as e:
             logging.warning(f"Video is unavailable")
             logging.debug(e)
             raise Exception(f"Video is unavailable for {self.url}")
@@ -65,11 +67,11 @@ class YoutubeTranscriptInputProcessor(BasicProcessor, RetryMixin):
         """Attempts to get the transcript in the requested language or translate if not available."""
         try:
             # Try to get the transcript in the requested language
-            return YouTubeTranscriptApi.get_transcript(
+            return youtube_transcript_api.YouTubeTranscriptApi.get_transcript(
                 video_id, languages=[self.language]
             )
 
-        except NoTranscriptFound:
+        except youtube_transcript_api.NoTranscriptFound:
             # If transcript in the requested language is not found, try to find a translatable one
             return self.get_translatable_transcript(video_id)
 
@@ -77,7 +79,7 @@ class YoutubeTranscriptInputProcessor(BasicProcessor, RetryMixin):
             logging.debug(f"Failed to retrieve transcript with first proxy")
             logging.debug(e)
             # Retry with a new proxy
-            return YouTubeTranscriptApi.get_transcript(
+            return youtube_transcript_api.YouTubeTranscriptApi.get_transcript(
                 video_id, languages=[self.language]
             )
 
@@ -85,7 +87,9 @@ class YoutubeTranscriptInputProcessor(BasicProcessor, RetryMixin):
         """Finds a translatable transcript and translates it to the requested language."""
         try:
             # List all transcripts for the video
-            transcripts = YouTubeTranscriptApi.list_transcripts(video_id)
+            transcripts = youtube_transcript_api.YouTubeTranscriptApi.list_transcripts(
+                video_id
+            )
 
             # Find an auto-generated, translatable transcript
             for transcript in transcripts:
@@ -93,7 +97,7 @@ class YoutubeTranscriptInputProcessor(BasicProcessor, RetryMixin):
                     return transcript.translate(self.language).fetch()
 
             # Raise an exception if no translatable transcript is found
-            raise NoTranscriptFound(
+            raise youtube_transcript_api.NoTranscriptFound(
                 f"No translatable transcript available for video {video_id}"
             )
 
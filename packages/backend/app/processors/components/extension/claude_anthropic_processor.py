@@ -1,17 +1,20 @@
 import logging
 from datetime import datetime
 
-import anthropic
+from ....utils.lazy_import import lazy_import
 
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option, Condition, ConditionGroup
 from .extension_processor import ContextAwareExtensionProcessor
-from ...launcher.processor_event import ProcessorEvent
-from ...launcher.event_type import EventType
+from ..core.processor_type_name_utils import ProcessorProvider
+from ....utils.processor_utils import is_zero_temperature
+
+anthropic = lazy_import("anthropic")
 
 
 class ClaudeAnthropicProcessor(ContextAwareExtensionProcessor):
     processor_type = "claude-anthropic-processor"
+    provider = ProcessorProvider.ANTHROPIC
 
     model_config_map = {
         "claude-3-7-sonnet-latest": {
@@ -189,9 +192,8 @@ class ClaudeAnthropicProcessor(ContextAwareExtensionProcessor):
 
         return config
 
-    def handle_stream_awnser(self, awnser):
-        event = ProcessorEvent(self, awnser)
-        self.notify(EventType.STREAMING, event)
+    def is_output_cacheable(self):
+        return is_zero_temperature(self.get_input_by_name("temperature", 1))
 
     def process(self):
         """
@@ -230,7 +232,7 @@ class ClaudeAnthropicProcessor(ContextAwareExtensionProcessor):
 
         client = anthropic.Anthropic(api_key=api_key)
 
-        awnser = ""
+        deltas = []
 
         if prompt_context is not None:
             messages = [
@@ -265,8 +267,8 @@ class ClaudeAnthropicProcessor(ContextAwareExtensionProcessor):
                         if event.delta.type == "thinking_delta":
                             self.reasoning_content += event.delta.thinking
                         elif event.delta.type == "text_delta":
-                            awnser += event.delta.text
-                            self.handle_stream_awnser(awnser)
+                            deltas.append(event.delta.text)
+                            self.notify_stream_delta(event.delta.text)
                     elif event.type == "message_stop":
                         break
             except Exception as e:
@@ -275,7 +277,7 @@ class ClaudeAnthropicProcessor(ContextAwareExtensionProcessor):
             finally:
                 stream.close()
 
-        return awnser
+        return "".join(deltas)
 
     def cancel(self):
         pass
@@ -1,13 +1,15 @@
-from ...launcher.event_type import EventType
-from ...launcher.processor_event import ProcessorEvent
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option
 from .extension_processor import ContextAwareExtensionProcessor
-from openai import OpenAI
+from ..core.processor_type_name_utils import ProcessorProvider
+from ....utils.lazy_import import lazy_import
+
+openai = lazy_import("openai")
 
 
 class DeepSeekProcessor(ContextAwareExtensionProcessor):
     processor_type = "deepseek-processor"
+    provider = ProcessorProvider.DEEPSEEK
     streaming = True
 
     def __init__(self, config, context: ProcessorContext):
@@ -81,7 +83,7 @@ class DeepSeekProcessor(ContextAwareExtensionProcessor):
         if api_key is None:
             raise Exception("No DeepSeek API key found")
 
-        client = OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
+        client = openai.OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
 
         response = client.chat.completions.create(
             model=model,
@@ -95,7 +97,7 @@ class DeepSeekProcessor(ContextAwareExtensionProcessor):
         )
 
         if self.streaming:
-            final_response = ""
+            deltas = []
             for chunk in response:
                 r_content = getattr(chunk.choices[0].delta, "reasoning_content", None)
                 if r_content is not None:
@@ -103,11 +105,10 @@ class DeepSeekProcessor(ContextAwareExtensionProcessor):
 
                 if not chunk.choices[0].delta.content:
                     continue
-                final_response += chunk.choices[0].delta.content
-                event = ProcessorEvent(self, final_response)
-                self.notify(EventType.STREAMING, event)
+                deltas.append(chunk.choices[0].delta.content)
+                self.notify_stream_delta(chunk.choices[0].delta.content)
 
-            return final_response
+            return "".join(deltas)
 
         return response.choices[0].message.content
 
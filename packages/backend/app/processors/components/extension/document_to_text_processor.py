@@ -16,28 +16,24 @@ from ....utils.processor_utils import (
 from ....tasks.task_utils import wait_for_result
 from ..model import NodeConfig
 from .extension_processor import BasicExtensionProcessor
-from langchain.document_loaders import (
-    UnstructuredPDFLoader,
-    UnstructuredHTMLLoader,
-    CSVLoader,
-    JSONLoader,
-    TextLoader,
-    PyMuPDFLoader,
-)
+from ....utils.lazy_import import lazy_import
+
+document_loaders = lazy_import("langchain.document_loaders")
 
 
 class DocumentToText(BasicExtensionProcessor):
     processor_type = "document-to-text-processor"
+    cacheable = True
     WAIT_TIMEOUT = 60
 
     def __init__(self, config):
         super().__init__(config)
         self.loaders = {
-            "application/pdf": PyMuPDFLoader,
-            "text/plain": TextLoader,
-            "text/csv": CSVLoader,
-            "text/html": UnstructuredHTMLLoader,
-            "application/json": JSONLoader,
+            "application/pdf": document_loaders.PyMuPDFLoader,
+            "text/plain": document_loaders.TextLoader,
+            "text/csv": document_loaders.CSVLoader,
+            "text/html": document_loaders.UnstructuredHTMLLoader,
+            "application/json": document_loaders.JSONLoader,
         }
         self.accepted_mime_types = self.loaders.keys()
 
@@ -12,6 +12,7 @@ class GenerateNumberProcessor(
     ContextAwareExtensionProcessor, DynamicExtensionProcessor
 ):
     processor_type = "generate-number-processor"
+    runs_inline = True
 
     def __init__(self, config, context: ProcessorContext):
         super().__init__(config, context)
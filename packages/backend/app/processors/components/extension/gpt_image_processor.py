@@ -7,7 +7,7 @@ from io import BytesIO
 from urllib.parse import unquote, urlparse
 
 import requests
-from openai import OpenAI
+from ....utils.lazy_import import lazy_import
 
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option
@@ -16,10 +16,14 @@ from .extension_processor import (
     ContextAwareExtensionProcessor,
     DynamicExtensionProcessor,
 )
+from ..core.processor_type_name_utils import ProcessorProvider
+
+openai = lazy_import("openai")
 
 
 class GPTImageProcessor(ContextAwareExtensionProcessor, DynamicExtensionProcessor):
     processor_type = "gpt-image-processor"
+    provider = ProcessorProvider.OPENAI
 
     # our two modes
     methods = ["generate", "edit"]
@@ -221,7 +225,7 @@ class GPTImageProcessor(ContextAwareExtensionProcessor, DynamicExtensionProcesso
         api_key = self._processor_context.get_value("openai_api_key")
         if api_key is None:
             raise Exception("No OpenAI API key found")
-        client = OpenAI(api_key=api_key)
+        client = openai.OpenAI(api_key=api_key)
 
         if self.method == "edit":
             # gather all image_* fields just like before
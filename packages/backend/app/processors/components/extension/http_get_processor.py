@@ -6,10 +6,12 @@ from urllib.parse import urlparse
 from ..node_config_builder import FieldBuilder, NodeConfigBuilder
 from ...context.processor_context import ProcessorContext
 from .extension_processor import ContextAwareExtensionProcessor
+from ..core.processor_type_name_utils import ProcessorProvider
 
 
 class HttpGetProcessor(ContextAwareExtensionProcessor):
     processor_type = "http-get-processor"
+    provider = ProcessorProvider.BROWSER
     max_timeout = 5  # Maximum timeout in seconds
     max_response_size_in_mb = 2
     max_response_size = (
@@ -2,15 +2,16 @@ import logging
 
 from ....env_config import is_local_environment
 
-from ...launcher.event_type import EventType
-from ...launcher.processor_event import ProcessorEvent
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option, Condition
 from .extension_processor import ContextAwareExtensionProcessor
-from openai import OpenAI
+from ..core.processor_type_name_utils import ProcessorProvider
+from ....utils.lazy_import import lazy_import
 import requests
 from cachetools import TTLCache, cached
 
+openai = lazy_import("openai")
+
 
 def load_models_from_file():
     import json
@@ -68,6 +69,7 @@ def get_text_to_image_model_ids():
 
 class OpenRouterProcessor(ContextAwareExtensionProcessor):
     processor_type = "openrouter-processor"
+    provider = ProcessorProvider.OPENROUTER
     streaming = True
 
     def __init__(self, config, context: ProcessorContext):
@@ -157,7 +159,7 @@ class OpenRouterProcessor(ContextAwareExtensionProcessor):
         if api_key is None:
             raise Exception("No OpenRouter API key found")
 
-        client = OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key)
+        client = openai.OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key)
 
         text_image_model_ids = get_text_to_image_model_ids()
 
@@ -179,15 +181,14 @@ class OpenRouterProcessor(ContextAwareExtensionProcessor):
         )
 
         if self.streaming:
-            final_response = ""
+            deltas = []
             for chunk in response:
                 if not chunk.choices[0].delta.content:
                     continue
-                final_response += chunk.choices[0].delta.content
-                event = ProcessorEvent(self, final_response)
-                self.notify(EventType.STREAMING, event)
+                deltas.append(chunk.choices[0].delta.content)
+                self.notify_stream_delta(chunk.choices[0].delta.content)
 
-            return final_response
+            return "".join(deltas)
 
         return response.choices[0].message.content
 
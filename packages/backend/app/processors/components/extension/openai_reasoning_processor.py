@@ -1,16 +1,18 @@
 import logging
 
 from app.processors.exceptions import LightException
-from ...launcher.event_type import EventType
-from ...launcher.processor_event import ProcessorEvent
 from ...context.processor_context import ProcessorContext
 from ..model import Field, FieldCondition, NodeConfig, Option
 from .extension_processor import ContextAwareExtensionProcessor
-from openai import OpenAI
+from ..core.processor_type_name_utils import ProcessorProvider
+from ....utils.lazy_import import lazy_import
+
+openai = lazy_import("openai")
 
 
 class OpenAIReasoningProcessor(ContextAwareExtensionProcessor):
     processor_type = "openai-reasoning-processor"
+    provider = ProcessorProvider.OPENAI
     streaming = True
     models_with_reasoning_effort = ["o3-mini", "o4-mini", "o3"]
 
@@ -116,10 +118,6 @@ class OpenAIReasoningProcessor(ContextAwareExtensionProcessor):
 
         return config
 
-    def handle_stream_answer(self, awnser):
-        event = ProcessorEvent(self, awnser)
-        self.notify(EventType.STREAMING, event)
-
     def process(self):
         prompt = self.get_input_by_name("prompt")
         context = self.get_input_by_name("context", "")
@@ -134,7 +132,7 @@ class OpenAIReasoningProcessor(ContextAwareExtensionProcessor):
         if api_key is None:
             raise Exception("No OpenAI API key found")
 
-        client = OpenAI(api_key=api_key)
+        client = openai.OpenAI(api_key=api_key)
 
         kwargs = {
             "model": model,
@@ -146,12 +144,13 @@ class OpenAIReasoningProcessor(ContextAwareExtensionProcessor):
             kwargs["reasoning"] = {"effort": reasoning_effort}
 
         stream = client.responses.create(**kwargs)
-        final_response = ""
+        deltas = []
+        final_response = None
         for event in stream:
             type = event.type
             if type == "response.output_text.delta":
-                final_response += event.delta
-                self.handle_stream_answer(final_response)
+                deltas.append(event.delta)
+                self.notify_stream_delta(event.delta)
             if type == "response.completed":
                 response_data = event.response
                 final_response = response_data.output_text
@@ -167,6 +166,8 @@ class OpenAIReasoningProcessor(ContextAwareExtensionProcessor):
             if type == "error":
                 raise LightException(f"Error from OpenAI : {event.message}")
 
+        if final_response is None:
+            final_response = "".join(deltas)
         return final_response
 
     def cancel(self):
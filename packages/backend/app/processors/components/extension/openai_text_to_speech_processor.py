@@ -3,15 +3,19 @@ import re
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option, Condition
 from .extension_processor import ContextAwareExtensionProcessor
-from openai import OpenAI
+from ..core.processor_type_name_utils import ProcessorProvider
+from ....utils.lazy_import import lazy_import
 from datetime import datetime
 import io
-from pydub import AudioSegment
 import eventlet
 
+openai = lazy_import("openai")
+pydub = lazy_import("pydub")
+
 
 class OpenAITextToSpeechProcessor(ContextAwareExtensionProcessor):
     processor_type = "openai-text-to-speech-processor"
+    provider = ProcessorProvider.OPENAI
 
     def __init__(self, config, context: ProcessorContext):
         super().__init__(config, context)
@@ -207,7 +211,7 @@ class OpenAITextToSpeechProcessor(ContextAwareExtensionProcessor):
         if api_key is None:
             raise Exception("No OpenAI API key found")
 
-        client = OpenAI(api_key=api_key)
+        client = openai.OpenAI(api_key=api_key)
 
         # Split text into chunks that are each less than or equal to 4096 characters.
         chunks = OpenAITextToSpeechProcessor.split_text_into_chunks(text, 4096)
@@ -227,7 +231,9 @@ class OpenAITextToSpeechProcessor(ContextAwareExtensionProcessor):
             if response is None:
                 return None
             # Convert the response content (mp3 bytes) into an AudioSegment.
-            return AudioSegment.from_file(io.BytesIO(response.content), format="mp3")
+            return pydub.AudioSegment.from_file(
+                io.BytesIO(response.content), format="mp3"
+            )
 
         # Process chunks concurrently; imap preserves the order of chunks.
         audio_segments = list(pool.imap(create_audio_segment, chunks))
@@ -8,6 +8,7 @@ from ..core.processor_type_name_utils import ProcessorType
 
 class ReplaceTextProcessor(BasicExtensionProcessor):
     processor_type = ProcessorType.REPLACE_TEXT
+    runs_inline = True
 
     def __init__(self, config):
         super().__init__(config)
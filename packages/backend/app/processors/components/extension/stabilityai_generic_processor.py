@@ -20,6 +20,7 @@ from .extension_processor import (
     ContextAwareExtensionProcessor,
     DynamicExtensionProcessor,
 )
+from ..core.processor_type_name_utils import ProcessorProvider
 from datetime import datetime
 import re
 
@@ -28,6 +29,7 @@ class StabilityAIGenericProcessor(
     ContextAwareExtensionProcessor, DynamicExtensionProcessor
 ):
     processor_type = "stabilityai-generic-processor"
+    provider = ProcessorProvider.STABILITYAI
     openapi_file_path = "./resources/openapi/stabilityai.json"
     paths_denied = [
         re.compile(r"/v1/"),  # Contains'/v1/'
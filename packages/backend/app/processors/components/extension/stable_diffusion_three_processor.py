@@ -6,11 +6,13 @@ from ..node_config_builder import FieldBuilder, NodeConfigBuilder
 from ...context.processor_context import ProcessorContext
 from ..model import Option
 from .extension_processor import ContextAwareExtensionProcessor
+from ..core.processor_type_name_utils import ProcessorProvider
 from datetime import datetime
 
 
 class StableDiffusionThreeProcessor(ContextAwareExtensionProcessor):
     processor_type = "stabilityai-stable-diffusion-3-processor"
+    provider = ProcessorProvider.STABILITYAI
 
     def __init__(self, config, context: ProcessorContext):
         super().__init__(config, context)
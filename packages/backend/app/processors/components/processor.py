@@ -1,14 +1,14 @@
 from abc import ABC, abstractmethod
 import json
 import logging
-from typing import Any, List, Optional, TypedDict, Union, Dict
+from typing import Any, List, Optional, Tuple, TypedDict, Union, Dict
 
 from ..launcher.processor_event import ProcessorEvent
 from ..launcher.event_type import EventType
 
 from ..observer.observer import Observer
 
-from .core.processor_type_name_utils import ProcessorType
+from .core.processor_type_name_utils import ProcessorProvider, ProcessorType
 
 from ...storage.storage_strategy import StorageStrategy
 
@@ -29,11 +29,30 @@ class InputItem(TypedDict, total=False):
     inputNodeOutputKey: int
 
 
+class InputEdge:
+    """A linked input of a processor: the processor producing it and the index of the output used."""
+
+    __slots__ = ("processor", "output_key")
+
+    def __init__(self, processor: "Processor", output_key: Optional[int]) -> None:
+        self.processor = processor
+        self.output_key = output_key
+
+
 class Processor(ABC):
     processor_type: Optional["ProcessorType"] = None
     """The type of the processor"""
 
-    observers: List[Observer] = []
+    provider: Optional["ProcessorProvider"] = None
+    """The external provider called by the processor, used to apply per-provider concurrency limits"""
+
+    runs_inline: bool = False
+    """Flag indicating the processor only does cheap local work and can run outside of the launcher's green thread pool"""
+
+    cacheable: bool = False
+    """Flag indicating the processor output only depends on its config and inputs, allowing the launcher to reuse it across runs"""
+
+    observers: Tuple[Observer, ...] = ()
     """The observers of the processor"""
 
     storage_strategy: Optional["StorageStrategy"]
@@ -54,6 +73,15 @@ class Processor(ABC):
     input_processors: List["Processor"]
     """The processors set as inputs"""
 
+    _inputs_by_name: Dict[str, InputEdge]
+    """The linked input of each input name, indexed when the processors are linked"""
+
+    _resolved_inputs: Dict[Tuple[str, bool], Tuple[Any, Any]]
+    """The last resolved value of each input, along with the upstream output it was resolved from"""
+
+    _stream_sequence: int
+    """The sequence number of the last streamed delta"""
+
     is_processing: bool
     """Flag indicating if the processor has started working, useful when using API with cold start"""
 
@@ -66,27 +94,37 @@ class Processor(ABC):
     def __init__(self, config: Dict[str, Any]) -> None:
         self.name = config["name"]
         self.processor_type = config["processorType"]
-        self.observers = []
+        self.observers = ()
         self._output = None
         self.inputs = None
         self._processor_context = None
         self.input_processors = []
+        self._inputs_by_name = {}
+        self._resolved_inputs = {}
+        self._stream_sequence = 0
         self.storage_strategy = None
         self.is_finished = False
         self._has_dynamic_behavior = False
         self._config = config
-        if (
-            config.get("config") is not None
-            and config.get("config").get("fields") is not None
-            and config.get("config").get("fields") != []
-        ):
-            self.fields = config.get("config").get("fields")
-            self.fields_names = [field["name"] for field in self.fields]
         if config.get("inputs") is not None and config.get("inputs") != []:
             self.inputs = config.get("inputs")
 
+    @property
+    def fields(self) -> Optional[List[Dict[str, Any]]]:
+        """The fields of the node config, read from the config when needed rather than copied."""
+        node_config = self._config.get("config")
+        if node_config is None or not node_config.get("fields"):
+            return None
+        return node_config.get("fields")
+
+    @property
+    def fields_names(self) -> List[str]:
+        return [field["name"] for field in self.fields or []]
+
     def cleanup(self) -> None:
         self.input_processors = None
+        self._inputs_by_name = {}
+        self._resolved_inputs = {}
         self._processor_context = None
         self._output = None
         self.storage_strategy = None
@@ -106,10 +144,12 @@ class Processor(ABC):
         pass
 
     def add_observer(self, observer):
-        self.observers.append(observer)
+        self.observers = (*self.observers, observer)
 
     def remove_observer(self, observer):
-        self.observers.remove(observer)
+        observers = list(self.observers)
+        observers.remove(observer)
+        self.observers = tuple(observers)
         if len(self.observers) == 0:
             self.observers = None
         return self.observers
@@ -118,6 +158,17 @@ class Processor(ABC):
         for observer in self.observers:
             observer.notify(event, data)
 
+    def notify_stream_delta(self, delta: str) -> None:
+        """
+        Streams a new chunk of the text being generated. Only the chunk is sent, the complete text
+        is sent once with the progress event of the processor.
+        """
+        self._stream_sequence += 1
+        self.notify(
+            EventType.STREAMING_DELTA,
+            ProcessorEvent(self, delta, sequence=self._stream_sequence),
+        )
+
     def get_output(self, input_key=None) -> Optional[str]:
         output = getattr(self, "_output", None)
         if output is not None and isinstance(output, list) and len(output) > 0:
@@ -184,31 +235,33 @@ class Processor(ABC):
     def get_input_by_name(
         self, name: str, default=None, accept_object=False
     ) -> Optional[InputItem]:
-        input = self._config.get(name, default)
-
-        input_processors = self.get_input_processors()
-        input_output_keys = self.get_input_node_output_keys()
-        input_names = self.get_input_names()
-
-        if input_processors:
-            for processor, input_name, key in zip(
-                input_processors, input_names, input_output_keys
-            ):
-                if input_name == name:
-                    input_processor_output = processor.get_output(key)
-                    if (
-                        isinstance(input_processor_output, dict)
-                        or isinstance(input_processor_output, list)
-                        and not accept_object
-                    ):
-                        input_processor_output = json.dumps(input_processor_output)
-                    return input_processor_output
-
-        return input
+        linked_input = self._inputs_by_name.get(name)
+        if linked_input is None:
+            return self._config.get(name, default)
+
+        output = linked_input.processor.get_output(linked_input.output_key)
+        cache_key = (name, accept_object)
+        resolved = self._resolved_inputs.get(cache_key)
+        if resolved is not None and resolved[0] is output:
+            return resolved[1]
+
+        value = output
+        if isinstance(output, dict) or isinstance(output, list) and not accept_object:
+            value = json.dumps(output)
+        self._resolved_inputs[cache_key] = (output, value)
+        return value
 
     def add_input_processor(self, input_processor: "Processor") -> None:
         self.input_processors.append(input_processor)
 
+        position = len(self.input_processors) - 1
+        if self.inputs is not None and position < len(self.inputs):
+            input = self.inputs[position]
+            self._inputs_by_name.setdefault(
+                input.get("inputName"),
+                InputEdge(input_processor, input.get("inputNodeOutputKey")),
+            )
+
     def set_storage_strategy(self, storage_strategy: "StorageStrategy") -> None:
         self.storage_strategy = storage_strategy
 
@@ -224,6 +277,9 @@ class Processor(ABC):
     def has_dynamic_behavior(self) -> bool:
         return self._has_dynamic_behavior
 
+    def is_output_cacheable(self) -> bool:
+        return self.cacheable
+
 
 class BasicProcessor(Processor):
     def __init__(self, config):
@@ -4,6 +4,8 @@ from typing import List
 
 
 class ProcessorContext(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_context(self) -> "ProcessorContext":
         pass
@@ -16,6 +18,12 @@ class ProcessorContext(ABC):
     def get_session_id(self) -> Optional[str]:
         pass
 
+    def get_event_encoding(self) -> Optional[str]:
+        """
+        Encoding of the progress events negotiated by the client, None for the default JSON events.
+        """
+        return None
+
     @abstractmethod
     def get_parameter_names(self) -> List[str]:
         """
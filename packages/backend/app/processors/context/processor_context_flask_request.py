@@ -1,35 +1,73 @@
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import List, Optional
-from ...flask.utils.constants import SESSION_USER_ID_KEY
+from ...flask.utils.constants import SESSION_EVENT_ENCODING_KEY, SESSION_USER_ID_KEY
 from .processor_context import ProcessorContext
 
-from copy import deepcopy
-
 
 class ProcessorContextFlaskRequest(ProcessorContext):
+    """
+    Read-only snapshot of the request state needed by the processors: the `session_*` parameters
+    stored in the Flask global context, the current user ID, the event encoding negotiated by the
+    client and the Socket.IO session ID.
+
+    Only these values are copied, the rest of the request state is never retained. The snapshot
+    is immutable and can be shared by every green thread of a run.
+    """
+
+    __slots__ = ("parameters", "user_id", "event_encoding", "session_id")
+
     parameter_prefix = "session_"
 
     def __init__(self, g_context=None, session_data=None, session_id=None):
-        self.g_context = deepcopy(g_context) if g_context is not None else {}
-        self.session_data = deepcopy(session_data) if session_data is not None else {}
-        self.session_id = deepcopy(session_id) if session_id is not None else None
+        object.__setattr__(
+            self, "parameters", MappingProxyType(self._extract_parameters(g_context))
+        )
+        object.__setattr__(
+            self,
+            "user_id",
+            session_data.get(SESSION_USER_ID_KEY) if session_data is not None else None,
+        )
+        object.__setattr__(
+            self,
+            "event_encoding",
+            (
+                session_data.get(SESSION_EVENT_ENCODING_KEY)
+                if session_data is not None
+                else None
+            ),
+        )
+        object.__setattr__(self, "session_id", session_id)
+
+    @classmethod
+    def _extract_parameters(cls, g_context) -> dict:
+        if g_context is None:
+            return {}
+        values = g_context if isinstance(g_context, Mapping) else vars(g_context)
+        prefix_length = len(cls.parameter_prefix)
+        return {
+            key[prefix_length:]: value
+            for key, value in values.items()
+            if key.startswith(cls.parameter_prefix)
+        }
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def get_context(self) -> "ProcessorContext":
-        """Retrieve the stored Flask global context."""
-        return self.g_context
+        return self
 
-    def get_current_user_id(self) -> str:
-        """Retrieve the current user ID from the stored session data."""
-        return self.session_data.get(SESSION_USER_ID_KEY)
+    def get_current_user_id(self) -> Optional[str]:
+        return self.user_id
 
-    def get_session_id(self) -> str:
+    def get_session_id(self) -> Optional[str]:
         return self.session_id
 
+    def get_event_encoding(self) -> Optional[str]:
+        return self.event_encoding
+
     def get_parameter_names(self) -> List[str]:
-        return [
-            key.replace(self.parameter_prefix, "")
-            for key in dir(self.g_context)
-            if not key.startswith("_") and key not in dir(type(self.g_context))
-        ]
+        return list(self.parameters)
 
     def get_value(self, name) -> Optional[str]:
-        return self.g_context.get(self.parameter_prefix + name)
+        return self.parameters.get(name)
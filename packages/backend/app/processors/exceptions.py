@@ -9,3 +9,10 @@ class LightException(Exception):
         self.langvar_message = langvar_message
         self.langvar_values = langvar_values
         super().__init__(f"{message}")
+
+
+class InvalidFlowException(LightException):
+    """Exception raised when a flow is rejected before launch, e.g. because of a cycle or a missing input node."""
+
+    def __init__(self, message: str):
+        super().__init__(message, "InvalidFlowException")
@@ -1,59 +1,127 @@
-from enum import Enum
-import importlib
 import logging
-import pkgutil
 import inspect
-from ..components.processor import Processor
+import threading
 from .processor_factory import ProcessorFactory
+from .processor_manifest import (
+    PROCESSORS_PACKAGE,
+    get_processor_type_key,
+    import_processor_class,
+    iter_processor_classes,
+    load_processor_manifest,
+)
 from injector import singleton
 
 
+class LazyProcessor:
+    """
+    Processor listed in the manifest, its module is imported the first time the processor is used.
+    """
+
+    def __init__(self, entry, build_constructor):
+        self._entry = entry
+        self._build_constructor = build_constructor
+        self._processor_class = None
+        self._constructor = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self._constructor is None:
+            with self._lock:
+                if self._constructor is None:
+                    logging.debug(
+                        f"Importing processor '{self._entry['class']}' from {self._entry['module']}"
+                    )
+                    self._processor_class = import_processor_class(self._entry)
+                    self._constructor = self._build_constructor(self._processor_class)
+        return self._processor_class, self._constructor
+
+    def create(self, config, context):
+        return self.load()[1](config, context)
+
+
 @singleton
 class ProcessorFactoryIterModules(ProcessorFactory):
+    """
+    Processor factory discovering the processors of `app.processors.components`.
+
+    The registry is built once by `load_processors` and then frozen, so that it can be shared
+    by every launcher of the process. When a processor manifest has been generated, every processor
+    type of the manifest is registered before freezing, and its module is only imported the first
+    time the processor type is used. Otherwise every module is imported and scanned.
+    """
+
     def __init__(self):
         self._processors = {}
+        self._constructors = {}
+        self._lazy_processors = {}
+        self._loaded = False
 
     def register_processor(self, processor_type, processor_class):
+        if self._loaded:
+            raise RuntimeError(
+                f"Cannot register processor type '{processor_type}', the processor registry is frozen"
+            )
+        self._add_processor(processor_type, processor_class)
+
+    def _add_processor(self, processor_type, processor_class):
         self._processors[processor_type] = processor_class
+        self._constructors[processor_type] = self._build_constructor(processor_class)
+
+    @staticmethod
+    def _build_constructor(processor_class):
+        """
+        Inspects the processor constructor once, at registration, and returns a function
+        creating the processor from its config and context.
+        """
+        params = inspect.signature(processor_class.__init__).parameters
+        if params.get("context") is not None:
+            return lambda config, context: processor_class(
+                config=config, context=context
+            )
+        return lambda config, context: processor_class(config=config)
+
+    def get_processor_class(self, processor_type):
+        lazy_processor = self._lazy_processors.get(processor_type)
+        if lazy_processor is not None:
+            return lazy_processor.load()[0]
+        return self._processors.get(processor_type)
 
     def create_processor(self, config, context_data=None, storage_strategy=None):
         processor_type = config["processorType"]
-        processor_class = self._processors.get(processor_type)
-        if not processor_class:
+        constructor = self._constructors.get(processor_type)
+        if not constructor and processor_type in self._lazy_processors:
+            constructor = self._lazy_processors[processor_type].create
+        if not constructor:
             raise ValueError(f"Processor type '{processor_type}' not supported")
 
-        params = inspect.signature(processor_class.__init__).parameters
-        context_param = params.get("context")
-
-        processor = None
-        if context_param is not None:
-            processor = processor_class(config=config, context=context_data)
-        else:
-            processor = processor_class(config=config)
+        processor = constructor(config, context_data)
         processor.set_storage_strategy(storage_strategy)
 
         return processor
 
     def load_processors(self):
-        self._load_recursive("app.processors.components")
+        if self._loaded:
+            return
+
+        manifest = load_processor_manifest()
+        if manifest is not None:
+            self._lazy_processors = {
+                processor_type: LazyProcessor(entry, self._build_constructor)
+                for processor_type, entry in manifest["processors"].items()
+                if processor_type not in self._processors
+            }
+            logging.info(
+                f"Processor registry loaded from manifest: {len(self._lazy_processors)} processors"
+            )
+        else:
+            self._load_recursive(PROCESSORS_PACKAGE)
+            logging.info(
+                f"Processor registry loaded by scanning: {len(self._processors)} processors"
+            )
+        self._loaded = True
 
     def _load_recursive(self, package_name):
-        package = importlib.import_module(package_name)
-        prefix = package.__name__ + "."
-        for importer, module_name, is_pkg in pkgutil.iter_modules(
-            package.__path__, prefix
-        ):
-            if is_pkg:
-                self._load_recursive(module_name)
-            else:
-                module = __import__(module_name, fromlist="dummy")
-                for attribute_name in dir(module):
-                    attribute = getattr(module, attribute_name)
-                    if isinstance(attribute, type) and issubclass(attribute, Processor):
-                        if attribute.processor_type is not None:
-                            processor_type_key = (
-                                attribute.processor_type.value
-                                if isinstance(attribute.processor_type, Enum)
-                                else attribute.processor_type
-                            )
-                            self.register_processor(processor_type_key, attribute)
+        for processor_class in iter_processor_classes(package_name):
+            self._add_processor(
+                get_processor_type_key(processor_class), processor_class
+            )
@@ -0,0 +1,140 @@
+"""
+Processor registry manifest.
+
+The manifest maps every processor type to the module and class implementing it, so that the
+processor modules can be imported lazily, on first use, instead of importing and scanning every
+module of `app.processors.components` at startup.
+
+It is generated at build time:
+    python -m app.processors.factory.processor_manifest
+
+When no manifest has been generated (e.g. in development), or when a processor module was modified
+after the manifest was generated, the processors are discovered by scanning.
+"""
+
+from enum import Enum
+import importlib
+import json
+import logging
+import os
+import pkgutil
+from typing import Any, Dict, Iterator, Optional
+
+from ..components.processor import Processor
+from ..components.extension.extension_processor import (
+    DynamicExtensionProcessor,
+    ExtensionProcessor,
+)
+from ...env_config import get_processor_registry_mode
+
+PROCESSORS_PACKAGE = "app.processors.components"
+PROCESSORS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "components")
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "processor_manifest.json")
+
+
+def get_processor_type_key(processor_class) -> Optional[str]:
+    processor_type = processor_class.processor_type
+    return processor_type.value if isinstance(processor_type, Enum) else processor_type
+
+
+def iter_processor_classes(package_name: str = PROCESSORS_PACKAGE) -> Iterator[type]:
+    """
+    Imports every module of the given package, recursively, and yields the processor classes
+    declaring a processor type.
+    """
+    package = importlib.import_module(package_name)
+    prefix = package.__name__ + "."
+    for importer, module_name, is_pkg in pkgutil.iter_modules(package.__path__, prefix):
+        if is_pkg:
+            yield from iter_processor_classes(module_name)
+        else:
+            module = __import__(module_name, fromlist="dummy")
+            for attribute_name in dir(module):
+                attribute = getattr(module, attribute_name)
+                # type() rather than isinstance(), which would load lazily imported SDK modules
+                if issubclass(type(attribute), type) and issubclass(
+                    attribute, Processor
+                ):
+                    if attribute.processor_type is not None:
+                        yield attribute
+
+
+def build_processor_manifest() -> Dict[str, Any]:
+    processors = {}
+    for processor_class in iter_processor_classes():
+        processors[get_processor_type_key(processor_class)] = {
+            "module": processor_class.__module__,
+            "class": processor_class.__name__,
+            "extension": issubclass(processor_class, ExtensionProcessor),
+            "dynamic": issubclass(processor_class, DynamicExtensionProcessor),
+        }
+
+    return {
+        "processors": dict(
+            sorted(
+                processors.items(),
+                key=lambda item: (item[1]["module"], item[1]["class"]),
+            )
+        )
+    }
+
+
+def write_processor_manifest(path: str = MANIFEST_PATH) -> Dict[str, Any]:
+    manifest = build_processor_manifest()
+    with open(path, "w") as file:
+        json.dump(manifest, file, indent=2)
+    return manifest
+
+
+def is_processor_manifest_stale(
+    path: str = MANIFEST_PATH, processors_dir: str = PROCESSORS_DIR
+) -> bool:
+    """
+    Whether a processor module was added, removed or modified after the manifest was generated.
+    """
+    manifest_mtime = os.path.getmtime(path)
+    for root, dirs, files in os.walk(processors_dir):
+        if os.path.getmtime(root) > manifest_mtime:
+            return True
+        for file_name in files:
+            if file_name.endswith(".py") and (
+                os.path.getmtime(os.path.join(root, file_name)) > manifest_mtime
+            ):
+                return True
+    return False
+
+
+def load_processor_manifest(path: str = MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Returns the generated manifest, or None when the processors have to be discovered by scanning:
+    PROCESSOR_REGISTRY_MODE is "scan", or it is "auto" and no up-to-date manifest has been generated.
+    """
+    mode = get_processor_registry_mode()
+    if mode == "scan":
+        return None
+
+    if not os.path.exists(path):
+        if mode == "manifest":
+            logging.error(
+                f"Processor manifest {path} not found, falling back to module scanning"
+            )
+        return None
+
+    if mode == "auto" and is_processor_manifest_stale(path):
+        logging.info(
+            f"Processor manifest {path} is older than the processor modules, falling back to module scanning"
+        )
+        return None
+
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def import_processor_class(entry: Dict[str, Any]) -> type:
+    module = importlib.import_module(entry["module"])
+    return getattr(module, entry["class"])
+
+
+if __name__ == "__main__":
+    manifest = write_processor_manifest()
+    print(f"Wrote {len(manifest['processors'])} processors to {MANIFEST_PATH}")
@@ -1,18 +1,26 @@
 from abc import abstractmethod
 import json
 import logging
-from typing import List
+from typing import List, Optional
 from injector import inject
 from .processor_launcher import ProcessorLauncher
 from .event_type import EventType
 from .processor_launcher_event import ProcessorLauncherEvent
+from .concurrency_limits import ConcurrencyLimits
+from .execution_mode import ExecutionMode
+from .scheduling_policy import SchedulingPolicy
+from .flow_graph import FlowGraph
+from .flow_validation import validate_flow_graph
 
 from ..context.processor_context import ProcessorContext
 
 from ..observer.observer import Observer
 
 from ...storage.storage_strategy import StorageStrategy
+from ...env_config import is_node_output_cache_enabled
 from ..factory.processor_factory import ProcessorFactory
+from ..cache.node_output_cache import NodeOutputCache
+from ..cache.node_output_cache_key import build_node_output_cache_key
 
 
 class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
@@ -20,12 +28,20 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
     Basic Processor Launcher emiting event through flask_socketio websockets
 
     A class that launches processors based on configuration data.
+    A launcher is created for each run, the processor factory it receives is expected to be
+    loaded already and is shared by every launcher of the process.
     """
 
     processor_factory: ProcessorFactory
     storage_strategy: StorageStrategy
     observers: List[Observer]
+    node_output_cache: NodeOutputCache
+    scheduling_policy: SchedulingPolicy
     context: ProcessorContext
+    concurrency_limits: ConcurrencyLimits
+    execution_mode: ExecutionMode
+    flow_graph: Optional[FlowGraph]
+    run_report: Optional[dict]
 
     @inject
     def __init__(
@@ -33,16 +49,36 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
         processor_factory: ProcessorFactory,
         storage_strategy: StorageStrategy,
         observers: List[Observer] = None,
+        node_output_cache: NodeOutputCache = None,
+        scheduling_policy: SchedulingPolicy = None,
     ) -> None:
         self.processor_factory = processor_factory
         self.storage_strategy = storage_strategy
-        self.processor_factory.load_processors()
         self.observers = observers or []
+        self.node_output_cache = node_output_cache
+        self.scheduling_policy = scheduling_policy
         self.context = None
+        self.concurrency_limits = ConcurrencyLimits.from_env()
+        self.execution_mode = ExecutionMode.from_value(None)
+        self.flow_graph = None
+        self.scheduler = None
+        self.run_report = None
 
     def set_context(self, context: ProcessorContext):
         self.context = context
 
+    def set_concurrency_limits(self, concurrency_limits: ConcurrencyLimits):
+        self.concurrency_limits = concurrency_limits
+
+    def set_execution_mode(self, execution_mode: ExecutionMode):
+        self.execution_mode = execution_mode
+
+    def get_run_report(self) -> Optional[dict]:
+        return self.run_report
+
+    def cancel(self):
+        pass
+
     def add_observer(self, observer):
         self.observers.append(observer)
 
@@ -65,7 +101,16 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
                         )
                     processor.add_input_processor(input_processor)
 
+    def get_flow_graph(self, config_data) -> FlowGraph:
+        """
+        Returns the graph index of the given configuration data, built only once per configuration.
+        """
+        if self.flow_graph is None or self.flow_graph.config_data is not config_data:
+            self.flow_graph = FlowGraph(config_data)
+        return self.flow_graph
+
     def load_processors(self, config_data):
+        validate_flow_graph(self.get_flow_graph(config_data))
         processors = {
             config["name"]: self.processor_factory.create_processor(
                 config, self.context, self.storage_strategy
@@ -87,16 +132,35 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
         Returns:
             The node with the given name if found, otherwise None.
         """
-        for node in config_data:
-            if node.get("name") == node_name:
-                return node
-        return None
+        return self.get_flow_graph(config_data).get_node(node_name)
+
+    def get_output_cache_key(self, processor) -> Optional[str]:
+        """
+        Returns the key under which the processor output can be cached, or None when
+        caching is disabled or the processor output is not deterministic.
+        """
+        if (
+            self.node_output_cache is None
+            or not is_node_output_cache_enabled()
+            or not processor.is_output_cacheable()
+        ):
+            return None
+        return build_node_output_cache_key(processor, self.context)
+
+    def get_cached_output(self, cache_key: Optional[str]):
+        if cache_key is None:
+            return None
+        return self.node_output_cache.get(cache_key)
+
+    def cache_output(self, cache_key: Optional[str], output) -> None:
+        if cache_key is None:
+            return
+        self.node_output_cache.set(cache_key, output)
 
     def notify_error(self, processor, e):
         error_event_data = ProcessorLauncherEvent(
             instance_name=processor.name,
             user_id=self.context.get_current_user_id(),
-            processor=processor,
             error=e,
             session_id=self.context.get_session_id(),
             processor_type=processor.processor_type,
@@ -108,23 +172,35 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
             instance_name=processor.name,
             user_id=self.context.get_current_user_id(),
             output=output,
-            processor=processor,
             isDone=isDone,
             processor_type=processor.processor_type,
             session_id=self.context.get_session_id(),
+            event_encoding=self.context.get_event_encoding(),
             duration=duration,
         )
         self.notify_observers(EventType.STREAMING.value, streaming_event_data)
 
+    def notify_stream_delta(self, processor, delta, sequence):
+        stream_delta_event_data = ProcessorLauncherEvent(
+            instance_name=processor.name,
+            user_id=self.context.get_current_user_id(),
+            output=delta,
+            processor_type=processor.processor_type,
+            session_id=self.context.get_session_id(),
+            event_encoding=self.context.get_event_encoding(),
+            sequence=sequence,
+        )
+        self.notify_observers(EventType.STREAMING_DELTA.value, stream_delta_event_data)
+
     def notify_progress(self, processor, output, isDone=False, duration=0):
         progress_event_data = ProcessorLauncherEvent(
             instance_name=processor.name,
             user_id=self.context.get_current_user_id(),
             output=output,
-            processor=processor,
             isDone=isDone,
             processor_type=processor.processor_type,
             session_id=self.context.get_session_id(),
+            event_encoding=self.context.get_event_encoding(),
             duration=duration,
         )
         self.notify_observers(EventType.PROGRESS.value, progress_event_data)
@@ -133,7 +209,6 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
         current_node_running_event_data = ProcessorLauncherEvent(
             instance_name=processor.name,
             user_id=self.context.get_current_user_id(),
-            processor=processor,
             session_id=self.context.get_session_id(),
             processor_type=processor.processor_type,
         )
@@ -160,6 +235,9 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
             - Stores each processor instance in a dictionary with its name as the key.
         """
         processors = {}
+        graph = self.get_flow_graph(config_data)
+        validate_flow_graph(graph, [node_name] + graph.get_ancestors(node_name))
+
         node = self.get_node_by_name(config_data, node_name)
         if node and not node.get("inputs"):
             processor = self.processor_factory.create_processor(
@@ -168,10 +246,7 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
             processors[node["name"]] = processor
             logging.debug(f"Created single processor for node - {node_name}")
         else:
-            related_config_data = self.get_related_config_data(
-                config_data, node_name, []
-            )
-            related_config_data.reverse()
+            related_config_data = self.get_related_config_data(config_data, node_name)
             for config in related_config_data:
                 config_output = config.get("outputData", None)
                 if config_output is None or config["name"] == node_name:
@@ -189,28 +264,11 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
                     processors[config["name"]] = processor
         return processors
 
-    def get_related_config_data(self, config_data, node_name, visited):
-        if node_name in visited:
-            return []
-        visited.append(node_name)
-
-        current_config = next(
-            (config for config in config_data if config["name"] == node_name), None
-        )
-
-        if not current_config:
-            return []
-
-        related_configs = [current_config]
-
-        for input in current_config.get("inputs", []):
-            related_configs.extend(
-                self.get_related_config_data(
-                    config_data, input.get("inputNode"), visited
-                )
-            )
-
-        return related_configs
+    def get_related_config_data(self, config_data, node_name):
+        """
+        Retrieves the configuration of the given node and of every node it depends on, parents first.
+        """
+        return self.get_flow_graph(config_data).get_subgraph_config_data(node_name)
 
     def load_processors_for_node(self, config_data, node_name):
         processors = self.load_required_processors(config_data, node_name)
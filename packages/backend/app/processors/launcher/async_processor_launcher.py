@@ -1,8 +1,5 @@
-import gc
-import threading
+from functools import partial
 import time
-import eventlet
-from eventlet.semaphore import Semaphore
 import logging
 import traceback
 
@@ -16,6 +13,8 @@ from .event_type import EventType
 from ..observer.observer import Observer
 
 from ..components.processor import Processor
+from .concurrency_limits import get_provider_name
+from .dag_scheduler import DagScheduler
 from .abstract_topological_processor_launcher import (
     AbstractTopologicalProcessorLauncher,
 )
@@ -30,8 +29,6 @@ class AsyncProcessorLauncher(AbstractTopologicalProcessorLauncher, Observer):
     enabling efficient handling of I/O-bound tasks and improving the overall performance of processor execution.
     """
 
-    GREENTHREAD_POOL_SIZE = 7
-
     class NodeState(Enum):
         PENDING = 1
         RUNNING = 2
@@ -39,36 +36,65 @@ class AsyncProcessorLauncher(AbstractTopologicalProcessorLauncher, Observer):
         ERROR = 4
 
     class Node:
+        """
+        Runtime representation of a processor in the DAG. Each node is started once by the scheduler,
+        so no lock is needed.
+        """
+
+        __slots__ = (
+            "id",
+            "parent_ids",
+            "state",
+            "output",
+            "processor",
+            "provider",
+            "runs_inline",
+        )
+
         def __init__(self, id: str, parent_ids: List[str], processor: Processor):
             self.id = id
             self.parent_ids = parent_ids
             self.state = AsyncProcessorLauncher.NodeState.PENDING
             self.output = None
             self.processor = processor
-            self.lock = Semaphore(1)
+            self.provider = get_provider_name(processor.provider)
+            self.runs_inline = processor.runs_inline
 
         def run(self):
-            with self.lock:
-                if self.state != AsyncProcessorLauncher.NodeState.PENDING:
-                    logging.warning(
-                        f"Node {self.id} is already being processed or completed."
-                    )
-                    return self.output
-
-                self.state = AsyncProcessorLauncher.NodeState.RUNNING
-
-                try:
-                    self.output = self.processor.process_and_update()
-                except Exception as e:
-                    self.state = AsyncProcessorLauncher.NodeState.ERROR
-                    raise e
-
-                self.state = AsyncProcessorLauncher.NodeState.COMPLETED
+            if self.state != AsyncProcessorLauncher.NodeState.PENDING:
+                logging.warning(
+                    f"Node {self.id} is already being processed or completed."
+                )
                 return self.output
 
+            self.state = AsyncProcessorLauncher.NodeState.RUNNING
+
+            try:
+                self.output = self.processor.process_and_update()
+            except Exception as e:
+                self.state = AsyncProcessorLauncher.NodeState.ERROR
+                raise e
+
+            self.state = AsyncProcessorLauncher.NodeState.COMPLETED
+            return self.output
+
+        def complete_with_output(self, output):
+            self.processor.set_output(output)
+            self.output = output
+            self.state = AsyncProcessorLauncher.NodeState.COMPLETED
+            return self.output
+
         def get_processor(self):
             return self.processor
 
+        def release(self):
+            """
+            Drops the output of the node once its progress event has been emitted and every
+            consumer has read it.
+            """
+            self.output = None
+            self.processor.cleanup()
+
     def get_input_processor_names(self, processor: Processor):
         return [
             input_processor.name for input_processor in processor.get_input_processors()
@@ -88,83 +114,74 @@ class AsyncProcessorLauncher(AbstractTopologicalProcessorLauncher, Observer):
 
         nodes = self.convert_processors_to_node_dict(processors)
 
-        pool = eventlet.GreenPool(AsyncProcessorLauncher.GREENTHREAD_POOL_SIZE)
-
         logging.debug(nodes)
 
-        initialized_nodes = set()
-
-        while nodes:
-            error_detected = any(
-                node.state == AsyncProcessorLauncher.NodeState.ERROR
-                for node in nodes.values()
-            )
-
-            if error_detected:
-                logging.debug("A node is in ERROR state. Halting processing.")
-                break
-
-            for id, node in nodes.items():
-                if (
-                    node.state == AsyncProcessorLauncher.NodeState.PENDING
-                    and self.can_run(node, nodes)
-                    and id not in initialized_nodes
-                ):
-                    logging.debug(f"Spawning green thread for node {id}.")
-                    initialized_nodes.add(id)
-                    pool.spawn(self.run_node, node)
-
-            eventlet.sleep(0.5)
-
-            nodes = self.remove_completed_nodes(nodes)
-            logging.debug(f"Remaining nodes: {[node.id for node in nodes.values()]}")
-
-        pool.waitall()
-
-    def remove_completed_nodes(self, nodes: List[Node]):
-        return {
-            id: n
-            for id, n in nodes.items()
-            if n.state not in [AsyncProcessorLauncher.NodeState.COMPLETED]
-        }
-
-    def can_run(self, node: Node, nodes: List[Node]):
-        # If parents aren't in the list, then the node can run
-        return all(parent_id not in nodes for parent_id in node.parent_ids)
+        self.execute_nodes(nodes)
+
+    def execute_nodes(self, nodes: Dict[str, Node], isDone=False) -> DagScheduler:
+        scheduler = DagScheduler(
+            nodes,
+            partial(self.run_node, isDone=isDone),
+            self.concurrency_limits,
+            self.execution_mode,
+            self.scheduling_policy,
+            release_node=self.Node.release,
+        )
+        self.scheduler = scheduler
+        try:
+            scheduler.run()
+        finally:
+            self.run_report = scheduler.get_report()
+            self.scheduler = None
+        return scheduler
+
+    def cancel(self):
+        """
+        Cancels the nodes currently running and prevents the remaining ones from starting.
+        """
+        if self.scheduler is not None:
+            self.scheduler.request_cancel()
 
     def launch_processors_for_node(self, processors: List[Processor], node_name=None):
-        for processor in processors.values():
-            if processor.get_output() is None or processor.name == node_name:
-                processor.add_observer(self)
-                self.run_processor(processor)
-
-            if processor.name == node_name:
-                break
+        """
+        Runs the given node and every ancestor without an output, independent ancestors running concurrently.
+        The first error raised by a node is raised again once the run is over.
+        """
+        processors_to_run = {
+            name: processor
+            for name, processor in processors.items()
+            if processor.get_output() is None or name == node_name
+        }
 
-    def run_processor(self, processor: "Processor"):
-        try:
-            self.notify_current_node_running(processor)
+        for processor in processors_to_run.values():
+            processor.add_observer(self)
 
-            start_time = time.time()
-            output = processor.process_and_update()
+        nodes = self.convert_processors_to_node_dict(processors_to_run)
 
-            end_time = time.time()
-            duration = end_time - start_time
-            self.notify_progress(processor, output, duration=duration, isDone=True)
-        except Exception as e:
-            self.notify_error(processor, e)
-            raise e
+        scheduler = self.execute_nodes(nodes, isDone=True)
+        if scheduler.first_error is not None:
+            raise scheduler.first_error
 
-    def run_node(self, node: Node):
+    def run_node(self, node: Node, isDone=False):
         try:
             processor = node.get_processor()
             self.notify_current_node_running(processor)
 
             start_time = time.time()
-            output = node.run()
+            cache_key = self.get_output_cache_key(processor)
+            cached_output = self.get_cached_output(cache_key)
+            if cached_output is not None:
+                output = node.complete_with_output(cached_output)
+            else:
+                output = node.run()
+                self.cache_output(cache_key, output)
             end_time = time.time()
             duration = end_time - start_time
-            self.notify_progress(node.get_processor(), output, duration=duration)
+            if cached_output is None and self.scheduling_policy is not None:
+                self.scheduling_policy.record_duration(node, duration)
+            self.notify_progress(
+                node.get_processor(), output, duration=duration, isDone=isDone
+            )
         except Exception as e:
             node.state = AsyncProcessorLauncher.NodeState.ERROR
             self.notify_error(node.get_processor(), e)
@@ -174,3 +191,5 @@ class AsyncProcessorLauncher(AbstractTopologicalProcessorLauncher, Observer):
     def notify(self, event: EventType, data: ProcessorEvent):
         if event == EventType.STREAMING:
             self.notify_streaming(data.source, data.output)
+        elif event == EventType.STREAMING_DELTA:
+            self.notify_stream_delta(data.source, data.output, data.sequence)
@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from ...env_config import (
+    get_launcher_max_concurrency,
+    get_launcher_provider_concurrency,
+)
+
+DEFAULT_PROVIDER_CONCURRENCY = {
+    "openai": 10,
+    "anthropic": 5,
+    "replicate": 10,
+    "stabilityai": 5,
+    "browser": 5,
+}
+
+
+def get_provider_name(provider: Any) -> Optional[str]:
+    if provider is None:
+        return None
+    return provider.value if isinstance(provider, Enum) else provider
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimits:
+    """
+    Concurrency limits applied by the launcher while running a flow.
+
+    Attributes:
+        max_concurrency: Maximum number of nodes running at the same time in the green thread pool.
+        provider_limits: Maximum number of nodes running at the same time per provider (e.g. "openai").
+                         Providers without a limit are only bound by max_concurrency.
+    """
+
+    max_concurrency: int
+    provider_limits: Dict[str, int] = field(default_factory=dict)
+
+    @staticmethod
+    def from_env() -> "ConcurrencyLimits":
+        provider_limits = dict(DEFAULT_PROVIDER_CONCURRENCY)
+        provider_limits.update(get_launcher_provider_concurrency())
+        return ConcurrencyLimits(get_launcher_max_concurrency(), provider_limits)
+
+    def with_overrides(
+        self, overrides: Optional[Dict[str, Any]]
+    ) -> "ConcurrencyLimits":
+        """
+        Applies the limits requested for a single flow. Overrides can lower or raise a limit,
+        but never above the limits configured for the server.
+
+        Parameters:
+            overrides (dict): Optional dictionary with the keys "maxConcurrency" (int) and
+                              "providerLimits" (dict of provider name to int).
+        """
+        if not overrides:
+            return self
+
+        max_concurrency = self.max_concurrency
+        if overrides.get("maxConcurrency") is not None:
+            max_concurrency = self._clamp(
+                overrides.get("maxConcurrency"), self.max_concurrency
+            )
+
+        provider_limits = dict(self.provider_limits)
+        for provider, limit in (overrides.get("providerLimits") or {}).items():
+            if limit is None:
+                continue
+            provider_limits[provider] = self._clamp(
+                limit, self.provider_limits.get(provider, max_concurrency)
+            )
+
+        return ConcurrencyLimits(max_concurrency, provider_limits)
+
+    def get_provider_limit(self, provider: Any) -> Optional[int]:
+        provider_name = get_provider_name(provider)
+        if provider_name is None:
+            return None
+        return self.provider_limits.get(provider_name)
+
+    @staticmethod
+    def _clamp(value: Any, ceiling: int) -> int:
+        return max(1, min(int(value), ceiling))
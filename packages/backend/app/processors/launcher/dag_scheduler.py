@@ -0,0 +1,265 @@
+from collections import defaultdict
+from enum import Enum
+import heapq
+from itertools import count
+import logging
+from typing import Any, Callable, Dict, Optional
+
+import eventlet
+from eventlet.queue import LightQueue
+
+from .concurrency_limits import ConcurrencyLimits
+from .execution_mode import ExecutionMode
+from .scheduling_policy import FifoSchedulingPolicy, SchedulingPolicy
+
+
+class NodeRunStatus(Enum):
+    SUCCESS = "success"
+    ERROR = "error"
+    CANCELLED = "cancelled"
+    SKIPPED = "skipped"
+
+
+class DagScheduler:
+    """
+    Completion-driven scheduler running a DAG of launcher nodes on a green thread pool.
+
+    The number of parents each node is waiting for and the children of each node are computed once.
+    Every finished node reports to a completion queue, the scheduler then decrements the counters of
+    its children and starts the ones that became ready right away.
+
+    Nodes flagged as `runs_inline` are executed directly by the scheduler without taking a pool slot.
+    The other nodes are started only when the pool has a free slot and their provider is under its limit.
+    Ready nodes are started by decreasing priority, as given by the scheduling policy.
+    In FAIL_FAST mode, on the first failure, the nodes still running are cancelled: their processor
+    `cancel()` is called and their green thread is killed. No new node is started afterwards.
+    In CONTINUE_ON_ERROR mode, only the descendants of a failed node are skipped, every other branch
+    runs to completion. A cancellation request stops the run in both modes.
+
+    When a `release_node` callback is given, a node is released as soon as every child reading its
+    output has finished, successfully or not. Nodes without children in the DAG are never released.
+    """
+
+    CANCEL_REQUEST = object()
+
+    def __init__(
+        self,
+        nodes: Dict[str, Any],
+        run_node: Callable[[Any], Any],
+        concurrency_limits: ConcurrencyLimits,
+        execution_mode: ExecutionMode = ExecutionMode.FAIL_FAST,
+        scheduling_policy: SchedulingPolicy = None,
+        release_node: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self.nodes = nodes
+        self.run_node = run_node
+        self.concurrency_limits = concurrency_limits
+        self.execution_mode = execution_mode
+        self.pending_parents, self.children = self.build_dependency_index(nodes)
+        self.release_node = release_node
+        self.remaining_consumers = {
+            id: len(children) for id, children in self.children.items()
+        }
+        self.priorities = (scheduling_policy or FifoSchedulingPolicy()).get_priorities(
+            nodes, self.children
+        )
+        self.ready_sequence = count()
+        self.ready = []
+        for id, nb_pending in self.pending_parents.items():
+            if nb_pending == 0:
+                self.push_ready(id)
+        self.completions = LightQueue()
+        self.pool = eventlet.GreenPool(concurrency_limits.max_concurrency)
+        self.running_by_provider = defaultdict(int)
+        self.running_threads = {}
+        self.started_ids = set()
+        self.cancelled_ids = set()
+        self.statuses = {}
+        self.nb_running = 0
+        self.error_detected = False
+        self.halted = False
+        self.first_error = None
+
+    @staticmethod
+    def build_dependency_index(nodes: Dict[str, Any]):
+        """
+        Precomputes, for the given nodes, the number of parents each node is still waiting for
+        and the list of children to release once a node completes.
+
+        Parents that are not part of ``nodes`` are considered already satisfied.
+        """
+        pending_parents = {}
+        children = {id: [] for id in nodes}
+        for id, node in nodes.items():
+            parent_ids = set(
+                parent_id for parent_id in node.parent_ids if parent_id in nodes
+            )
+            pending_parents[id] = len(parent_ids)
+            for parent_id in parent_ids:
+                children[parent_id].append(id)
+        return pending_parents, children
+
+    def run(self) -> None:
+        while True:
+            if not self.halted:
+                self.start_ready_nodes()
+
+            if self.nb_running == 0:
+                break
+
+            id, succeeded = self.completions.get()
+            if id is self.CANCEL_REQUEST:
+                self.halt()
+                continue
+
+            if id in self.cancelled_ids:
+                continue
+
+            self.on_node_completed(id, succeeded)
+
+        self.pool.waitall()
+
+    def push_ready(self, id) -> None:
+        priority = self.priorities.get(id, 0.0)
+        heapq.heappush(self.ready, (-priority, next(self.ready_sequence), id))
+
+    def start_ready_nodes(self) -> None:
+        waiting = []
+        while self.ready:
+            entry = heapq.heappop(self.ready)
+            id = entry[2]
+            node = self.nodes[id]
+
+            if node.runs_inline:
+                logging.debug(f"Running node {id} inline.")
+                self.nb_running += 1
+                self.started_ids.add(id)
+                self.run_and_report(node)
+                continue
+
+            if self.pool.free() == 0 or not self.has_provider_capacity(node.provider):
+                waiting.append(entry)
+                continue
+
+            logging.debug(f"Spawning green thread for node {id}.")
+            self.nb_running += 1
+            self.running_by_provider[node.provider] += 1
+            self.started_ids.add(id)
+            self.running_threads[id] = self.pool.spawn(self.run_and_report, node)
+
+        for entry in waiting:
+            heapq.heappush(self.ready, entry)
+
+    def has_provider_capacity(self, provider) -> bool:
+        limit = self.concurrency_limits.get_provider_limit(provider)
+        return limit is None or self.running_by_provider[provider] < limit
+
+    def run_and_report(self, node) -> None:
+        succeeded = False
+        try:
+            self.run_node(node)
+            succeeded = True
+        except Exception as e:
+            if self.first_error is None:
+                self.first_error = e
+        finally:
+            self.completions.put((node.id, succeeded))
+
+    def on_node_completed(self, id, succeeded: bool) -> None:
+        node = self.nodes[id]
+        self.nb_running -= 1
+        if not node.runs_inline:
+            self.running_by_provider[node.provider] -= 1
+            self.running_threads.pop(id, None)
+
+        self.release_consumed_parents(node)
+
+        if not succeeded:
+            self.statuses[id] = NodeRunStatus.ERROR
+            self.error_detected = True
+            if self.execution_mode == ExecutionMode.CONTINUE_ON_ERROR:
+                logging.debug(f"Node {id} is in ERROR state. Skipping its descendants.")
+            else:
+                logging.debug("A node is in ERROR state. Halting processing.")
+                self.halt()
+            return
+
+        self.statuses[id] = NodeRunStatus.SUCCESS
+
+        for child_id in self.children[id]:
+            self.pending_parents[child_id] -= 1
+            if self.pending_parents[child_id] == 0:
+                self.push_ready(child_id)
+
+    def release_consumed_parents(self, node) -> None:
+        """
+        Called once the given node has finished reading the outputs of its parents: releases the
+        parents that have no remaining consumer.
+        """
+        if self.release_node is None:
+            return
+
+        for parent_id in set(node.parent_ids):
+            if parent_id not in self.remaining_consumers:
+                continue
+            self.remaining_consumers[parent_id] -= 1
+            if self.remaining_consumers[parent_id] == 0:
+                try:
+                    self.release_node(self.nodes[parent_id])
+                except Exception as e:
+                    logging.warning(f"Failed to release node {parent_id}: {e}")
+
+    def request_cancel(self) -> None:
+        """
+        Asks the scheduler to cancel the run. Safe to call from any green thread,
+        the cancellation itself is performed by the scheduler loop.
+        """
+        self.completions.put((self.CANCEL_REQUEST, False))
+
+    def halt(self) -> None:
+        if self.halted:
+            return
+
+        self.halted = True
+        self.cancel_running_nodes()
+
+        report = self.get_report()
+        if report["cancelledNodes"] or report["notStartedNodes"]:
+            logging.info(
+                f"Run halted: {len(report['cancelledNodes'])} running node(s) cancelled, "
+                f"{len(report['notStartedNodes'])} node(s) not started."
+            )
+
+    def cancel_running_nodes(self) -> None:
+        for id, thread in list(self.running_threads.items()):
+            if thread.dead:
+                # Its completion is already queued and will be handled normally.
+                continue
+
+            node = self.nodes[id]
+            try:
+                node.processor.cancel()
+            except Exception as e:
+                logging.warning(f"Failed to cancel node {id}: {e}")
+
+            thread.kill()
+            self.cancelled_ids.add(id)
+            self.statuses[id] = NodeRunStatus.CANCELLED
+            self.running_threads.pop(id)
+            self.nb_running -= 1
+            self.running_by_provider[node.provider] -= 1
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Summary of the run: the status of every node, the nodes cancelled while running
+        and the nodes that never started (reported as skipped).
+        """
+        return {
+            "executionMode": self.execution_mode.value,
+            "nodes": {
+                id: self.statuses.get(id, NodeRunStatus.SKIPPED).value
+                for id in self.nodes
+            },
+            "cancelledNodes": [id for id in self.nodes if id in self.cancelled_ids],
+            "notStartedNodes": [id for id in self.nodes if id not in self.started_ids],
+        }
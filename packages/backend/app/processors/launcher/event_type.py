@@ -4,5 +4,6 @@ from enum import Enum
 class EventType(Enum):
     PROGRESS = "progress"
     STREAMING = "streaming"
+    STREAMING_DELTA = "stream_delta"
     CURRENT_NODE_RUNNING = "current_node_running"
     ERROR = "error"
@@ -0,0 +1,31 @@
+from enum import Enum
+from typing import Optional
+
+from ...env_config import get_launcher_execution_mode
+
+
+class ExecutionMode(Enum):
+    """
+    Behaviour of the launcher when a node fails.
+
+    FAIL_FAST cancels the nodes in flight and stops the run on the first error.
+    CONTINUE_ON_ERROR only skips the descendants of the failed node and runs every unaffected branch to completion.
+    """
+
+    FAIL_FAST = "fail_fast"
+    CONTINUE_ON_ERROR = "continue_on_error"
+
+    @staticmethod
+    def from_value(value: Optional[str]) -> "ExecutionMode":
+        """
+        Returns the mode requested by a flow, falling back to the server default (LAUNCHER_EXECUTION_MODE).
+        """
+        if value is None:
+            value = get_launcher_execution_mode()
+        try:
+            return ExecutionMode(value)
+        except ValueError:
+            raise ValueError(
+                f"Unknown execution mode '{value}', expected one of: "
+                + ", ".join(mode.value for mode in ExecutionMode)
+            )
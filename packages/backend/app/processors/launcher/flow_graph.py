@@ -0,0 +1,148 @@
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class FlowGraph:
+    """
+    Index of a flow configuration, built once per request.
+
+    Holds the node configs by name, the parent and child adjacency lists and a cached topological order,
+    so that node lookups are O(1) and ancestor or descendant queries are O(V+E).
+
+    Parameters:
+        config_data (list): A list of dictionaries containing the configuration data for each processor.
+    """
+
+    def __init__(self, config_data: List[Dict[str, Any]]) -> None:
+        self.config_data = config_data
+        self.nodes_by_name: Dict[str, Dict[str, Any]] = {}
+        self.parents: Dict[str, List[str]] = {}
+        self.children: Dict[str, List[str]] = {}
+        self.duplicate_names: List[str] = []
+        self._topological_order: Optional[List[str]] = None
+
+        for config in config_data:
+            name = config.get("name")
+            if name in self.nodes_by_name:
+                self.duplicate_names.append(name)
+                continue
+            self.nodes_by_name[name] = config
+            self.parents[name] = []
+            self.children[name] = []
+
+        for name, config in self.nodes_by_name.items():
+            for input in config.get("inputs") or []:
+                parent_name = input.get("inputNode")
+                if parent_name in self.parents[name]:
+                    continue
+                self.parents[name].append(parent_name)
+                if parent_name in self.children:
+                    self.children[parent_name].append(name)
+
+    @classmethod
+    def from_parents(cls, parents: Dict[str, Iterable[str]]) -> "FlowGraph":
+        """Builds the graph from the parent names of each node, e.g. the nodes of a launcher run."""
+        return cls(
+            [
+                {"name": name, "inputs": [{"inputNode": parent} for parent in names]}
+                for name, names in parents.items()
+            ]
+        )
+
+    def get_node(self, node_name: str) -> Optional[Dict[str, Any]]:
+        return self.nodes_by_name.get(node_name)
+
+    def get_parents(self, node_name: str) -> List[str]:
+        return self.parents.get(node_name, [])
+
+    def get_children(self, node_name: str) -> List[str]:
+        return self.children.get(node_name, [])
+
+    def get_ancestors(self, node_name: str) -> List[str]:
+        """Returns the names of every existing node the given node depends on, directly or not."""
+        return self._traverse(node_name, self.parents)
+
+    def get_descendants(self, node_name: str) -> List[str]:
+        """Returns the names of every node depending on the given node, directly or not."""
+        return self._traverse(node_name, self.children)
+
+    def get_topological_order(self) -> List[str]:
+        """
+        Returns the node names ordered so that every node comes after its parents.
+        Nodes that are part of a cycle, or depend on one, are left out.
+        """
+        if self._topological_order is None:
+            pending_parents = {
+                name: sum(1 for parent in parents if parent in self.nodes_by_name)
+                for name, parents in self.parents.items()
+            }
+            ready = deque(name for name, count in pending_parents.items() if count == 0)
+            order = []
+            while ready:
+                name = ready.popleft()
+                order.append(name)
+                for child in self.children[name]:
+                    pending_parents[child] -= 1
+                    if pending_parents[child] == 0:
+                        ready.append(child)
+            self._topological_order = order
+        return self._topological_order
+
+    def get_subgraph_config_data(self, node_name: str) -> List[Dict[str, Any]]:
+        """Returns the configs of the given node and its ancestors, parents first."""
+        if node_name not in self.nodes_by_name:
+            return []
+        related = set(self.get_ancestors(node_name))
+        related.add(node_name)
+        return [
+            self.nodes_by_name[name]
+            for name in self.get_topological_order()
+            if name in related
+        ]
+
+    def find_cycle(self, node_names: Iterable[str] = None) -> Optional[List[str]]:
+        """
+        Looks for a cycle reachable from the given nodes (every node by default) by following their parents.
+
+        Returns:
+            The names of the nodes forming the cycle, the first node being repeated at the end, or None.
+        """
+        VISITING, VISITED = 1, 2
+        state: Dict[str, int] = {}
+        for start_name in node_names if node_names is not None else self.nodes_by_name:
+            if start_name not in self.nodes_by_name or start_name in state:
+                continue
+            state[start_name] = VISITING
+            path = [start_name]
+            stack = [iter(self.parents[start_name])]
+            while stack:
+                parent_name = next(stack[-1], None)
+                if parent_name is None:
+                    state[path.pop()] = VISITED
+                    stack.pop()
+                    continue
+                if parent_name not in self.nodes_by_name:
+                    continue
+                if state.get(parent_name) == VISITING:
+                    cycle = path[path.index(parent_name) :] + [parent_name]
+                    cycle.reverse()
+                    return cycle
+                if parent_name not in state:
+                    state[parent_name] = VISITING
+                    path.append(parent_name)
+                    stack.append(iter(self.parents[parent_name]))
+        return None
+
+    def _traverse(self, node_name: str, adjacency: Dict[str, List[str]]) -> List[str]:
+        visited = set()
+        found = []
+        stack = [node_name]
+        while stack:
+            name = stack.pop()
+            for next_name in adjacency.get(name, []):
+                if next_name in visited or next_name not in self.nodes_by_name:
+                    continue
+                visited.add(next_name)
+                found.append(next_name)
+                stack.append(next_name)
+        return found
@@ -0,0 +1,68 @@
+import logging
+from typing import Iterable
+
+from .flow_graph import FlowGraph
+from ..exceptions import InvalidFlowException
+
+
+def validate_flow_graph(graph: FlowGraph, node_names: Iterable[str] = None) -> None:
+    """
+    Static validation of a flow, run before any processor is instantiated.
+
+    Parameters:
+        graph (FlowGraph): The graph index of the flow.
+        node_names (iterable): The nodes to validate, every node of the flow by default.
+
+    Raises:
+        InvalidFlowException: If a node name is duplicated, an input references a missing node,
+            an input output key is not a non-negative integer, or the nodes form a cycle.
+    """
+    if node_names is None:
+        node_names = list(graph.nodes_by_name)
+        if graph.duplicate_names:
+            raise InvalidFlowException(
+                f"Duplicate node name '{graph.duplicate_names[0]}' in flow"
+            )
+
+    for name in node_names:
+        config = graph.get_node(name)
+        if config is None:
+            continue
+        for input in config.get("inputs") or []:
+            validate_input(graph, name, input)
+
+    cycle = graph.find_cycle(node_names)
+    if cycle is not None:
+        raise InvalidFlowException(
+            f"Cycle detected between nodes: {' -> '.join(cycle)}"
+        )
+
+
+def validate_input(graph: FlowGraph, node_name: str, input: dict) -> None:
+    input_node_name = input.get("inputNode")
+    input_node = graph.get_node(input_node_name)
+    if input_node is None:
+        raise InvalidFlowException(
+            f"Input processor '{input_node_name}' of node '{node_name}' not found"
+        )
+
+    output_key = input.get("inputNodeOutputKey")
+    if output_key is None:
+        return
+
+    if (
+        not isinstance(output_key, int)
+        or isinstance(output_key, bool)
+        or output_key < 0
+    ):
+        raise InvalidFlowException(
+            f"Invalid output key '{output_key}' for input '{input_node_name}' of node '{node_name}'"
+        )
+
+    # The UI keeps the edges of outputs removed by lowering nbOutput, the input then resolves to None.
+    nb_output = input_node.get("nbOutput")
+    if isinstance(nb_output, int) and nb_output > 0 and output_key >= nb_output:
+        logging.warning(
+            f"Output key {output_key} of input '{input_node_name}' is out of range for node '{node_name}' "
+            f"('{input_node_name}' has {nb_output} outputs)"
+        )
@@ -0,0 +1,30 @@
+from typing import Dict, Optional
+
+from injector import singleton
+
+
+@singleton
+class NodeDurationHistory:
+    """
+    Process-wide record of how long each processor type takes to run, kept as an exponential
+    moving average so that recent runs weigh more than old ones.
+    """
+
+    def __init__(self, smoothing: float = 0.3) -> None:
+        self.smoothing = smoothing
+        self._averages: Dict[str, float] = {}
+
+    def record(self, processor_type: str, duration: float) -> None:
+        average = self._averages.get(processor_type)
+        if average is None:
+            self._averages[processor_type] = duration
+        else:
+            self._averages[processor_type] = (
+                self.smoothing * duration + (1 - self.smoothing) * average
+            )
+
+    def get_average(self, processor_type: str) -> Optional[float]:
+        return self._averages.get(processor_type)
+
+    def clear(self) -> None:
+        self._averages.clear()
@@ -1,9 +1,22 @@
-from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
 class ProcessorEvent:
-    source: Any = field(default=None)
-    output: Any = field(default=None)
-    error: str = field(default=None)
+    """
+    Event sent by a processor to its observers, e.g. a streamed partial output.
+    Streamed deltas carry their sequence number, starting at 1 for each run of the processor.
+    """
+
+    __slots__ = ("source", "output", "error", "sequence")
+
+    def __init__(
+        self,
+        source: Any = None,
+        output: Any = None,
+        error: str = None,
+        sequence: int = None,
+    ):
+        self.source = source
+        self.output = output
+        self.error = error
+        self.sequence = sequence
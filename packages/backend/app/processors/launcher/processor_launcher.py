@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 from ..context.processor_context import ProcessorContext
+from .concurrency_limits import ConcurrencyLimits
+from .execution_mode import ExecutionMode
 
 
 class ProcessorLauncher(ABC):
@@ -19,7 +21,23 @@ class ProcessorLauncher(ABC):
     @abstractmethod
     def launch_processors_for_node(self, processors, node_name):
         pass
-    
+
     @abstractmethod
     def set_context(self, context: ProcessorContext):
         pass
+
+    @abstractmethod
+    def set_concurrency_limits(self, concurrency_limits: ConcurrencyLimits):
+        pass
+
+    @abstractmethod
+    def set_execution_mode(self, execution_mode: ExecutionMode):
+        pass
+
+    @abstractmethod
+    def get_run_report(self):
+        pass
+
+    @abstractmethod
+    def cancel(self):
+        pass
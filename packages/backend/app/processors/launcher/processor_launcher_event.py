@@ -1,17 +1,47 @@
-from dataclasses import dataclass, field
 from typing import Any
 
-from ..components.processor import Processor
 
-
-@dataclass
 class ProcessorLauncherEvent:
-    instance_name: str
-    user_id: int = field(default=None)
-    output: Any = field(default=None)
-    processor_type: str = field(default=None)
-    processor: Processor = field(default=None)
-    isDone: bool = field(default=False)
-    error: str = field(default=None)
-    session_id: str = field(default=None)
-    duration: float = field(default=0)
+    """
+    Event sent by the launcher to its observers.
+
+    One event is created per notification, the class is slotted to keep them small. The event does not
+    reference the processor, so that it does not keep processors or their outputs alive.
+    """
+
+    __slots__ = (
+        "instance_name",
+        "user_id",
+        "output",
+        "processor_type",
+        "isDone",
+        "error",
+        "session_id",
+        "event_encoding",
+        "duration",
+        "sequence",
+    )
+
+    def __init__(
+        self,
+        instance_name: str,
+        user_id: int = None,
+        output: Any = None,
+        processor_type: str = None,
+        isDone: bool = False,
+        error: str = None,
+        session_id: str = None,
+        event_encoding: str = None,
+        duration: float = 0,
+        sequence: int = None,
+    ) -> None:
+        self.instance_name = instance_name
+        self.user_id = user_id
+        self.output = output
+        self.processor_type = processor_type
+        self.isDone = isDone
+        self.error = error
+        self.session_id = session_id
+        self.event_encoding = event_encoding
+        self.duration = duration
+        self.sequence = sequence
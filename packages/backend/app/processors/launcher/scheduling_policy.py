@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from injector import inject, singleton
+
+from .flow_graph import FlowGraph
+from .node_duration_history import NodeDurationHistory
+
+DEFAULT_NODE_DURATION = 1.0
+
+
+class SchedulingPolicy(ABC):
+    """
+    Decides which ready nodes the DAG scheduler starts first when there are more ready nodes than free slots.
+    """
+
+    @abstractmethod
+    def get_priorities(
+        self, nodes: Dict[str, Any], children: Dict[str, List[str]]
+    ) -> Dict[str, float]:
+        """
+        Returns a priority per node id, nodes with a higher priority are started first.
+        Nodes missing from the result have a priority of 0.
+        """
+        pass
+
+    def record_duration(self, node: Any, duration: float) -> None:
+        """Called by the launcher with the measured duration of every node it runs."""
+        pass
+
+
+@singleton
+class FifoSchedulingPolicy(SchedulingPolicy):
+    """Starts ready nodes in the order they became ready."""
+
+    def get_priorities(self, nodes, children):
+        return {}
+
+
+@singleton
+class CriticalPathSchedulingPolicy(SchedulingPolicy):
+    """
+    Starts first the nodes with the longest remaining downstream path, so that slow chains
+    (e.g. LLM -> image -> video) are not queued behind short independent nodes.
+
+    The length of a path is the sum of the estimated durations of its nodes, based on the
+    average duration measured for each processor type.
+    """
+
+    @inject
+    def __init__(self, duration_history: NodeDurationHistory) -> None:
+        self.duration_history = duration_history
+
+    def get_priorities(self, nodes, children):
+        graph = FlowGraph.from_parents(
+            {id: node.parent_ids for id, node in nodes.items()}
+        )
+        priorities = {}
+        for id in reversed(graph.get_topological_order()):
+            downstream = max(
+                (priorities[child_id] for child_id in children[id]), default=0.0
+            )
+            priorities[id] = self.estimate_duration(nodes[id]) + downstream
+        return priorities
+
+    def estimate_duration(self, node: Any) -> float:
+        if node.runs_inline:
+            return 0.0
+        average = self.duration_history.get_average(node.processor.processor_type)
+        return DEFAULT_NODE_DURATION if average is None else average
+
+    def record_duration(self, node, duration):
+        if not node.runs_inline:
+            self.duration_history.record(node.processor.processor_type, duration)
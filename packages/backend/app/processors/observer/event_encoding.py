@@ -0,0 +1,96 @@
+from enum import Enum
+import json
+from typing import Any, List, Optional
+
+from ..launcher.processor_launcher_event import ProcessorLauncherEvent
+
+
+class EventEncoding(Enum):
+    """
+    Encoding of the progress and streaming events, chosen by each client when it connects. It is
+    stored in the Socket.IO session of the client, and each run sends it along with its events.
+
+    JSON is the default: events are dicts.
+    BINARY sends compact positional frames, with large outputs as binary attachments:
+        - progress: [instanceName, isDone, output]
+        - stream_delta: [instanceName, sequence, delta]
+    An output or delta whose UTF-8 text or JSON takes at least BINARY_ATTACHMENT_MIN_BYTES is sent as bytes.
+    The first byte is the kind of the payload: 0 for UTF-8 text, 1 for UTF-8 JSON, 2 for a list of UTF-8
+    texts separated by the 0x1E byte. The rest of the bytes are the payload. Smaller outputs are sent as
+    JSON values.
+
+    The UI connects with BINARY and decodes these frames in `sockets/eventDecoding.ts`. It still accepts
+    JSON events, sent by the processes that run flows without serving clients.
+    """
+
+    JSON = "json"
+    BINARY = "binary"
+
+    @staticmethod
+    def from_value(value: Optional[str]) -> "EventEncoding":
+        if value is None:
+            return EventEncoding.JSON
+        try:
+            return EventEncoding(value)
+        except ValueError:
+            raise ValueError(
+                f"Unknown event encoding '{value}', expected one of: "
+                + ", ".join(encoding.value for encoding in EventEncoding)
+            )
+
+
+BINARY_ATTACHMENT_MIN_BYTES = 1024
+
+TEXT_PAYLOAD = b"\x00"
+JSON_PAYLOAD = b"\x01"
+TEXT_LIST_PAYLOAD = b"\x02"
+TEXT_LIST_SEPARATOR = "\x1e"
+
+
+def encode_payload(value: Any) -> Any:
+    """
+    Returns large text or JSON values as a binary attachment, and small ones unchanged.
+    """
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+        if len(encoded) < BINARY_ATTACHMENT_MIN_BYTES:
+            return value
+        return TEXT_PAYLOAD + encoded
+
+    if isinstance(value, list) and all(
+        isinstance(item, str) and TEXT_LIST_SEPARATOR not in item for item in value
+    ):
+        # Most outputs are lists of texts, joining them is much cheaper than serializing them to JSON.
+        encoded = TEXT_LIST_SEPARATOR.join(value).encode("utf-8")
+        if len(encoded) < BINARY_ATTACHMENT_MIN_BYTES:
+            return value
+        return TEXT_LIST_PAYLOAD + encoded
+
+    if isinstance(value, (list, dict)):
+        encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        if len(encoded) < BINARY_ATTACHMENT_MIN_BYTES:
+            return value
+        return JSON_PAYLOAD + encoded
+
+    return value
+
+
+def decode_payload(value: Any) -> Any:
+    if not isinstance(value, (bytes, bytearray)):
+        return value
+    kind, payload = value[:1], bytes(value[1:]).decode("utf-8")
+    if kind == JSON_PAYLOAD:
+        return json.loads(payload)
+    if kind == TEXT_LIST_PAYLOAD:
+        return payload.split(TEXT_LIST_SEPARATOR)
+    return payload
+
+
+def to_binary_progress_frame(data: ProcessorLauncherEvent) -> List[Any]:
+    return [data.instance_name, data.isDone, encode_payload(data.output)]
+
+
+def to_binary_stream_delta_frame(data: ProcessorLauncherEvent) -> List[Any]:
+    return [data.instance_name, data.sequence, encode_payload(data.output)]
@@ -0,0 +1,156 @@
+from collections import deque
+from enum import Enum
+import logging
+from typing import Deque, Dict, Optional, Tuple
+
+import eventlet
+from eventlet.semaphore import Semaphore
+
+from ..launcher.event_type import EventType
+from ..launcher.processor_launcher_event import ProcessorLauncherEvent
+from .observer import Observer
+
+STREAMING_EVENTS = (EventType.STREAMING.value, EventType.STREAMING_DELTA.value)
+
+
+class OverflowPolicy(Enum):
+    """
+    Behaviour of a session queue when it is full.
+
+    DROP_STREAMING drops the oldest streaming frame of the queue, or the new one if the queue holds none.
+    Other events are never dropped, the queue may exceed its size for them. The client rebuilds the streamed
+    text from the progress event sent when the node completes.
+    BLOCK makes the node producing the event wait for a free slot.
+    """
+
+    DROP_STREAMING = "drop_streaming"
+    BLOCK = "block"
+
+    @staticmethod
+    def from_value(value: str) -> "OverflowPolicy":
+        try:
+            return OverflowPolicy(value)
+        except ValueError:
+            raise ValueError(
+                f"Unknown event queue overflow policy '{value}', expected one of: "
+                + ", ".join(policy.value for policy in OverflowPolicy)
+            )
+
+
+class SessionOutbox:
+    """Events waiting to be sent to one session, and the green thread sending them."""
+
+    __slots__ = ("queue", "sender", "slots")
+
+    def __init__(self, max_size: int):
+        self.queue: Deque[Tuple[str, ProcessorLauncherEvent]] = deque()
+        self.sender = None
+        self.slots = Semaphore(max_size)
+
+
+class SessionEventDispatcher(Observer):
+    """
+    Observer decoupling the nodes from the clients: events are put in a bounded queue per session and
+    forwarded to another observer by a sender green thread, so that a slow client or a slow emit does
+    not stall the node that produced the event.
+
+    The sender of a session is started by its first event and stops once its queue is empty. Events of
+    a session are forwarded in order.
+    """
+
+    def __init__(
+        self, observer: Observer, max_queue_size: int, overflow_policy: OverflowPolicy
+    ):
+        self.observer = observer
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.outboxes: Dict[Optional[str], SessionOutbox] = {}
+        self.nb_dropped_events = 0
+
+    def notify(self, event, data: ProcessorLauncherEvent):
+        outbox = self.outboxes.get(data.session_id)
+        if outbox is None:
+            outbox = SessionOutbox(self.max_queue_size)
+            self.outboxes[data.session_id] = outbox
+
+        if self.overflow_policy == OverflowPolicy.BLOCK:
+            outbox.slots.acquire()
+            outbox.queue.append((event, data))
+        elif self.enqueue_or_drop(outbox, event, data):
+            return
+
+        if outbox.sender is None:
+            outbox.sender = eventlet.spawn(self.send, data.session_id, outbox)
+
+    def enqueue_or_drop(self, outbox: SessionOutbox, event, data) -> bool:
+        """
+        Enqueues the event, dropping a streaming frame if the queue is full.
+        Returns True when the given event itself has been dropped.
+        """
+        if len(outbox.queue) >= self.max_queue_size:
+            dropped_index = next(
+                (
+                    index
+                    for index, (queued_event, _) in enumerate(outbox.queue)
+                    if queued_event in STREAMING_EVENTS
+                ),
+                None,
+            )
+            if dropped_index is not None:
+                del outbox.queue[dropped_index]
+                self.nb_dropped_events += 1
+            elif event in STREAMING_EVENTS:
+                self.nb_dropped_events += 1
+                return True
+
+        outbox.queue.append((event, data))
+        return False
+
+    def send(self, session_id, outbox: SessionOutbox) -> None:
+        try:
+            while outbox.queue:
+                event, data = outbox.queue.popleft()
+                if self.overflow_policy == OverflowPolicy.BLOCK:
+                    outbox.slots.release()
+                try:
+                    self.observer.notify(event, data)
+                except Exception as e:
+                    logging.error(f"Error sending event {event} to {session_id}: {e}")
+        finally:
+            outbox.sender = None
+            # Nodes blocked on a full queue still hold this outbox, it is kept for them.
+            waiting_producers = outbox.slots.balance < self.max_queue_size
+            if (
+                not outbox.queue
+                and not waiting_producers
+                and self.outboxes.get(session_id) is outbox
+            ):
+                del self.outboxes[session_id]
+
+    def wait_until_sent(self, session_id) -> None:
+        """
+        Waits until every event queued for the session has been forwarded.
+        """
+        outbox = self.outboxes.get(session_id)
+        while outbox is not None and outbox.sender is not None:
+            outbox.sender.wait()
+            outbox = self.outboxes.get(session_id)
+
+    def discard(self, session_id) -> None:
+        """
+        Drops the events still queued for a session, e.g. once its client is disconnected.
+        """
+        outbox = self.outboxes.get(session_id)
+        if outbox is None:
+            return
+        self.nb_dropped_events += len(outbox.queue)
+        while outbox.queue:
+            outbox.queue.popleft()
+            if self.overflow_policy == OverflowPolicy.BLOCK:
+                outbox.slots.release()
+
+    def get_metrics(self):
+        return {
+            "queuedEvents": sum(len(outbox.queue) for outbox in self.outboxes.values()),
+            "droppedEvents": self.nb_dropped_events,
+        }
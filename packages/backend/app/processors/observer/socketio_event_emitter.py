@@ -1,9 +1,13 @@
 from ..launcher.event_type import EventType
 from ..launcher.processor_launcher_event import ProcessorLauncherEvent
 
+from .event_encoding import (
+    EventEncoding,
+    to_binary_progress_frame,
+    to_binary_stream_delta_frame,
+)
 from .observer import Observer
 import logging
-from ...flask.socketio_init import socketio
 
 
 class SocketIOEventEmitter(Observer):
@@ -22,12 +26,49 @@ class SocketIOEventEmitter(Observer):
         notify(event, data): Emits the specified event to the client associated
                             with the session ID in `data`. Handles exceptions
                             gracefully and logs emission details.
+                            Streamed text is emitted as "stream_delta" events,
+                            holding only the new chunk and its sequence number.
+                            Progress and streaming events are sent as compact
+                            binary frames to the clients that asked for it.
     """
 
+    def __init__(self, socketio=None):
+        """
+        Emits through the Socket.IO server of the Flask app by default. Processes that do not serve
+        clients provide a write-only instance publishing on the message queue.
+        """
+        if socketio is None:
+            from ...flask.socketio_init import socketio
+        self.socketio = socketio
+
     def notify(self, event: EventType, data: ProcessorLauncherEvent):
         if event == EventType.STREAMING.value:
             event = EventType.PROGRESS.value
 
+        binary = data.event_encoding == EventEncoding.BINARY.value
+        if event == EventType.STREAMING_DELTA.value:
+            if binary:
+                json_event = to_binary_stream_delta_frame(data)
+            else:
+                json_event = self.to_stream_delta_json(data)
+        elif event == EventType.PROGRESS.value and binary:
+            json_event = to_binary_progress_frame(data)
+        else:
+            json_event = self.to_json(data)
+
+        try:
+            self.socketio.emit(event, json_event, to=data.session_id)
+            logging.debug(
+                "Successfully emitted event %s with data %s to %s",
+                event,
+                json_event,
+                data.session_id,
+            )
+        except Exception as e:
+            logging.error(f"Error emitting event {event}: {e}")
+
+    @staticmethod
+    def to_json(data: ProcessorLauncherEvent) -> dict:
         json_event = {}
 
         json_event["instanceName"] = data.instance_name
@@ -41,10 +82,16 @@ class SocketIOEventEmitter(Observer):
         if data.error is not None:
             json_event["error"] = str(data.error)
 
-        try:
-            socketio.emit(event, json_event, to=data.session_id)
-            logging.debug(
-                f"Successfully emitted event {event} with data {json_event} to {data.session_id}"
-            )
-        except Exception as e:
-            logging.error(f"Error emitting event {event}: {e}")
+        return json_event
+
+    @staticmethod
+    def to_stream_delta_json(data: ProcessorLauncherEvent) -> dict:
+        """
+        A streamed chunk of text. The client appends the chunks in sequence order, the complete text
+        is then sent by the progress event of the node.
+        """
+        return {
+            "instanceName": data.instance_name,
+            "delta": data.output,
+            "sequence": data.sequence,
+        }
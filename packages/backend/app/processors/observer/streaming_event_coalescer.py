@@ -0,0 +1,158 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import eventlet
+
+from ..launcher.event_type import EventType
+from ..launcher.processor_launcher_event import ProcessorLauncherEvent
+from .observer import Observer
+
+STREAMING_EVENTS = (EventType.STREAMING.value, EventType.STREAMING_DELTA.value)
+NODE_BOUNDARY_EVENTS = (
+    EventType.CURRENT_NODE_RUNNING.value,
+    EventType.PROGRESS.value,
+    EventType.ERROR.value,
+)
+
+
+class StreamingEventBuffer:
+    """Streaming events of one node of one session, waiting to be sent as a single frame."""
+
+    __slots__ = ("event", "last_data", "deltas", "size", "timer")
+
+    def __init__(self, event: str):
+        self.event = event
+        self.last_data: Optional[ProcessorLauncherEvent] = None
+        self.deltas: List[str] = []
+        self.size = 0
+        self.timer = None
+
+
+class StreamingEventCoalescer(Observer):
+    """
+    Observer buffering the streaming events of each (session, node) before forwarding them to another observer.
+
+    Streamed deltas are concatenated and renumbered, so that the frames forwarded for a node have consecutive
+    sequence numbers. It must come before any observer that may drop frames, so that the client can detect a
+    dropped frame from the gap in the sequence numbers. Streamed snapshots only keep the latest one. A buffer is flushed `flush_interval_ms` after its
+    first event, as soon as it holds `max_buffer_bytes`, and right before any other event of the same node
+    (progress, error, current node running) so that the order of the events is preserved. Every other event
+    is forwarded immediately.
+
+    With a flush interval of 0, streaming events are forwarded as they come.
+    """
+
+    def __init__(
+        self, observer: Observer, flush_interval_ms: int, max_buffer_bytes: int
+    ):
+        self.observer = observer
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_buffer_bytes = max_buffer_bytes
+        self.buffers: Dict[Tuple[str, str], StreamingEventBuffer] = {}
+        self.emitted_sequences: Dict[Tuple[str, str], int] = {}
+        self.nb_streaming_events = 0
+        self.nb_streaming_frames = 0
+
+    def notify(self, event, data: ProcessorLauncherEvent):
+        key = (data.session_id, data.instance_name)
+
+        if event not in STREAMING_EVENTS:
+            self.flush(key)
+            if event in NODE_BOUNDARY_EVENTS:
+                # The node starts or ends, the sequence numbers of its next run start over.
+                self.emitted_sequences.pop(key, None)
+            self.observer.notify(event, data)
+            return
+
+        self.nb_streaming_events += 1
+        if self.flush_interval <= 0:
+            self.nb_streaming_frames += 1
+            self.observer.notify(event, data)
+            return
+
+        buffer = self.buffers.get(key)
+        if buffer is not None and (
+            buffer.event != event
+            or (event == EventType.STREAMING_DELTA.value and data.sequence == 1)
+        ):
+            self.flush(key)
+            buffer = None
+
+        if event == EventType.STREAMING_DELTA.value and data.sequence == 1:
+            # New run of the node, the sequence numbers start over.
+            self.emitted_sequences.pop(key, None)
+
+        if buffer is None:
+            buffer = StreamingEventBuffer(event)
+            buffer.timer = eventlet.spawn_after(self.flush_interval, self.flush, key)
+            self.buffers[key] = buffer
+
+        buffer.last_data = data
+        if event == EventType.STREAMING_DELTA.value:
+            buffer.deltas.append(data.output)
+            buffer.size += len(data.output.encode("utf-8"))
+
+        if buffer.size >= self.max_buffer_bytes:
+            self.flush(key)
+
+    def flush(self, key: Tuple[str, str]) -> None:
+        buffer = self.buffers.pop(key, None)
+        if buffer is None:
+            return
+        buffer.timer.cancel()
+
+        data = buffer.last_data
+        if buffer.event == EventType.STREAMING_DELTA.value:
+            sequence = self.emitted_sequences.get(key, 0) + 1
+            self.emitted_sequences[key] = sequence
+            data = ProcessorLauncherEvent(
+                instance_name=data.instance_name,
+                user_id=data.user_id,
+                output="".join(buffer.deltas),
+                processor_type=data.processor_type,
+                session_id=data.session_id,
+                event_encoding=data.event_encoding,
+                sequence=sequence,
+            )
+
+        self.nb_streaming_frames += 1
+        try:
+            self.observer.notify(buffer.event, data)
+        except Exception as e:
+            logging.error(f"Error flushing streaming events of {key[1]}: {e}")
+
+    def flush_all(self) -> None:
+        for key in list(self.buffers):
+            self.flush(key)
+
+    def flush_session(self, session_id) -> None:
+        """Forwards the pending frames of a session right away, e.g. before telling its client the run ended."""
+        for key in list(self.buffers):
+            if key[0] == session_id:
+                self.flush(key)
+
+    def discard_node(self, session_id, instance_name) -> None:
+        """
+        Forgets the state of a node that will send no other event, e.g. once it is cancelled.
+        Its pending frame is dropped.
+        """
+        key = (session_id, instance_name)
+        buffer = self.buffers.pop(key, None)
+        if buffer is not None:
+            buffer.timer.cancel()
+        self.emitted_sequences.pop(key, None)
+
+    def discard_session(self, session_id) -> None:
+        """Forgets the state of every node of a session, e.g. once its client is disconnected."""
+        keys = set(self.buffers) | set(self.emitted_sequences)
+        for key in keys:
+            if key[0] == session_id:
+                self.discard_node(*key)
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "streamingEvents": self.nb_streaming_events,
+            "streamingFrames": self.nb_streaming_frames,
+            "framesSaved": self.nb_streaming_events - self.nb_streaming_frames,
+            "pendingBuffers": len(self.buffers),
+        }
@@ -1,29 +1,57 @@
-from typing import List
-from injector import Injector, Binder, Module
+from typing import List, Optional
+from injector import Injector, Binder, Module, provider, singleton
 from tests.utils.processor_factory_mock import ProcessorFactoryMock
 from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
 
 from app.processors.observer.socketio_event_emitter import SocketIOEventEmitter
 from app.processors.observer.observer import Observer
+from app.processors.observer.session_event_dispatcher import (
+    OverflowPolicy,
+    SessionEventDispatcher,
+)
+from app.processors.observer.streaming_event_coalescer import (
+    StreamingEventCoalescer,
+)
 from app.storage.local_storage_strategy import LocalStorageStrategy
 from app.storage.s3_storage_strategy import S3StorageStrategy
 from app.storage.storage_strategy import StorageStrategy
-from app.env_config import is_mock_env, is_s3_enabled
+from app.env_config import (
+    get_launcher_scheduling_policy,
+    get_event_queue_max_size,
+    get_event_queue_overflow_policy,
+    get_node_output_cache_backend,
+    get_streaming_flush_interval_ms,
+    get_streaming_flush_max_bytes,
+    is_mock_env,
+    is_s3_enabled,
+)
+from app.processors.cache.node_output_cache import NodeOutputCache
+from app.processors.cache.memory_node_output_cache import MemoryNodeOutputCache
+from app.processors.cache.sqlite_node_output_cache import SqliteNodeOutputCache
+from app.processors.cache.redis_node_output_cache import RedisNodeOutputCache
 from app.processors.factory.processor_factory import ProcessorFactory
 from app.processors.factory.processor_factory_iter_modules import (
     ProcessorFactoryIterModules,
 )
 from app.processors.launcher.processor_launcher import ProcessorLauncher
+from app.processors.launcher.scheduling_policy import (
+    CriticalPathSchedulingPolicy,
+    FifoSchedulingPolicy,
+    SchedulingPolicy,
+)
 import logging
 
 
 class ProcessorFactoryModule(Module):
-    def configure(self, binder: Binder):
+    @singleton
+    @provider
+    def provide_processor_factory(self) -> ProcessorFactory:
         if is_mock_env():
-            fake_factory = ProcessorFactoryMock(with_delay=True)
-            binder.bind(ProcessorFactory, to=fake_factory)
+            factory = ProcessorFactoryMock(with_delay=True)
         else:
-            binder.bind(ProcessorFactory, to=ProcessorFactoryIterModules)
+            factory = ProcessorFactoryIterModules()
+        factory.load_processors()
+        return factory
 
 
 class StorageModule(Module):
@@ -36,33 +64,96 @@ class StorageModule(Module):
             binder.bind(StorageStrategy, to=LocalStorageStrategy)
 
 
+class NodeOutputCacheModule(Module):
+    def configure(self, binder: Binder):
+        backend = get_node_output_cache_backend()
+        if backend == "redis":
+            logging.info("Using Redis node output cache")
+            binder.bind(NodeOutputCache, to=RedisNodeOutputCache)
+        elif backend == "sqlite":
+            logging.info("Using sqlite node output cache")
+            binder.bind(NodeOutputCache, to=SqliteNodeOutputCache)
+        else:
+            logging.info("Using in-memory node output cache")
+            binder.bind(NodeOutputCache, to=MemoryNodeOutputCache)
+
+
+class SchedulingPolicyModule(Module):
+    def configure(self, binder: Binder):
+        if get_launcher_scheduling_policy() == "fifo":
+            logging.info("Using FIFO scheduling policy")
+            binder.bind(SchedulingPolicy, to=FifoSchedulingPolicy)
+        else:
+            logging.info("Using critical path scheduling policy")
+            binder.bind(SchedulingPolicy, to=CriticalPathSchedulingPolicy)
+
+
 class ProcessorLauncherModule(Module):
+    def __init__(self, event_emitter: Optional[Observer] = None):
+        self.event_emitter = event_emitter
+
     def configure(self, binder: Binder):
         binder.bind(ProcessorLauncher, to=AsyncProcessorLauncher)
-        observer_list = [SocketIOEventEmitter()]
+        dispatcher = SessionEventDispatcher(
+            self.event_emitter or SocketIOEventEmitter(),
+            get_event_queue_max_size(),
+            OverflowPolicy.from_value(get_event_queue_overflow_policy()),
+        )
+        # Deltas are numbered by the coalescer before being queued, so a frame dropped from a full
+        # queue leaves a gap in the sequence numbers received by the client.
+        coalescer = StreamingEventCoalescer(
+            dispatcher,
+            get_streaming_flush_interval_ms(),
+            get_streaming_flush_max_bytes(),
+        )
+        binder.bind(StreamingEventCoalescer, to=coalescer)
+        binder.bind(SessionEventDispatcher, to=dispatcher)
+        observer_list = [coalescer]
 
         binder.multibind(List[Observer], to=observer_list)
 
 
-def create_application_injector() -> Injector:
+def create_application_injector(event_emitter: Optional[Observer] = None) -> Injector:
+    """
+    Creates the application injector. Processes running flows without serving clients provide an
+    emitter built on a write-only Socket.IO instance.
+    """
     injector = Injector(
         [
             ProcessorFactoryModule(),
             StorageModule(),
-            ProcessorLauncherModule(),
+            NodeOutputCacheModule(),
+            SchedulingPolicyModule(),
+            ProcessorLauncherModule(event_emitter),
         ],
         auto_bind=True,
     )
+    # Builds the processor registry now rather than on the first request.
+    injector.get(ProcessorFactory)
     return injector
 
 
+# Emitter given to init_root_injector, reused when the root injector is refreshed.
+_event_emitter: Optional[Observer] = None
 _current_injector: Injector = create_application_injector()
 
 
+def init_root_injector(event_emitter: Optional[Observer] = None) -> Injector:
+    """
+    Replaces the root injector by one using the given event emitter. Entry point of the processes running
+    flows without serving clients, which must call it before using `get_root_injector`:
+    `init_root_injector(SocketIOEventEmitter(create_write_only_socketio()))`.
+    """
+    global _current_injector, _event_emitter
+    _event_emitter = event_emitter
+    _current_injector = create_application_injector(event_emitter)
+    return _current_injector
+
+
 def get_root_injector() -> Injector:
     return _current_injector
 
 
 def refresh_root_injector() -> None:
     global _current_injector
-    _current_injector = create_application_injector()
+    _current_injector = create_application_injector(_event_emitter)
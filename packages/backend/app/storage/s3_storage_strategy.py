@@ -2,14 +2,15 @@ import logging
 from typing import Any
 import uuid
 from ..storage.storage_strategy import CloudStorageStrategy
-import boto3
-from botocore.config import Config
+from ..utils.lazy_import import lazy_import
 import os
 from datetime import timedelta
 from injector import singleton
 import mimetypes
 import requests
 
+boto3 = lazy_import("boto3")
+
 
 @singleton
 class S3StorageStrategy(CloudStorageStrategy):
@@ -21,6 +22,8 @@ class S3StorageStrategy(CloudStorageStrategy):
     MAX_POOL_CONNECTIONS = int(os.getenv("MAX_POOL_CONNECTIONS", "100"))
 
     def __init__(self):
+        from botocore.config import Config
+
         self.BUCKET_NAME = os.getenv("S3_BUCKET_NAME")
         endpoint_url = os.getenv("S3_ENDPOINT_URL")
 
@@ -2,6 +2,10 @@ import logging
 import re
 import asyncio
 import threading
+import time
+
+import eventlet
+
 from ....utils.web_scrapping.async_browser_manager import (
     AsyncBrowserManager,
 )
@@ -9,6 +13,10 @@ from ....utils.web_scrapping.async_browser_manager import (
 browser_task_queue = None
 event_loop = None
 
+# Set by the worker thread once its event loop and task queue exist.
+event_loop_ready = threading.Event()
+EVENT_LOOP_START_TIMEOUT = 10
+
 
 async def accept_cookies(page, cookies_consent_label, timeout=5000):
     try:
@@ -134,6 +142,7 @@ async def add_task(task_data, result_queue):
 async def browser_task_worker():
     global browser_task_queue
     browser_task_queue = asyncio.Queue()
+    event_loop_ready.set()
     browser_manager = AsyncBrowserManager()
     await browser_manager.initialize_browser()
 
@@ -171,11 +180,44 @@ def stop_event_loop():
 
 
 def add_task_sync(task_data, result_queue):
+    """
+    Queues a scraping task, its result is put in `result_queue`. Entry point of the browser worker,
+    which is started by the first task.
+    """
+    start_event_loop_thread()
     future = asyncio.run_coroutine_threadsafe(
         add_task(task_data, result_queue), event_loop
     )
     return future
 
 
-event_loop_thread = threading.Thread(target=start_event_loop)
-event_loop_thread.start()
+event_loop_thread = None
+event_loop_thread_lock = threading.Lock()
+
+
+def start_event_loop_thread(timeout=EVENT_LOOP_START_TIMEOUT):
+    """
+    Starts the browser worker on first use, so that Playwright is only launched
+    by processes actually scraping pages. A worker that stopped is started again.
+
+    Every caller waits until the event loop and the task queue of the worker exist.
+    Raises a RuntimeError if the worker stops or is not ready within `timeout` seconds.
+    """
+    global event_loop_thread
+    with event_loop_thread_lock:
+        if event_loop_thread is None or not event_loop_thread.is_alive():
+            event_loop_ready.clear()
+            event_loop_thread = threading.Thread(target=start_event_loop)
+            event_loop_thread.start()
+        thread = event_loop_thread
+
+    # Only sockets are monkey patched, a blocking wait on the event would block the eventlet hub.
+    deadline = time.monotonic() + timeout
+    while not event_loop_ready.is_set():
+        if not thread.is_alive() and not event_loop_ready.is_set():
+            raise RuntimeError("The browser task worker stopped before being ready")
+        if time.monotonic() >= deadline:
+            raise RuntimeError(
+                f"The browser task worker was not ready after {timeout} seconds"
+            )
+        eventlet.sleep(0.01)
@@ -1,24 +1,53 @@
+import hashlib
 import importlib
+import json
 import logging
-import os
 import pkgutil
-from cachetools import TTLCache, cached
+import time
+from typing import List, Optional, Tuple
+from cachetools import LRUCache, TTLCache, cached
 
 from ..processors.components.extension.extension_processor import (
     DynamicExtensionProcessor,
     ExtensionProcessor,
 )
+from ..processors.factory.processor_manifest import (
+    import_processor_class,
+    load_processor_manifest,
+)
+from ..env_config import get_extensions_blacklist, get_extensions_whitelist
 
 very_long_ttl_cache = 120000
 
-raw_blacklist = os.getenv("EXTENSIONS_BLACKLIST", "").strip()
-EXTENSIONS_BLACKLIST = raw_blacklist.split(",") if raw_blacklist else []
+DYNAMIC_EXTENSION_CONFIG_CACHE_SIZE = 256
 
-raw_whitelist = os.getenv("EXTENSIONS_WHITELIST", "").strip()
-EXTENSIONS_WHITELIST = raw_whitelist.split(",") if raw_whitelist else []
+# Extensions that failed to load, e.g. on an I/O error, are loaded again after this delay.
+EXTENSION_SCHEMAS_RETRY_SECONDS = 60
 
+_all_extension_schemas = None
+_all_extension_schemas_retry_at = None
+_extensions_catalogs = {}
+_dynamic_extension_classes = None
+_dynamic_extension_configs = LRUCache(maxsize=DYNAMIC_EXTENSION_CONFIG_CACHE_SIZE)
 
-def _load_dynamic_extension(processor_type, data):
+
+def _get_extension_manifest_entries():
+    manifest = load_processor_manifest()
+    if manifest is None:
+        return None
+    return manifest["processors"]
+
+
+def _index_dynamic_extension_classes():
+    manifest_entries = _get_extension_manifest_entries()
+    if manifest_entries is not None:
+        return {
+            processor_type: import_processor_class(entry)
+            for processor_type, entry in manifest_entries.items()
+            if entry["dynamic"]
+        }
+
+    classes = {}
     package = importlib.import_module("app.processors.components.extension")
     prefix = package.__name__ + "."
 
@@ -27,20 +56,40 @@ def _load_dynamic_extension(processor_type, data):
 
         for attribute_name in dir(module):
             attribute = getattr(module, attribute_name)
-            if isinstance(attribute, type) and issubclass(
+            if issubclass(type(attribute), type) and issubclass(
                 attribute, DynamicExtensionProcessor
             ):
                 if hasattr(attribute, "get_dynamic_node_config") and hasattr(
                     attribute, "processor_type"
                 ):
-                    if attribute.processor_type == processor_type:
-                        schema = attribute.get_dynamic_node_config(attribute, data)
-                        return schema
-    return None
+                    classes.setdefault(attribute.processor_type, attribute)
+    return classes
+
 
+def _get_dynamic_extension_class(processor_type):
+    global _dynamic_extension_classes
+    if _dynamic_extension_classes is None:
+        _dynamic_extension_classes = _index_dynamic_extension_classes()
+    return _dynamic_extension_classes.get(processor_type)
+
+
+def _load_dynamic_extension(processor_type, data):
+    attribute = _get_dynamic_extension_class(processor_type)
+    if attribute is None:
+        return None
+    return attribute.get_dynamic_node_config(attribute, data)
+
+
+def _load_all_extension_schemas() -> Tuple[list, bool]:
+    """
+    Returns the schemas of the extensions, and whether every extension was loaded.
+    """
+    manifest_entries = _get_extension_manifest_entries()
+    if manifest_entries is not None:
+        return _load_extension_schemas_from_manifest(manifest_entries)
 
-def _load_all_extension_schemas():
     schemas = []
+    complete = True
     package = importlib.import_module("app.processors.components.extension")
     prefix = package.__name__ + "."
 
@@ -50,7 +99,7 @@ def _load_all_extension_schemas():
         for attribute_name in dir(module):
             try:
                 attribute = getattr(module, attribute_name)
-                if isinstance(attribute, type) and issubclass(
+                if issubclass(type(attribute), type) and issubclass(
                     attribute, ExtensionProcessor
                 ):
                     if hasattr(attribute, "get_node_config"):
@@ -61,23 +110,65 @@ def _load_all_extension_schemas():
                 logging.warning(
                     f"Error loading extension {module_name}.{attribute_name}"
                 )
+                complete = False
                 continue
-    return schemas
+    return schemas, complete
 
 
-def filter_extensions(extensions):
-    if len(EXTENSIONS_WHITELIST) > 0:
-        extensions = [e for e in extensions if e.processorType in EXTENSIONS_WHITELIST]
-    if len(EXTENSIONS_BLACKLIST) > 0:
-        extensions = [
-            e for e in extensions if e.processorType not in EXTENSIONS_BLACKLIST
-        ]
+def _load_extension_schemas_from_manifest(manifest_entries):
+    schemas = []
+    complete = True
+    for processor_type, entry in manifest_entries.items():
+        if not entry["extension"]:
+            continue
+        try:
+            attribute = import_processor_class(entry)
+            schema = attribute.get_node_config(attribute)
+            if schema is not None:
+                schemas.append(schema)
+        except Exception as e:
+            logging.warning(f"Error loading extension {processor_type}")
+            complete = False
+            continue
+    return schemas, complete
+
+
+def _get_all_extension_schemas():
+    """
+    The extension schemas do not depend on the request, some of them require I/O to be built:
+    they are loaded once per process. When an extension failed to load, they are loaded again
+    after EXTENSION_SCHEMAS_RETRY_SECONDS, and the catalogs built from them are dropped.
+    """
+    global _all_extension_schemas, _all_extension_schemas_retry_at
+    if _all_extension_schemas is None or (
+        _all_extension_schemas_retry_at is not None
+        and time.monotonic() >= _all_extension_schemas_retry_at
+    ):
+        _all_extension_schemas, complete = _load_all_extension_schemas()
+        _all_extension_schemas_retry_at = (
+            None if complete else time.monotonic() + EXTENSION_SCHEMAS_RETRY_SECONDS
+        )
+        _extensions_catalogs.clear()
+    return _all_extension_schemas
+
+
+def filter_extensions(
+    extensions,
+    whitelist: Optional[List[str]] = None,
+    blacklist: Optional[List[str]] = None,
+):
+    whitelist = get_extensions_whitelist() if whitelist is None else whitelist
+    blacklist = get_extensions_blacklist() if blacklist is None else blacklist
+    if len(whitelist) > 0:
+        extensions = [e for e in extensions if e.processorType in whitelist]
+    if len(blacklist) > 0:
+        extensions = [e for e in extensions if e.processorType not in blacklist]
     return extensions
 
 
-def get_extensions():
-    schemas = _load_all_extension_schemas()
-    schemas = filter_extensions(schemas)
+def get_extensions(whitelist=None, blacklist=None):
+    schemas = _get_all_extension_schemas()
+    schemas = filter_extensions(schemas, whitelist, blacklist)
     schemas_dict = []
     for schema in schemas:
         if schema is not None:
@@ -85,6 +176,35 @@ def get_extensions():
     return schemas_dict
 
 
+def get_extensions_catalog() -> Tuple[str, bytes]:
+    """
+    Returns the ETag and the JSON body served by /node/extensions.
+
+    The body is serialized once and kept until the extensions whitelist or blacklist changes,
+    or until the extensions are loaded again.
+    """
+    _get_all_extension_schemas()
+    key = (tuple(get_extensions_whitelist()), tuple(get_extensions_blacklist()))
+    catalog = _extensions_catalogs.get(key)
+    if catalog is None:
+        extensions = get_extensions(list(key[0]), list(key[1]))
+        body = json.dumps({"extensions": extensions}).encode("utf-8")
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        catalog = (etag, body)
+        _extensions_catalogs.clear()
+        _extensions_catalogs[key] = catalog
+    return catalog
+
+
 def get_dynamic_extension_config(processor_type, data):
-    schema = _load_dynamic_extension(processor_type, data)
+    """
+    Returns the config of a dynamic extension for the given user choice. Configs are cached
+    by processor type and canonicalized data.
+    """
+    key = (processor_type, json.dumps(data, sort_keys=True, default=str))
+    schema = _dynamic_extension_configs.get(key)
+    if schema is None:
+        schema = _load_dynamic_extension(processor_type, data)
+        if schema is not None:
+            _dynamic_extension_configs[key] = schema
     return schema
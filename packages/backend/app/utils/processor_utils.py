@@ -106,3 +106,10 @@ def stream_download_file_as_binary(url):
         for chunk in response.iter_content(chunk_size=8192):
             chunks.append(chunk)
         return b"".join(chunks)
+
+
+def is_zero_temperature(temperature):
+    try:
+        return temperature is not None and float(temperature) == 0
+    except (TypeError, ValueError):
+        return False
@@ -1,3 +1,16 @@
 from PyInstaller.utils.hooks import collect_submodules
 
-hiddenimports = collect_submodules('app.processors')
\ No newline at end of file
+# SDKs loaded through lazy_import are invisible to the import analysis, they are bundled explicitly.
+LAZY_IMPORTED_PACKAGES = [
+    'openai',
+    'anthropic',
+    'replicate',
+    'pydub',
+    'youtube_transcript_api',
+    'boto3',
+    'langchain.document_loaders',
+]
+
+hiddenimports = collect_submodules('app.processors')
+for package in LAZY_IMPORTED_PACKAGES:
+    hiddenimports += collect_submodules(package)
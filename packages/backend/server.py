@@ -9,7 +9,6 @@ load_dotenv()
 from app.flask.socketio_init import flask_app, socketio
 import app.flask.sockets
 import app.flask.routes
-import app.tasks.single_thread_tasks.browser.async_browser_task
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+"""
+Benchmark of the Socket.IO encodings of the progress events.
+
+For a few typical outputs, reports the bytes sent per event (Socket.IO packet and binary attachments)
+and the CPU time needed to build and encode the packet, with the JSON encoding used by the UI and with
+the compact binary encoding.
+
+Usage (from packages/backend):
+    python -m tests.benchmarks.event_encoding_benchmark
+"""
+
+import timeit
+
+from socketio import packet
+
+from app.processors.launcher.processor_launcher_event import ProcessorLauncherEvent
+from app.processors.observer.event_encoding import to_binary_progress_frame
+from app.processors.observer.socketio_event_emitter import SocketIOEventEmitter
+
+NB_RUNS = 2000
+
+MARKDOWN = (
+    '## Résumé\n\nLe modèle a généré une réponse détaillée, avec des "citations" '
+    "et des listes :\n- élément\n- 項目\n\n"
+)
+
+OUTPUTS = {
+    "short text": ["Hello world"],
+    "4 KB markdown": [MARKDOWN * 40],
+    "200 KB markdown": [MARKDOWN * 2000],
+    "100 image URLs": [
+        f"https://bucket.s3.amazonaws.com/uploads/{i:08d}.png?X-Amz-Signature=abc"
+        for i in range(100)
+    ],
+}
+
+
+def encode_json(data):
+    return packet.Packet(
+        packet.EVENT, data=["progress", SocketIOEventEmitter.to_json(data)]
+    ).encode()
+
+
+def encode_binary(data):
+    return packet.Packet(
+        packet.EVENT, data=["progress", to_binary_progress_frame(data)]
+    ).encode()
+
+
+def get_size(encoded):
+    if not isinstance(encoded, list):
+        encoded = [encoded]
+    return sum(
+        len(part) if isinstance(part, bytes) else len(part.encode("utf-8"))
+        for part in encoded
+    )
+
+
+def measure(encode, data):
+    size = get_size(encode(data))
+    duration = timeit.timeit(lambda: encode(data), number=NB_RUNS) / NB_RUNS
+    return size, duration * 1e6
+
+
+def main():
+    print(
+        f"{'output':<16} {'json bytes':>11} {'binary bytes':>13} "
+        f"{'json µs':>9} {'binary µs':>10}"
+    )
+    for name, output in OUTPUTS.items():
+        data = ProcessorLauncherEvent(
+            instance_name="llm-prompt-1", output=output, isDone=True
+        )
+        json_size, json_time = measure(encode_json, data)
+        binary_size, binary_time = measure(encode_binary, data)
+        print(
+            f"{name:<16} {json_size:>11} {binary_size:>13} "
+            f"{json_time:>9.1f} {binary_time:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Import-time report of the backend startup, based on `python -X importtime`.
+
+Imports the given module (the server entry point by default) in a fresh interpreter, then prints
+the total import time and the slowest top-level packages. Exits with status 1 when the total
+exceeds the budget, so it can be used to keep the startup time under control.
+
+Usage (from packages/backend):
+    python -m tests.benchmarks.import_time_report [--module server] [--budget-ms 1500] [--top 15]
+"""
+
+import argparse
+from collections import defaultdict
+import re
+import subprocess
+import sys
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure_import_times(module: str):
+    """Returns the self and cumulative import times, in microseconds, of every imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}:\n{result.stderr}")
+
+    times = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            times.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return times
+
+
+def summarize_by_package(times):
+    totals = defaultdict(int)
+    for name, self_us, cumulative_us, depth in times:
+        totals[name.split(".")[0]] += self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="server")
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    times = measure_import_times(args.module)
+    total_ms = sum(cumulative_us for _, _, cumulative_us, depth in times if depth == 0)
+    total_ms /= 1000
+
+    print(f"Importing '{args.module}' took {total_ms:.0f} ms")
+    print("\nSlowest top-level packages (self time):")
+    for package, self_us in summarize_by_package(times)[: args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nOver budget: {total_ms:.0f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Memory benchmark of the runtime representation of a flow.
+
+Builds the processors, DAG nodes and launcher events of a chained flow, then reports the memory
+allocated per node, with the previous representation (reproduced below) and the current one:
+    - previous: per-node Semaphore, dataclass events holding a processor reference, observer
+      lists, fields copied on every processor, tuple input edges.
+    - current: slotted nodes, events and input edges, no per-node lock.
+
+Usage (from packages/backend):
+    python -m tests.benchmarks.node_memory_benchmark
+"""
+
+from dataclasses import dataclass, field
+import gc
+import tracemalloc
+from typing import Any, List
+
+from eventlet.semaphore import Semaphore
+
+from app.processors.components.processor import BasicProcessor, InputEdge
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from app.processors.launcher.processor_launcher_event import ProcessorLauncherEvent
+
+NB_NODES = 500
+NB_FIELDS = 10
+
+
+class BenchmarkProcessor(BasicProcessor):
+    processor_type = "benchmark_processor"
+
+    def process(self):
+        return self.name
+
+
+class LegacyBenchmarkProcessor(BenchmarkProcessor):
+    fields = None
+    fields_names = None
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.observers = []
+        self.fields = config["config"]["fields"]
+        self.fields_names = [field["name"] for field in self.fields]
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+
+    def add_input_processor(self, input_processor):
+        self.input_processors.append(input_processor)
+        input = self.inputs[len(self.input_processors) - 1]
+        self._inputs_by_name.setdefault(
+            input["inputName"], (input_processor, input["inputNodeOutputKey"])
+        )
+
+
+class LegacyNode:
+    def __init__(self, id: str, parent_ids: List[str], processor):
+        self.id = id
+        self.parent_ids = parent_ids
+        self.state = AsyncProcessorLauncher.NodeState.PENDING
+        self.output = None
+        self.processor = processor
+        self.provider = processor.provider
+        self.runs_inline = processor.runs_inline
+        self.lock = Semaphore(1)
+
+
+@dataclass
+class LegacyProcessorLauncherEvent:
+    instance_name: str
+    user_id: int = field(default=None)
+    output: Any = field(default=None)
+    processor_type: str = field(default=None)
+    processor: Any = field(default=None)
+    isDone: bool = field(default=False)
+    error: str = field(default=None)
+    session_id: str = field(default=None)
+    duration: float = field(default=0)
+
+
+def create_configs():
+    configs = []
+    for i in range(NB_NODES):
+        configs.append(
+            {
+                "name": f"node-{i}",
+                "processorType": BenchmarkProcessor.processor_type,
+                "config": {
+                    "fields": [{"name": f"field_{j}"} for j in range(NB_FIELDS)]
+                },
+                "inputs": (
+                    [
+                        {
+                            "inputName": "field_0",
+                            "inputNode": f"node-{i - 1}",
+                            "inputNodeOutputKey": 0,
+                        }
+                    ]
+                    if i > 0
+                    else []
+                ),
+            }
+        )
+    return configs
+
+
+def build_runtime(configs, processor_class, node_class, event_class, with_processor):
+    observer = object()
+    processors = {}
+    for config in configs:
+        processor = processor_class(config)
+        processor.add_observer(observer)
+        processors[processor.name] = processor
+
+    for i, processor in enumerate(processors.values()):
+        if i > 0:
+            processor.add_input_processor(processors[f"node-{i - 1}"])
+
+    nodes = {
+        name: node_class(
+            name, [input["inputNode"] for input in processor.inputs or []], processor
+        )
+        for name, processor in processors.items()
+    }
+
+    events = []
+    for processor in processors.values():
+        for _ in range(2):
+            kwargs = {"processor": processor} if with_processor else {}
+            events.append(
+                event_class(
+                    instance_name=processor.name,
+                    processor_type=processor.processor_type,
+                    session_id="session",
+                    **kwargs,
+                )
+            )
+    return processors, nodes, events
+
+
+def measure(configs, *args) -> float:
+    gc.collect()
+    tracemalloc.start()
+    runtime = build_runtime(configs, *args)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del runtime
+    return allocated / NB_NODES
+
+
+def main():
+    configs = create_configs()
+    legacy = measure(
+        configs,
+        LegacyBenchmarkProcessor,
+        LegacyNode,
+        LegacyProcessorLauncherEvent,
+        True,
+    )
+    current = measure(
+        configs,
+        BenchmarkProcessor,
+        AsyncProcessorLauncher.Node,
+        ProcessorLauncherEvent,
+        False,
+    )
+
+    print(
+        f"Runtime memory of a {NB_NODES}-node flow (processors, nodes, 2 events/node):"
+    )
+    print(f"  previous representation : {legacy:8.0f} bytes per node")
+    print(f"  slotted representation  : {current:8.0f} bytes per node")
+    print(f"  saved                   : {(1 - current / legacy) * 100:.0f}%")
+    print(f"  InputEdge size          : {InputEdge.__basicsize__} bytes")
+
+
+if __name__ == "__main__":
+    main()
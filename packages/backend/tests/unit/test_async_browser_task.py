@@ -0,0 +1,58 @@
+import asyncio
+import queue
+import threading
+import unittest
+from unittest.mock import patch
+
+from app.tasks.single_thread_tasks.browser import async_browser_task
+
+
+class FakeAsyncBrowserManager:
+    async def initialize_browser(self):
+        pass
+
+
+async def fake_scrapping_task(task_data, browser_manager):
+    return task_data["url"]
+
+
+class TestAsyncBrowserTask(unittest.TestCase):
+    def tearDown(self):
+        thread = async_browser_task.event_loop_thread
+        if thread is not None and thread.is_alive():
+            event_loop = async_browser_task.event_loop
+            async_browser_task.add_task_sync(None, None).result(5)
+            # The worker exits, then the loop runs forever until stopped.
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), event_loop).result(5)
+            event_loop.call_soon_threadsafe(event_loop.stop)
+            thread.join(5)
+        async_browser_task.event_loop_thread = None
+
+    @patch.object(async_browser_task, "scrapping_task", fake_scrapping_task)
+    @patch.object(async_browser_task, "AsyncBrowserManager", FakeAsyncBrowserManager)
+    def test_concurrent_first_tasks_wait_for_the_worker(self):
+        results = queue.Queue()
+        errors = []
+
+        def add_task(index):
+            try:
+                async_browser_task.add_task_sync({"url": f"url-{index}"}, results)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=add_task, args=(i,)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(errors, [])
+        self.assertCountEqual(
+            [results.get(timeout=5) for _ in range(5)],
+            [f"url-{i}" for i in range(5)],
+        )
+
+    def test_worker_stopping_before_being_ready_raises(self):
+        with patch.object(async_browser_task, "start_event_loop", lambda: None):
+            with self.assertRaisesRegex(RuntimeError, "stopped before being ready"):
+                async_browser_task.start_event_loop_thread(timeout=5)
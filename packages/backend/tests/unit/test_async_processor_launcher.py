@@ -0,0 +1,366 @@
+import time
+import unittest
+
+from unittest.mock import Mock
+
+import eventlet
+
+from app.processors.components.processor import BasicProcessor
+from app.processors.exceptions import InvalidFlowException
+from app.processors.factory.processor_factory_iter_modules import (
+    ProcessorFactoryIterModules,
+)
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from app.processors.launcher.concurrency_limits import ConcurrencyLimits
+from app.processors.launcher.event_type import EventType
+from app.processors.launcher.execution_mode import ExecutionMode
+from app.processors.observer.observer import Observer
+from tests.utils.processor_context_mock import ProcessorContextMock
+
+
+class PassThroughProcessor(BasicProcessor):
+    processor_type = "pass_through_processor"
+
+    def process(self):
+        return self.name
+
+
+class FailingProcessor(BasicProcessor):
+    processor_type = "failing_processor"
+
+    def process(self):
+        raise Exception("Failing processor error")
+
+
+class SlowProviderProcessor(BasicProcessor):
+    processor_type = "slow_provider_processor"
+    provider = "slow_provider"
+    nb_running = 0
+    max_running = 0
+
+    def process(self):
+        SlowProviderProcessor.nb_running += 1
+        SlowProviderProcessor.max_running = max(
+            SlowProviderProcessor.max_running, SlowProviderProcessor.nb_running
+        )
+        eventlet.sleep(0.01)
+        SlowProviderProcessor.nb_running -= 1
+        return self.name
+
+
+class HangingProcessor(BasicProcessor):
+    processor_type = "hanging_processor"
+    cancelled = []
+
+    def process(self):
+        eventlet.sleep(10)
+        return self.name
+
+    def cancel(self):
+        HangingProcessor.cancelled.append(self.name)
+
+
+class InlineProcessor(BasicProcessor):
+    processor_type = "inline_processor"
+    runs_inline = True
+
+    def process(self):
+        return self.name
+
+
+class ReadingProcessor(BasicProcessor):
+    processor_type = "reading_processor"
+    read_outputs = {}
+
+    def process(self):
+        eventlet.sleep(0)
+        ReadingProcessor.read_outputs[self.name] = [
+            input_processor.get_output() for input_processor in self.input_processors
+        ]
+        return self.name
+
+
+class StreamingProcessor(BasicProcessor):
+    processor_type = "streaming_processor"
+
+    def process(self):
+        chunks = ["Hello", ", ", "world"]
+        for chunk in chunks:
+            self.notify_stream_delta(chunk)
+        return "".join(chunks)
+
+
+class RecordingObserver(Observer):
+    def __init__(self):
+        self.events = []
+        self.deltas = []
+
+    def notify(self, event, data):
+        self.events.append((event, data.instance_name))
+        if event == EventType.STREAMING_DELTA.value:
+            self.deltas.append((data.output, data.sequence))
+
+    def names_for(self, event_type: EventType):
+        return [name for event, name in self.events if event == event_type.value]
+
+
+def create_node(name, processor_type="pass_through_processor", parents=None):
+    return {
+        "name": name,
+        "processorType": processor_type,
+        "inputs": [{"inputNode": parent} for parent in (parents or [])],
+    }
+
+
+class TestAsyncProcessorLauncher(unittest.TestCase):
+    def setUp(self):
+        factory = ProcessorFactoryIterModules()
+        factory.register_processor(
+            PassThroughProcessor.processor_type, PassThroughProcessor
+        )
+        factory.register_processor(FailingProcessor.processor_type, FailingProcessor)
+        factory.register_processor(
+            SlowProviderProcessor.processor_type, SlowProviderProcessor
+        )
+        factory.register_processor(InlineProcessor.processor_type, InlineProcessor)
+        factory.register_processor(HangingProcessor.processor_type, HangingProcessor)
+        factory.register_processor(ReadingProcessor.processor_type, ReadingProcessor)
+        factory.register_processor(
+            StreamingProcessor.processor_type, StreamingProcessor
+        )
+        HangingProcessor.cancelled = []
+        ReadingProcessor.read_outputs = {}
+
+        self.observer = RecordingObserver()
+        self.launcher = AsyncProcessorLauncher(factory, None, [self.observer])
+        self.launcher.set_context(ProcessorContextMock(""))
+
+    def launch(self, config_data):
+        processors = self.launcher.load_processors(config_data)
+        self.launcher.launch_processors(processors)
+        return processors
+
+    def test_layered_flow_runs_without_polling_delay(self):
+        config_data = [create_node("layer-0")]
+        for i in range(1, 10):
+            config_data.append(create_node(f"layer-{i}", parents=[f"layer-{i-1}"]))
+
+        start_time = time.time()
+        self.launch(config_data)
+        duration = time.time() - start_time
+
+        self.assertLess(duration, 0.5)
+        self.assertEqual(
+            self.observer.names_for(EventType.PROGRESS),
+            [config["name"] for config in config_data],
+        )
+
+    def test_node_with_multiple_parents_waits_for_all_of_them(self):
+        config_data = [
+            create_node("merge", parents=["left", "right", "right"]),
+            create_node("left"),
+            create_node("right", parents=["root"]),
+            create_node("root"),
+        ]
+
+        processors = self.launch(config_data)
+
+        progress = self.observer.names_for(EventType.PROGRESS)
+        self.assertEqual(len(progress), 4)
+        self.assertEqual(progress[-1], "merge")
+        self.assertLess(progress.index("root"), progress.index("right"))
+        self.assertEqual(processors["merge"].get_output(), ["merge"])
+
+    def test_cyclic_flow_is_rejected_before_instantiating_processors(self):
+        config_data = [
+            create_node("a", parents=["b"]),
+            create_node("b", parents=["a"]),
+        ]
+        self.launcher.processor_factory.create_processor = Mock()
+
+        with self.assertRaises(InvalidFlowException):
+            self.launcher.load_processors(config_data)
+
+        self.launcher.processor_factory.create_processor.assert_not_called()
+
+    def test_error_stops_spawning_descendants(self):
+        config_data = [
+            create_node("root"),
+            create_node("failing", "failing_processor", parents=["root"]),
+            create_node("child", parents=["failing"]),
+        ]
+
+        self.launch(config_data)
+
+        self.assertEqual(self.observer.names_for(EventType.PROGRESS), ["root"])
+        self.assertEqual(self.observer.names_for(EventType.ERROR), ["failing"])
+
+    def test_error_cancels_nodes_in_flight(self):
+        config_data = [
+            create_node("root", "inline_processor"),
+            create_node("hanging", "hanging_processor", parents=["root"]),
+            create_node("hanging-child", parents=["hanging"]),
+            create_node("failing", "failing_processor", parents=["root"]),
+        ]
+
+        start_time = time.time()
+        self.launch(config_data)
+        duration = time.time() - start_time
+
+        self.assertLess(duration, 1)
+        self.assertEqual(HangingProcessor.cancelled, ["hanging"])
+        self.assertEqual(self.observer.names_for(EventType.PROGRESS), ["root"])
+        report = self.launcher.get_run_report()
+        self.assertEqual(report["cancelledNodes"], ["hanging"])
+        self.assertEqual(report["notStartedNodes"], ["hanging-child"])
+
+    def test_cancel_stops_a_running_flow(self):
+        config_data = [
+            create_node("hanging", "hanging_processor"),
+            create_node("child", parents=["hanging"]),
+        ]
+        processors = self.launcher.load_processors(config_data)
+
+        eventlet.spawn_after(0.05, self.launcher.cancel)
+        start_time = time.time()
+        self.launcher.launch_processors(processors)
+        duration = time.time() - start_time
+
+        self.assertLess(duration, 1)
+        self.assertEqual(HangingProcessor.cancelled, ["hanging"])
+        self.assertEqual(self.observer.names_for(EventType.PROGRESS), [])
+        report = self.launcher.get_run_report()
+        self.assertEqual(report["cancelledNodes"], ["hanging"])
+        self.assertEqual(report["notStartedNodes"], ["child"])
+
+    def test_continue_on_error_runs_unaffected_branches(self):
+        self.launcher.set_execution_mode(ExecutionMode.CONTINUE_ON_ERROR)
+        config_data = [
+            create_node("root", "inline_processor"),
+            create_node("failing", "failing_processor", parents=["root"]),
+            create_node("failing-child", parents=["failing"]),
+            create_node("merge", parents=["failing-child", "branch"]),
+            create_node("branch", "slow_provider_processor", parents=["root"]),
+            create_node("branch-child", parents=["branch"]),
+        ]
+
+        self.launch(config_data)
+
+        self.assertCountEqual(
+            self.observer.names_for(EventType.PROGRESS),
+            ["root", "branch", "branch-child"],
+        )
+        self.assertEqual(
+            self.launcher.get_run_report()["nodes"],
+            {
+                "root": "success",
+                "failing": "error",
+                "failing-child": "skipped",
+                "merge": "skipped",
+                "branch": "success",
+                "branch-child": "success",
+            },
+        )
+
+    def test_outputs_are_released_once_every_consumer_has_read_them(self):
+        config_data = [
+            create_node("root"),
+            create_node("left", "reading_processor", parents=["root"]),
+            create_node("right", "reading_processor", parents=["root"]),
+            create_node("merge", "reading_processor", parents=["left", "right"]),
+        ]
+
+        processors = self.launch(config_data)
+
+        self.assertEqual(
+            ReadingProcessor.read_outputs,
+            {
+                "left": [["root"]],
+                "right": [["root"]],
+                "merge": [["left"], ["right"]],
+            },
+        )
+        self.assertIsNone(processors["root"].get_output())
+        self.assertIsNone(processors["left"].get_output())
+        self.assertIsNone(processors["right"].get_output())
+        self.assertEqual(processors["merge"].get_output(), ["merge"])
+        self.assertEqual(len(self.observer.names_for(EventType.PROGRESS)), 4)
+
+    def test_streamed_text_is_sent_as_deltas_then_as_full_output(self):
+        processors = self.launch([create_node("answer", "streaming_processor")])
+
+        self.assertEqual(self.observer.deltas, [("Hello", 1), (", ", 2), ("world", 3)])
+        self.assertEqual(self.observer.events[-1], (EventType.PROGRESS.value, "answer"))
+        self.assertEqual(processors["answer"].get_output(), ["Hello, world"])
+
+    def test_provider_limit_caps_parallel_nodes_of_this_provider(self):
+        SlowProviderProcessor.max_running = 0
+        self.launcher.set_concurrency_limits(
+            ConcurrencyLimits(max_concurrency=10, provider_limits={"slow_provider": 2})
+        )
+        config_data = [create_node("root", "inline_processor")]
+        for i in range(6):
+            config_data.append(
+                create_node(f"branch-{i}", "slow_provider_processor", parents=["root"])
+            )
+
+        self.launch(config_data)
+
+        self.assertEqual(SlowProviderProcessor.max_running, 2)
+        self.assertEqual(len(self.observer.names_for(EventType.PROGRESS)), 7)
+
+    def test_run_node_runs_missing_ancestors_concurrently(self):
+        SlowProviderProcessor.max_running = 0
+        already_run = create_node("already-run")
+        already_run["outputData"] = ["previous output"]
+        config_data = [
+            already_run,
+            create_node("fetch-a", "slow_provider_processor", parents=["already-run"]),
+            create_node("fetch-b", "slow_provider_processor"),
+            create_node("merge", parents=["fetch-a", "fetch-b"]),
+            create_node("unrelated"),
+        ]
+
+        processors = self.launcher.load_processors_for_node(config_data, "merge")
+        self.launcher.launch_processors_for_node(processors, "merge")
+
+        self.assertEqual(SlowProviderProcessor.max_running, 2)
+        progress = self.observer.names_for(EventType.PROGRESS)
+        self.assertCountEqual(progress, ["fetch-a", "fetch-b", "merge"])
+        self.assertEqual(progress[-1], "merge")
+
+    def test_run_node_raises_the_node_error(self):
+        config_data = [
+            create_node("failing", "failing_processor"),
+            create_node("target", parents=["failing"]),
+        ]
+
+        processors = self.launcher.load_processors_for_node(config_data, "target")
+
+        with self.assertRaises(Exception):
+            self.launcher.launch_processors_for_node(processors, "target")
+        self.assertEqual(self.observer.names_for(EventType.ERROR), ["failing"])
+
+
+class TestExecutionMode(unittest.TestCase):
+    def test_unknown_mode_is_rejected(self):
+        self.assertEqual(
+            ExecutionMode.from_value("continue_on_error"),
+            ExecutionMode.CONTINUE_ON_ERROR,
+        )
+        with self.assertRaises(ValueError):
+            ExecutionMode.from_value("best_effort")
+
+
+class TestConcurrencyLimits(unittest.TestCase):
+    def test_flow_overrides_are_capped_by_server_limits(self):
+        limits = ConcurrencyLimits(max_concurrency=20, provider_limits={"openai": 10})
+
+        overridden = limits.with_overrides(
+            {"maxConcurrency": 50, "providerLimits": {"openai": 3, "anthropic": 100}}
+        )
+
+        self.assertEqual(overridden.max_concurrency, 20)
+        self.assertEqual(overridden.get_provider_limit("openai"), 3)
+        self.assertEqual(overridden.get_provider_limit("anthropic"), 20)
+        self.assertIsNone(overridden.get_provider_limit(None))
@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import Mock
+
+from app.processors.launcher.event_type import EventType
+from app.processors.launcher.processor_launcher_event import ProcessorLauncherEvent
+from app.processors.observer.event_encoding import (
+    BINARY_ATTACHMENT_MIN_BYTES,
+    EventEncoding,
+    decode_payload,
+    encode_payload,
+)
+from app.processors.observer.socketio_event_emitter import SocketIOEventEmitter
+
+
+class TestEventEncoding(unittest.TestCase):
+    def test_small_values_are_kept_as_json_values(self):
+        self.assertEqual(encode_payload("short"), "short")
+        self.assertEqual(encode_payload(["a", "b"]), ["a", "b"])
+        self.assertIsNone(encode_payload(None))
+
+    def test_large_values_are_sent_as_bytes(self):
+        text = "é" * BINARY_ATTACHMENT_MIN_BYTES
+        output = [text, {"url": "https://example.com"}]
+
+        encoded_text = encode_payload(text)
+        encoded_output = encode_payload(output)
+
+        self.assertIsInstance(encoded_text, bytes)
+        self.assertIsInstance(encoded_output, bytes)
+        self.assertEqual(decode_payload(encoded_text), text)
+        self.assertEqual(decode_payload(encoded_output), output)
+
+    def test_large_text_lists_are_sent_as_bytes(self):
+        output = ["a" * BINARY_ATTACHMENT_MIN_BYTES, "", "ü"]
+
+        encoded = encode_payload(output)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(decode_payload(encoded), output)
+
+    def test_threshold_is_a_number_of_utf8_bytes(self):
+        half = BINARY_ATTACHMENT_MIN_BYTES // 2
+
+        self.assertIsInstance(encode_payload("é" * half), bytes)
+        self.assertIsInstance(encode_payload(["é" * half]), bytes)
+        self.assertEqual(encode_payload("é" * (half - 1)), "é" * (half - 1))
+
+    def test_unknown_encoding_is_rejected(self):
+        self.assertEqual(EventEncoding.from_value(None), EventEncoding.JSON)
+        with self.assertRaises(ValueError):
+            EventEncoding.from_value("xml")
+
+
+class TestSocketIOEventEmitterEncoding(unittest.TestCase):
+    def setUp(self):
+        self.socketio = Mock()
+        self.emitter = SocketIOEventEmitter(self.socketio)
+
+    def create_event(self, session_id, output, event_encoding=None):
+        return ProcessorLauncherEvent(
+            instance_name="node",
+            output=output,
+            session_id=session_id,
+            event_encoding=event_encoding,
+            isDone=True,
+        )
+
+    def test_json_clients_receive_dicts(self):
+        self.emitter.notify(
+            EventType.PROGRESS.value, self.create_event("json-client", ["out"])
+        )
+
+        self.socketio.emit.assert_called_once_with(
+            "progress",
+            {"instanceName": "node", "output": ["out"], "isDone": True},
+            to="json-client",
+        )
+
+    def test_binary_clients_receive_compact_frames(self):
+        output = ["x" * BINARY_ATTACHMENT_MIN_BYTES]
+
+        self.emitter.notify(
+            EventType.PROGRESS.value,
+            self.create_event("binary-client", output, EventEncoding.BINARY.value),
+        )
+
+        event, frame = self.socketio.emit.call_args.args
+        self.assertEqual(event, "progress")
+        self.assertEqual(frame[:2], ["node", True])
+        self.assertEqual(decode_payload(frame[2]), output)
+
+    def test_errors_stay_json_for_binary_clients(self):
+        event = ProcessorLauncherEvent(
+            instance_name="node",
+            error="failed",
+            session_id="binary-client",
+            event_encoding=EventEncoding.BINARY.value,
+        )
+
+        self.emitter.notify(EventType.ERROR.value, event)
+
+        self.assertEqual(
+            self.socketio.emit.call_args.args[1],
+            {"instanceName": "node", "isDone": False, "error": "failed"},
+        )
@@ -0,0 +1,136 @@
+import unittest
+
+from app.processors.exceptions import InvalidFlowException
+from app.processors.launcher.flow_graph import FlowGraph
+from app.processors.launcher.flow_validation import validate_flow_graph
+
+
+def create_node(name, parents=None):
+    return {
+        "name": name,
+        "processorType": "input-text",
+        "inputs": [{"inputNode": parent} for parent in (parents or [])],
+    }
+
+
+class TestFlowGraph(unittest.TestCase):
+    def setUp(self):
+        self.config_data = [
+            create_node("merge", parents=["left", "right"]),
+            create_node("left", parents=["root"]),
+            create_node("right", parents=["root", "root"]),
+            create_node("root"),
+            create_node("display", parents=["merge"]),
+            create_node("unrelated"),
+        ]
+        self.graph = FlowGraph(self.config_data)
+
+    def test_adjacency(self):
+        self.assertEqual(self.graph.get_node("root"), self.config_data[3])
+        self.assertIsNone(self.graph.get_node("missing"))
+        self.assertEqual(self.graph.get_parents("right"), ["root"])
+        self.assertCountEqual(self.graph.get_children("root"), ["left", "right"])
+
+    def test_ancestors_and_descendants(self):
+        self.assertCountEqual(
+            self.graph.get_ancestors("merge"), ["left", "right", "root"]
+        )
+        self.assertCountEqual(
+            self.graph.get_descendants("root"), ["left", "right", "merge", "display"]
+        )
+        self.assertEqual(self.graph.get_ancestors("unrelated"), [])
+
+    def test_topological_order_puts_parents_first(self):
+        order = self.graph.get_topological_order()
+
+        self.assertCountEqual(order, [config["name"] for config in self.config_data])
+        for name in order:
+            for parent in self.graph.get_parents(name):
+                self.assertLess(order.index(parent), order.index(name))
+
+    def test_subgraph_config_data_contains_node_and_ancestors_parents_first(self):
+        names = [
+            config["name"] for config in self.graph.get_subgraph_config_data("merge")
+        ]
+
+        self.assertEqual(names[0], "root")
+        self.assertEqual(names[-1], "merge")
+        self.assertCountEqual(names, ["root", "left", "right", "merge"])
+        self.assertEqual(self.graph.get_subgraph_config_data("missing"), [])
+
+    def test_long_chain_ancestors(self):
+        config_data = [create_node("node-0")] + [
+            create_node(f"node-{i}", parents=[f"node-{i-1}"]) for i in range(1, 2000)
+        ]
+
+        graph = FlowGraph(config_data)
+
+        self.assertEqual(len(graph.get_ancestors("node-1999")), 1999)
+        self.assertEqual(
+            graph.get_subgraph_config_data("node-1999")[0]["name"], "node-0"
+        )
+
+    def test_from_parents_ignores_parents_outside_the_graph(self):
+        graph = FlowGraph.from_parents(
+            {"b": ["a", "done"], "a": ["done"], "c": ["b", "a"]}
+        )
+
+        self.assertEqual(graph.get_topological_order(), ["a", "b", "c"])
+        self.assertEqual(graph.get_parents("c"), ["b", "a"])
+
+
+class TestFlowValidation(unittest.TestCase):
+    def test_valid_flow_passes(self):
+        graph = FlowGraph([create_node("a"), create_node("b", parents=["a"])])
+
+        validate_flow_graph(graph)
+
+    def test_cycle_is_rejected_with_its_path(self):
+        graph = FlowGraph(
+            [
+                create_node("root"),
+                create_node("a", parents=["root", "c"]),
+                create_node("b", parents=["a"]),
+                create_node("c", parents=["b"]),
+            ]
+        )
+
+        with self.assertRaises(InvalidFlowException) as context:
+            validate_flow_graph(graph)
+
+        self.assertIn("a -> b -> c -> a", str(context.exception))
+        self.assertEqual(graph.find_cycle(["root"]), None)
+
+    def test_self_loop_is_rejected(self):
+        graph = FlowGraph([create_node("a", parents=["a"])])
+
+        self.assertEqual(graph.find_cycle(), ["a", "a"])
+
+    def test_dangling_input_is_rejected(self):
+        graph = FlowGraph([create_node("a", parents=["missing"])])
+
+        with self.assertRaises(InvalidFlowException) as context:
+            validate_flow_graph(graph)
+
+        self.assertIn("'missing'", str(context.exception))
+
+    def test_output_key_out_of_declared_outputs_only_logs_a_warning(self):
+        splitter = create_node("splitter")
+        splitter["nbOutput"] = 2
+        child = create_node("child")
+        child["inputs"] = [{"inputNode": "splitter", "inputNodeOutputKey": 2}]
+
+        with self.assertLogs(level="WARNING") as logs:
+            validate_flow_graph(FlowGraph([splitter, child]))
+        self.assertIn("out of range", logs.output[0])
+
+        child["inputs"] = [{"inputNode": "splitter", "inputNodeOutputKey": -1}]
+        with self.assertRaises(InvalidFlowException):
+            validate_flow_graph(FlowGraph([splitter, child]))
+
+        child["inputs"] = [{"inputNode": "splitter", "inputNodeOutputKey": 1}]
+        validate_flow_graph(FlowGraph([splitter, child]))
+
+    def test_duplicate_node_name_is_rejected(self):
+        with self.assertRaises(InvalidFlowException):
+            validate_flow_graph(FlowGraph([create_node("a"), create_node("a")]))
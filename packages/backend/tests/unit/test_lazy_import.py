@@ -0,0 +1,20 @@
+import sys
+import unittest
+
+from app.utils.lazy_import import lazy_import
+
+
+class TestLazyImport(unittest.TestCase):
+    def setUp(self):
+        sys.modules.pop("mailbox", None)
+
+    def test_module_is_executed_on_first_attribute_access(self):
+        mailbox = lazy_import("mailbox")
+
+        self.assertEqual(type(mailbox).__name__, "_LazyModule")
+        self.assertTrue(callable(mailbox.Maildir))
+        self.assertIs(sys.modules["mailbox"], mailbox)
+
+    def test_missing_module_is_reported_at_import(self):
+        with self.assertRaises(ModuleNotFoundError):
+            lazy_import("not_an_installed_sdk")
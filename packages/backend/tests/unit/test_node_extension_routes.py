@@ -0,0 +1,138 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+
+from app.flask.app_routes.node_routes import node_blueprint
+from app.processors.components.node_config_builder import NodeConfigBuilder
+import app.utils.node_extension_utils as node_extension_utils
+
+
+def create_schema(processor_type):
+    return (
+        NodeConfigBuilder()
+        .set_node_name(processor_type)
+        .set_processor_type(processor_type)
+        .set_icon("FaFile")
+        .set_section("tools")
+        .set_output_type("text")
+        .build()
+    )
+
+
+class FakeDynamicExtension:
+    processor_type = "fake-dynamic-processor"
+    nb_calls = 0
+
+    def get_dynamic_node_config(self, data):
+        FakeDynamicExtension.nb_calls += 1
+        return create_schema(f"{self.processor_type}-{data['method']}")
+
+
+class TestNodeExtensionRoutes(unittest.TestCase):
+    def setUp(self):
+        node_extension_utils._all_extension_schemas = None
+        node_extension_utils._all_extension_schemas_retry_at = None
+        node_extension_utils._extensions_catalogs.clear()
+        node_extension_utils._dynamic_extension_classes = None
+        node_extension_utils._dynamic_extension_configs.clear()
+        patcher = patch.object(
+            node_extension_utils,
+            "_load_all_extension_schemas",
+            return_value=([create_schema("first"), create_schema("second")], True),
+        )
+        self.load_all_extension_schemas = patcher.start()
+        self.addCleanup(patcher.stop)
+        env_patcher = patch.dict(os.environ, {"EXTENSIONS_WHITELIST": ""})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+        app = Flask(__name__)
+        app.register_blueprint(node_blueprint)
+        self.client = app.test_client()
+
+    def get_processor_types(self, response):
+        return [extension["processorType"] for extension in response.json["extensions"]]
+
+    def test_catalog_is_built_once_and_revalidated_with_etag(self):
+        response = self.client.get("/node/extensions")
+        etag = response.headers["ETag"]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_processor_types(response), ["first", "second"])
+
+        response = self.client.get("/node/extensions", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+        self.load_all_extension_schemas.assert_called_once()
+
+    def test_weak_etag_is_revalidated(self):
+        etag = self.client.get("/node/extensions").headers["ETag"]
+
+        response = self.client.get(
+            "/node/extensions", headers={"If-None-Match": f"W/{etag}"}
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_extensions_are_loaded_again_after_a_failure(self):
+        self.load_all_extension_schemas.return_value = ([create_schema("first")], False)
+        etag = self.client.get("/node/extensions").headers["ETag"]
+        self.load_all_extension_schemas.return_value = (
+            [create_schema("first"), create_schema("second")],
+            True,
+        )
+
+        response = self.client.get("/node/extensions", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        node_extension_utils._all_extension_schemas_retry_at = 0
+        response = self.client.get("/node/extensions", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_processor_types(response), ["first", "second"])
+        self.assertIsNone(node_extension_utils._all_extension_schemas_retry_at)
+        self.assertEqual(self.load_all_extension_schemas.call_count, 2)
+
+    def test_whitelist_change_invalidates_the_catalog(self):
+        etag = self.client.get("/node/extensions").headers["ETag"]
+
+        with patch.dict(os.environ, {"EXTENSIONS_WHITELIST": "second"}):
+            response = self.client.get(
+                "/node/extensions", headers={"If-None-Match": etag}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_processor_types(response), ["second"])
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.load_all_extension_schemas.assert_called_once()
+
+    def test_dynamic_configs_are_indexed_and_cached(self):
+        FakeDynamicExtension.nb_calls = 0
+        with patch.object(
+            node_extension_utils,
+            "_index_dynamic_extension_classes",
+            return_value={FakeDynamicExtension.processor_type: FakeDynamicExtension},
+        ) as index_dynamic_extension_classes:
+            for data in [
+                {"method": "edit", "size": "auto"},
+                {"size": "auto", "method": "edit"},
+                {"method": "generate", "size": "auto"},
+            ]:
+                response = self.client.post(
+                    "/node/extensions/dynamic",
+                    json={
+                        "processorType": FakeDynamicExtension.processor_type,
+                        "data": data,
+                    },
+                )
+                self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            response.json["processorType"], "fake-dynamic-processor-generate"
+        )
+        self.assertEqual(FakeDynamicExtension.nb_calls, 2)
+        index_dynamic_extension_classes.assert_called_once()
@@ -0,0 +1,175 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.processors.cache.memory_node_output_cache import MemoryNodeOutputCache
+from app.processors.cache.redis_node_output_cache import RedisNodeOutputCache
+from app.processors.cache.sqlite_node_output_cache import SqliteNodeOutputCache
+from app.processors.cache.node_output_cache_key import build_node_output_cache_key
+from app.processors.components.processor import BasicProcessor
+from app.processors.factory.processor_factory_iter_modules import (
+    ProcessorFactoryIterModules,
+)
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from tests.utils.processor_context_mock import ProcessorContextMock
+
+
+class TextProcessor(BasicProcessor):
+    processor_type = "text_processor"
+
+    def process(self):
+        return self._config.get("text")
+
+
+class CountingCacheableProcessor(BasicProcessor):
+    processor_type = "counting_cacheable_processor"
+    cacheable = True
+    nb_calls = 0
+
+    def process(self):
+        CountingCacheableProcessor.nb_calls += 1
+        return f"{self._config.get('prompt')} {self.get_input_by_name('context')}"
+
+
+class FakeRedisClient:
+    def __init__(self):
+        self.values = {}
+        self.expirations = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode("utf-8")
+        self.expirations[key] = ex
+
+    def scan_iter(self, match=None):
+        prefix = match.rstrip("*")
+        return [key for key in self.values if key.startswith(prefix)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+class TestNodeOutputCache(unittest.TestCase):
+    def setUp(self):
+        environment = patch.dict(os.environ, {"NODE_OUTPUT_CACHE_ENABLED": "true"})
+        environment.start()
+        self.addCleanup(environment.stop)
+        CountingCacheableProcessor.nb_calls = 0
+        factory = ProcessorFactoryIterModules()
+        factory.register_processor(TextProcessor.processor_type, TextProcessor)
+        factory.register_processor(
+            CountingCacheableProcessor.processor_type, CountingCacheableProcessor
+        )
+        self.cache = MemoryNodeOutputCache(max_size=10, ttl=60)
+        self.launcher = AsyncProcessorLauncher(
+            factory, None, [], node_output_cache=self.cache
+        )
+        self.launcher.set_context(ProcessorContextMock(""))
+
+    def run_flow(self, text, prompt="Summarize", x=0):
+        config_data = [
+            {"name": "text", "processorType": "text_processor", "text": text},
+            {
+                "name": "cached",
+                "processorType": "counting_cacheable_processor",
+                "prompt": prompt,
+                "x": x,
+                "inputs": [{"inputNode": "text", "inputName": "context"}],
+            },
+        ]
+        processors = self.launcher.load_processors(config_data)
+        self.launcher.launch_processors(processors)
+        return processors["cached"].get_output()
+
+    def test_identical_rerun_reuses_cached_output(self):
+        first_output = self.run_flow("Lorem")
+        second_output = self.run_flow("Lorem", x=120)
+
+        self.assertEqual(CountingCacheableProcessor.nb_calls, 1)
+        self.assertEqual(first_output, second_output)
+        self.assertEqual(self.cache.get_stats(), {"hits": 1, "misses": 1})
+
+    def test_cache_is_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.run_flow("Lorem")
+            self.run_flow("Lorem")
+
+        self.assertEqual(CountingCacheableProcessor.nb_calls, 2)
+        self.assertEqual(self.cache.get_stats(), {"hits": 0, "misses": 0})
+
+    def test_changed_input_value_or_config_misses_the_cache(self):
+        self.run_flow("Lorem")
+        self.run_flow("Ipsum")
+        self.run_flow("Ipsum", prompt="Translate")
+
+        self.assertEqual(CountingCacheableProcessor.nb_calls, 3)
+
+    def test_cache_key_ignores_node_name_and_position(self):
+        first = CountingCacheableProcessor(
+            {"name": "a", "processorType": "counting", "prompt": "p", "x": 1}
+        )
+        second = CountingCacheableProcessor(
+            {"name": "b", "processorType": "counting", "prompt": "p", "x": 2}
+        )
+
+        self.assertEqual(
+            build_node_output_cache_key(first), build_node_output_cache_key(second)
+        )
+
+
+class TestNodeOutputCacheBackends(unittest.TestCase):
+    def assert_backend_round_trip(self, cache):
+        self.assertIsNone(cache.get("key"))
+
+        cache.set("key", ["first output", "second output"])
+
+        self.assertEqual(cache.get("key"), ["first output", "second output"])
+        self.assertEqual(cache.get_stats(), {"hits": 1, "misses": 1})
+
+        cache.clear()
+        self.assertIsNone(cache.get("key"))
+
+    def test_memory_backend(self):
+        self.assert_backend_round_trip(MemoryNodeOutputCache(max_size=10, ttl=60))
+
+    def test_memory_backend_hits_are_copies(self):
+        cache = MemoryNodeOutputCache(max_size=10, ttl=60)
+        output = ["first output"]
+        cache.set("key", output)
+        output.append("mutated after set")
+
+        cache.get("key").append("mutated after get")
+
+        self.assertEqual(cache.get("key"), ["first output"])
+
+    def test_sqlite_backend_evicts_least_recently_used_entries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite3")
+            self.assert_backend_round_trip(SqliteNodeOutputCache(path, 10, 60))
+
+            cache = SqliteNodeOutputCache(path, max_size=2, ttl=60)
+            cache.set("a", "A")
+            cache.set("b", "B")
+            cache.get("a")
+            cache.set("c", "C")
+
+            self.assertEqual(cache.get("a"), "A")
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(SqliteNodeOutputCache(path, 2, 60).get("c"), "C")
+
+    def test_redis_backend_with_fake_client(self):
+        client = FakeRedisClient()
+        self.assert_backend_round_trip(RedisNodeOutputCache(client=client, ttl=60))
+
+        RedisNodeOutputCache(client=client, ttl=60).set("key", "value")
+        self.assertEqual(client.expirations["node_output:key"], 60)
+
+    def test_redis_backend_without_the_redis_extra(self):
+        with patch.dict(sys.modules, {"redis": None}):
+            with self.assertRaisesRegex(RuntimeError, "--extras redis"):
+                RedisNodeOutputCache(ttl=60)
@@ -0,0 +1,56 @@
+import unittest
+
+from flask import Flask, g, session
+
+from app.processors.context.processor_context_flask_request import (
+    ProcessorContextFlaskRequest,
+)
+
+
+class TestProcessorContextFlaskRequest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.secret_key = "test"
+
+    def test_snapshot_keeps_only_session_parameters(self):
+        with self.app.test_request_context():
+            g.session_openai_api_key = "openai-key"
+            g.session_replicate_api_key = "replicate-key"
+            g.request_state = {"large": "object"}
+            session["user_id"] = 42
+            session["event_encoding"] = "binary"
+
+            context = ProcessorContextFlaskRequest(g, session, "sid")
+
+        self.assertEqual(context.get_value("openai_api_key"), "openai-key")
+        self.assertIsNone(context.get_value("request_state"))
+        self.assertCountEqual(
+            context.get_parameter_names(), ["openai_api_key", "replicate_api_key"]
+        )
+        self.assertEqual(context.get_current_user_id(), 42)
+        self.assertEqual(context.get_session_id(), "sid")
+        self.assertEqual(context.get_event_encoding(), "binary")
+
+    def test_snapshot_is_not_affected_by_later_request_changes(self):
+        g_context = {"session_openai_api_key": "openai-key"}
+        context = ProcessorContextFlaskRequest(g_context, {}, "sid")
+
+        g_context["session_openai_api_key"] = "other-key"
+
+        self.assertEqual(context.get_value("openai_api_key"), "openai-key")
+
+    def test_snapshot_is_immutable(self):
+        context = ProcessorContextFlaskRequest({"session_openai_api_key": "key"})
+
+        with self.assertRaises(AttributeError):
+            context.session_id = "other"
+        with self.assertRaises(TypeError):
+            context.parameters["openai_api_key"] = "other"
+
+    def test_empty_context(self):
+        context = ProcessorContextFlaskRequest()
+
+        self.assertEqual(context.get_parameter_names(), [])
+        self.assertIsNone(context.get_value("openai_api_key"))
+        self.assertIsNone(context.get_current_user_id())
+        self.assertIsNone(context.get_session_id())
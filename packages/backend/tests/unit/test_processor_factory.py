@@ -1,7 +1,19 @@
+import os
+import tempfile
+import time
 import unittest
+from unittest.mock import patch
+
 from app.processors.factory.processor_factory_iter_modules import (
     ProcessorFactoryIterModules,
 )
+from app.processors.factory.processor_manifest import (
+    build_processor_manifest,
+    get_processor_type_key,
+    is_processor_manifest_stale,
+    iter_processor_classes,
+    load_processor_manifest,
+)
 from app.processors.components.processor import BasicProcessor, ContextAwareProcessor
 
 
@@ -58,3 +70,82 @@ class TestProcessorFactory(unittest.TestCase):
         self.assertIsInstance(processor, APIDummyProcessor)
         self.assertIsInstance(processor, ContextAwareProcessor)
         self.assertEqual(processor._processor_context, "api_data")
+
+    def test_load_processors_builds_the_registry_once_and_freezes_it(self):
+        self.factory.register_processor(DummyProcessor.processor_type, DummyProcessor)
+        self.factory.load_processors()
+        registry = self.factory._processors
+
+        self.factory.load_processors()
+
+        self.assertIs(self.factory._processors, registry)
+        self.assertIn("dummy_processor", registry)
+        with self.assertRaises(RuntimeError):
+            self.factory.register_processor(
+                APIDummyProcessor.processor_type, APIDummyProcessor
+            )
+
+    def test_manifest_lists_every_scanned_processor(self):
+        manifest = build_processor_manifest()
+
+        scanned = {
+            get_processor_type_key(processor_class): processor_class
+            for processor_class in iter_processor_classes()
+        }
+        self.assertEqual(set(manifest["processors"]), set(scanned))
+        for processor_type, entry in manifest["processors"].items():
+            self.assertEqual(entry["module"], scanned[processor_type].__module__)
+            self.assertEqual(entry["class"], scanned[processor_type].__name__)
+
+    def test_manifest_processors_are_imported_on_first_use(self):
+        manifest = {
+            "processors": {
+                "dummy_processor": {
+                    "module": DummyProcessor.__module__,
+                    "class": "DummyProcessor",
+                    "extension": False,
+                    "dynamic": False,
+                }
+            }
+        }
+        with patch(
+            "app.processors.factory.processor_factory_iter_modules.load_processor_manifest",
+            return_value=manifest,
+        ):
+            self.factory.load_processors()
+
+        self.assertEqual(self.factory._processors, {})
+        processor = self.factory.create_processor(
+            {"processorType": "dummy_processor", "name": "dummy_processor"}
+        )
+        self.assertIsInstance(processor, DummyProcessor)
+        self.assertIs(
+            self.factory.get_processor_class("dummy_processor"), DummyProcessor
+        )
+        # The frozen registry is not modified by the import
+        self.assertEqual(self.factory._processors, {})
+        self.assertEqual(self.factory._constructors, {})
+
+    def test_stale_manifest_is_only_trusted_in_manifest_mode(self):
+        with tempfile.TemporaryDirectory() as directory:
+            processors_dir = os.path.join(directory, "components")
+            os.mkdir(processors_dir)
+            module_path = os.path.join(processors_dir, "dummy_processor.py")
+            open(module_path, "w").close()
+            manifest_path = os.path.join(directory, "processor_manifest.json")
+            with open(manifest_path, "w") as file:
+                file.write('{"processors": {}}')
+            self.assertFalse(is_processor_manifest_stale(manifest_path, processors_dir))
+
+            modified_at = time.time() + 10
+            os.utime(module_path, (modified_at, modified_at))
+            self.assertTrue(is_processor_manifest_stale(manifest_path, processors_dir))
+
+            with patch(
+                "app.processors.factory.processor_manifest.is_processor_manifest_stale",
+                return_value=True,
+            ):
+                with patch.dict(os.environ, {"PROCESSOR_REGISTRY_MODE": "auto"}):
+                    self.assertIsNone(load_processor_manifest(manifest_path))
+                with patch.dict(os.environ, {"PROCESSOR_REGISTRY_MODE": "manifest"}):
+                    self.assertIsNotNone(load_processor_manifest(manifest_path))
@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import patch
+
+from app.processors.components.processor import BasicProcessor
+
+
+class SimpleProcessor(BasicProcessor):
+    processor_type = "simple_processor"
+
+    def process(self):
+        return self.name
+
+
+def create_processor(name, inputs=None, **config):
+    return SimpleProcessor(
+        {
+            "name": name,
+            "processorType": SimpleProcessor.processor_type,
+            "inputs": inputs or [],
+            **config,
+        }
+    )
+
+
+class TestProcessorInputs(unittest.TestCase):
+    def setUp(self):
+        self.text = create_processor("text")
+        self.text.set_output(["first", "second"])
+        self.data = create_processor("data")
+        self.data.set_output([{"rows": list(range(100))}])
+        self.processor = create_processor(
+            "processor",
+            inputs=[
+                {"inputName": "prompt", "inputNode": "text", "inputNodeOutputKey": 1},
+                {"inputName": "table", "inputNode": "data", "inputNodeOutputKey": 0},
+                {"inputName": "prompt", "inputNode": "data", "inputNodeOutputKey": 0},
+            ],
+            prompt="config prompt",
+            model="gpt",
+        )
+        self.processor.add_input_processor(self.text)
+        self.processor.add_input_processor(self.data)
+        self.processor.add_input_processor(self.data)
+
+    def test_linked_inputs_take_precedence_over_config(self):
+        self.assertEqual(self.processor.get_input_by_name("prompt"), "second")
+        self.assertEqual(self.processor.get_input_by_name("model"), "gpt")
+        self.assertEqual(self.processor.get_input_by_name("missing", "x"), "x")
+
+    def test_object_outputs_are_serialized_once_per_upstream_output(self):
+        with patch(
+            "app.processors.components.processor.json.dumps", return_value="{}"
+        ) as dumps:
+            for _ in range(10):
+                self.assertEqual(self.processor.get_input_by_name("table"), "{}")
+            dumps.assert_called_once()
+
+            self.data.set_output([{"rows": []}])
+            self.processor.get_input_by_name("table")
+            self.assertEqual(dumps.call_count, 2)
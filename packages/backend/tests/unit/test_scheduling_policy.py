@@ -0,0 +1,91 @@
+import unittest
+from types import SimpleNamespace
+
+from app.processors.launcher.concurrency_limits import ConcurrencyLimits
+from app.processors.launcher.dag_scheduler import DagScheduler
+from app.processors.launcher.node_duration_history import NodeDurationHistory
+from app.processors.launcher.scheduling_policy import (
+    DEFAULT_NODE_DURATION,
+    CriticalPathSchedulingPolicy,
+    FifoSchedulingPolicy,
+)
+
+
+def create_node(id, processor_type, parent_ids=None, runs_inline=False):
+    return SimpleNamespace(
+        id=id,
+        parent_ids=parent_ids or [],
+        processor=SimpleNamespace(processor_type=processor_type),
+        provider=None,
+        runs_inline=runs_inline,
+    )
+
+
+def create_wide_flow():
+    """A short independent node listed first, and a slow llm -> image -> video chain."""
+    nodes = [
+        create_node("short", "text"),
+        create_node("llm", "llm"),
+        create_node("image", "image", ["llm"]),
+        create_node("video", "video", ["image"]),
+    ]
+    return {node.id: node for node in nodes}
+
+
+class TestCriticalPathSchedulingPolicy(unittest.TestCase):
+    def setUp(self):
+        self.history = NodeDurationHistory()
+        for processor_type, duration in [
+            ("text", 1),
+            ("llm", 5),
+            ("image", 10),
+            ("video", 60),
+        ]:
+            self.history.record(processor_type, duration)
+        self.policy = CriticalPathSchedulingPolicy(self.history)
+
+    def test_priority_is_the_longest_downstream_path(self):
+        nodes = create_wide_flow()
+        _, children = DagScheduler.build_dependency_index(nodes)
+
+        priorities = self.policy.get_priorities(nodes, children)
+
+        self.assertEqual(priorities, {"short": 1, "llm": 75, "image": 70, "video": 60})
+
+    def test_unknown_and_inline_nodes_have_default_estimates(self):
+        self.assertEqual(
+            self.policy.estimate_duration(create_node("a", "unknown")),
+            DEFAULT_NODE_DURATION,
+        )
+        self.assertEqual(
+            self.policy.estimate_duration(create_node("b", "video", runs_inline=True)),
+            0.0,
+        )
+
+    def test_history_keeps_a_moving_average(self):
+        history = NodeDurationHistory(smoothing=0.5)
+        history.record("llm", 2)
+        history.record("llm", 4)
+
+        self.assertEqual(history.get_average("llm"), 3)
+
+    def test_scheduler_starts_the_critical_path_first(self):
+        started = []
+        nodes = create_wide_flow()
+
+        DagScheduler(
+            nodes,
+            lambda node: started.append(node.id),
+            ConcurrencyLimits(max_concurrency=1),
+            scheduling_policy=self.policy,
+        ).run()
+        self.assertEqual(started, ["llm", "image", "video", "short"])
+
+        started.clear()
+        DagScheduler(
+            nodes,
+            lambda node: started.append(node.id),
+            ConcurrencyLimits(max_concurrency=1),
+            scheduling_policy=FifoSchedulingPolicy(),
+        ).run()
+        self.assertEqual(started, ["short", "llm", "image", "video"])
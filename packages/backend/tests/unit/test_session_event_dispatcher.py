@@ -0,0 +1,100 @@
+import time
+import unittest
+
+import eventlet
+
+from app.processors.launcher.event_type import EventType
+from app.processors.launcher.processor_launcher_event import ProcessorLauncherEvent
+from app.processors.observer.observer import Observer
+from app.processors.observer.session_event_dispatcher import (
+    OverflowPolicy,
+    SessionEventDispatcher,
+)
+
+
+class SlowObserver(Observer):
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.events = []
+
+    def notify(self, event, data):
+        eventlet.sleep(self.delay)
+        self.events.append((event, data.instance_name))
+
+
+def create_event(instance_name, session_id="session"):
+    return ProcessorLauncherEvent(instance_name=instance_name, session_id=session_id)
+
+
+STREAMING_DELTA = EventType.STREAMING_DELTA.value
+PROGRESS = EventType.PROGRESS.value
+ERROR = EventType.ERROR.value
+
+
+class TestSessionEventDispatcher(unittest.TestCase):
+    def test_slow_observer_does_not_block_the_producer(self):
+        observer = SlowObserver(delay=0.02)
+        dispatcher = SessionEventDispatcher(
+            observer, 100, OverflowPolicy.DROP_STREAMING
+        )
+
+        start_time = time.time()
+        for i in range(5):
+            dispatcher.notify(PROGRESS, create_event(f"node-{i}"))
+        duration = time.time() - start_time
+
+        self.assertLess(duration, 0.02)
+        dispatcher.wait_until_sent("session")
+        self.assertEqual(observer.events, [(PROGRESS, f"node-{i}") for i in range(5)])
+        self.assertEqual(dispatcher.outboxes, {})
+
+    def test_full_queue_drops_streaming_frames_only(self):
+        observer = SlowObserver()
+        dispatcher = SessionEventDispatcher(observer, 2, OverflowPolicy.DROP_STREAMING)
+
+        dispatcher.notify(STREAMING_DELTA, create_event("delta-1"))
+        dispatcher.notify(STREAMING_DELTA, create_event("delta-2"))
+        dispatcher.notify(PROGRESS, create_event("progress"))
+        dispatcher.notify(STREAMING_DELTA, create_event("delta-3"))
+        dispatcher.notify(ERROR, create_event("error"))
+        dispatcher.notify(STREAMING_DELTA, create_event("delta-4"))
+        dispatcher.wait_until_sent("session")
+
+        self.assertEqual(observer.events, [(PROGRESS, "progress"), (ERROR, "error")])
+        self.assertEqual(dispatcher.get_metrics()["droppedEvents"], 4)
+
+    def test_block_policy_makes_the_producer_wait(self):
+        observer = SlowObserver(delay=0.01)
+        dispatcher = SessionEventDispatcher(observer, 1, OverflowPolicy.BLOCK)
+
+        def produce():
+            for i in range(4):
+                dispatcher.notify(STREAMING_DELTA, create_event(f"delta-{i}"))
+
+        producer = eventlet.spawn(produce)
+        eventlet.sleep(0)
+        self.assertFalse(producer.dead)
+
+        producer.wait()
+        dispatcher.wait_until_sent("session")
+        self.assertEqual(
+            observer.events, [(STREAMING_DELTA, f"delta-{i}") for i in range(4)]
+        )
+        self.assertEqual(dispatcher.get_metrics()["droppedEvents"], 0)
+
+    def test_sessions_have_separate_queues(self):
+        observer = SlowObserver()
+        dispatcher = SessionEventDispatcher(observer, 1, OverflowPolicy.DROP_STREAMING)
+
+        dispatcher.notify(STREAMING_DELTA, create_event("a", "session-a"))
+        dispatcher.notify(STREAMING_DELTA, create_event("b", "session-b"))
+        dispatcher.wait_until_sent("session-a")
+        dispatcher.wait_until_sent("session-b")
+
+        self.assertCountEqual(
+            observer.events, [(STREAMING_DELTA, "a"), (STREAMING_DELTA, "b")]
+        )
+
+    def test_unknown_overflow_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            OverflowPolicy.from_value("unknown")
@@ -0,0 +1,124 @@
+import sys
+import unittest
+from unittest.mock import patch
+
+import eventlet
+from flask import Flask
+from flask_socketio import SocketIO
+from socketio.packet import Packet
+
+from app.flask.socketio_write_only import create_write_only_socketio
+from app.processors.launcher.event_type import EventType
+from app.processors.launcher.processor_launcher_event import ProcessorLauncherEvent
+from app.processors.observer.event_encoding import (
+    BINARY_ATTACHMENT_MIN_BYTES,
+    EventEncoding,
+    decode_payload,
+)
+from app.processors.observer.session_event_dispatcher import SessionEventDispatcher
+from app.processors.observer.socketio_event_emitter import SocketIOEventEmitter
+from app.root_injector import (
+    get_root_injector,
+    init_root_injector,
+    refresh_root_injector,
+)
+from tests.utils.in_memory_pubsub_manager import (
+    InMemoryMessageBus,
+    InMemoryPubSubManager,
+)
+
+
+class TestSocketIOMessageQueue(unittest.TestCase):
+    """A flow runs on worker B while its client is connected to worker A."""
+
+    def setUp(self):
+        self.bus = InMemoryMessageBus()
+
+        self.worker_a = SocketIO(
+            Flask(__name__),
+            async_mode="eventlet",
+            client_manager=InMemoryPubSubManager(self.bus),
+        )
+        server = self.worker_a.server
+        server.manager.initialize()
+        server.manager_initialized = True
+        eventlet.sleep(0)
+        # A client connected to worker A, its packets are recorded instead of being sent.
+        self.sid = server.manager.connect("client-eio-sid", "/")
+        self.sent_packets = []
+        server._send_eio_packet = lambda eio_sid, eio_packet: self.sent_packets.append(
+            eio_packet.data
+        )
+
+        self.worker_b = create_write_only_socketio(
+            "memory://",
+            client_manager=InMemoryPubSubManager(self.bus, write_only=True),
+        )
+
+    def get_received_events(self):
+        """Decodes the packets sent to the client, as the Socket.IO client does."""
+        events = []
+        current_packet = None
+        for data in self.sent_packets:
+            if current_packet is None:
+                current_packet = Packet(encoded_packet=data)
+                if current_packet.attachment_count == 0:
+                    events.append(current_packet.data)
+                    current_packet = None
+            elif current_packet.add_attachment(data):
+                events.append(current_packet.data)
+                current_packet = None
+        return events
+
+    def emit_from_worker_b(self, output, event_encoding=None):
+        event = ProcessorLauncherEvent(
+            instance_name="node",
+            output=output,
+            session_id=self.sid,
+            event_encoding=event_encoding,
+            isDone=True,
+        )
+        SocketIOEventEmitter(self.worker_b).notify(EventType.PROGRESS.value, event)
+        eventlet.sleep(0.05)
+
+    def test_event_emitted_on_another_worker_reaches_the_client(self):
+        self.emit_from_worker_b(["output"])
+
+        self.assertEqual(
+            self.get_received_events(),
+            [
+                [
+                    "progress",
+                    {"instanceName": "node", "output": ["output"], "isDone": True},
+                ]
+            ],
+        )
+
+    def test_binary_attachments_go_through_the_message_queue(self):
+        output = ["x" * BINARY_ATTACHMENT_MIN_BYTES]
+
+        self.emit_from_worker_b(output, EventEncoding.BINARY.value)
+
+        event, frame = self.get_received_events()[0]
+        self.assertEqual(event, "progress")
+        self.assertEqual(frame[:2], ["node", True])
+        self.assertEqual(decode_payload(frame[2]), output)
+
+    def test_write_only_socketio_requires_a_message_queue(self):
+        with self.assertRaises(RuntimeError):
+            create_write_only_socketio()
+
+    def test_redis_message_queue_without_the_redis_extra(self):
+        with patch.dict(sys.modules, {"redis": None}):
+            with self.assertRaisesRegex(RuntimeError, "--extras redis"):
+                create_write_only_socketio("redis://localhost:6379/1")
+
+    def test_root_injector_keeps_the_write_only_emitter_when_refreshed(self):
+        emitter = SocketIOEventEmitter(self.worker_b)
+        init_root_injector(emitter)
+        self.addCleanup(init_root_injector)
+
+        refresh_root_injector()
+
+        dispatcher = get_root_injector().get(SessionEventDispatcher)
+        self.assertIs(dispatcher.observer, emitter)
@@ -0,0 +1,211 @@
+import os
+from typing import List
+import unittest
+from unittest.mock import patch
+
+import eventlet
+from injector import Injector
+
+from app.processors.launcher.event_type import EventType
+from app.processors.launcher.processor_launcher_event import ProcessorLauncherEvent
+from app.processors.observer.observer import Observer
+from app.processors.observer.session_event_dispatcher import SessionEventDispatcher
+from app.processors.observer.streaming_event_coalescer import StreamingEventCoalescer
+from app.root_injector import ProcessorLauncherModule
+
+
+class RecordingObserver(Observer):
+    def __init__(self):
+        self.events = []
+
+    def notify(self, event, data):
+        self.events.append((event, data.instance_name, data.output, data.sequence))
+
+
+class SlowRecordingObserver(RecordingObserver):
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+
+    def notify(self, event, data):
+        super().notify(event, data)
+        eventlet.sleep(self.delay)
+
+
+def delta(sequence, text, instance_name="llm", session_id="session"):
+    return ProcessorLauncherEvent(
+        instance_name=instance_name,
+        output=text,
+        session_id=session_id,
+        sequence=sequence,
+    )
+
+
+def progress(output, instance_name="llm", session_id="session"):
+    return ProcessorLauncherEvent(
+        instance_name=instance_name, output=output, session_id=session_id
+    )
+
+
+STREAMING_DELTA = EventType.STREAMING_DELTA.value
+PROGRESS = EventType.PROGRESS.value
+CURRENT_NODE_RUNNING = EventType.CURRENT_NODE_RUNNING.value
+
+
+class TestStreamingEventCoalescer(unittest.TestCase):
+    def setUp(self):
+        self.observer = RecordingObserver()
+
+    def test_deltas_are_merged_and_flushed_before_the_progress_event(self):
+        coalescer = StreamingEventCoalescer(self.observer, 1000, 4096)
+
+        for sequence, text in enumerate(["Hel", "lo", " world"], start=1):
+            coalescer.notify(STREAMING_DELTA, delta(sequence, text))
+        coalescer.notify(PROGRESS, progress(["Hello world"]))
+
+        self.assertEqual(
+            self.observer.events,
+            [
+                (STREAMING_DELTA, "llm", "Hello world", 1),
+                (PROGRESS, "llm", ["Hello world"], None),
+            ],
+        )
+        self.assertEqual(
+            coalescer.get_metrics(),
+            {
+                "streamingEvents": 3,
+                "streamingFrames": 1,
+                "framesSaved": 2,
+                "pendingBuffers": 0,
+            },
+        )
+
+    def test_buffer_is_flushed_when_full_and_sequences_stay_consecutive(self):
+        coalescer = StreamingEventCoalescer(self.observer, 1000, 4)
+
+        for sequence, text in enumerate(["ab", "cd", "ef", "gh", "i"], start=1):
+            coalescer.notify(STREAMING_DELTA, delta(sequence, text))
+        coalescer.flush_all()
+
+        self.assertEqual(
+            self.observer.events,
+            [
+                (STREAMING_DELTA, "llm", "abcd", 1),
+                (STREAMING_DELTA, "llm", "efgh", 2),
+                (STREAMING_DELTA, "llm", "i", 3),
+            ],
+        )
+
+    def test_buffer_is_flushed_after_the_interval(self):
+        coalescer = StreamingEventCoalescer(self.observer, 10, 4096)
+
+        coalescer.notify(STREAMING_DELTA, delta(1, "Hello"))
+        self.assertEqual(self.observer.events, [])
+
+        eventlet.sleep(0.05)
+
+        self.assertEqual(self.observer.events, [(STREAMING_DELTA, "llm", "Hello", 1)])
+
+    def test_nodes_and_sessions_are_buffered_separately(self):
+        coalescer = StreamingEventCoalescer(self.observer, 1000, 4096)
+
+        coalescer.notify(STREAMING_DELTA, delta(1, "a", "llm-1"))
+        coalescer.notify(STREAMING_DELTA, delta(1, "b", "llm-2"))
+        coalescer.notify(STREAMING_DELTA, delta(1, "c", "llm-1", "other-session"))
+        coalescer.notify(PROGRESS, progress(["a"], "llm-1"))
+
+        self.assertEqual(
+            self.observer.events,
+            [
+                (STREAMING_DELTA, "llm-1", "a", 1),
+                (PROGRESS, "llm-1", ["a"], None),
+            ],
+        )
+        self.assertEqual(coalescer.get_metrics()["pendingBuffers"], 2)
+        coalescer.flush_all()
+
+    def test_zero_interval_forwards_every_event(self):
+        coalescer = StreamingEventCoalescer(self.observer, 0, 4096)
+
+        coalescer.notify(STREAMING_DELTA, delta(1, "a"))
+        coalescer.notify(STREAMING_DELTA, delta(2, "b"))
+
+        self.assertEqual(
+            self.observer.events,
+            [(STREAMING_DELTA, "llm", "a", 1), (STREAMING_DELTA, "llm", "b", 2)],
+        )
+        self.assertEqual(coalescer.get_metrics()["framesSaved"], 0)
+
+    def test_restarted_node_numbers_its_frames_from_one(self):
+        coalescer = StreamingEventCoalescer(self.observer, 1000, 1)
+
+        coalescer.notify(CURRENT_NODE_RUNNING, progress(None))
+        coalescer.notify(STREAMING_DELTA, delta(1, "first"))
+        coalescer.notify(STREAMING_DELTA, delta(2, " run"))
+        # The node is cancelled and run again, without a progress event.
+        coalescer.notify(CURRENT_NODE_RUNNING, progress(None))
+        coalescer.notify(STREAMING_DELTA, delta(3, "second run"))
+
+        self.assertEqual(
+            [sequence for _, _, _, sequence in self.observer.events],
+            [None, 1, 2, None, 1],
+        )
+        self.assertEqual(coalescer.emitted_sequences, {("session", "llm"): 1})
+
+    def test_discarded_session_and_node_leave_no_state(self):
+        coalescer = StreamingEventCoalescer(self.observer, 1000, 4)
+
+        coalescer.notify(STREAMING_DELTA, delta(1, "flushed"))
+        coalescer.notify(STREAMING_DELTA, delta(2, "a"))
+        coalescer.notify(STREAMING_DELTA, delta(1, "b", "other-llm"))
+        coalescer.notify(STREAMING_DELTA, delta(1, "c", "llm", "other-session"))
+
+        coalescer.discard_session("session")
+        self.assertEqual(list(coalescer.buffers), [("other-session", "llm")])
+        self.assertEqual(coalescer.emitted_sequences, {})
+
+        coalescer.discard_node("other-session", "llm")
+        eventlet.sleep(0)
+        self.assertEqual(coalescer.buffers, {})
+        self.assertEqual(self.observer.events, [(STREAMING_DELTA, "llm", "flushed", 1)])
+
+
+class TestLauncherEventObservers(unittest.TestCase):
+    @patch.dict(
+        os.environ,
+        {
+            "STREAMING_FLUSH_INTERVAL_MS": "1000",
+            "STREAMING_FLUSH_MAX_BYTES": "1",
+            "EVENT_QUEUE_MAX_SIZE": "3",
+            "EVENT_QUEUE_OVERFLOW_POLICY": "drop_streaming",
+        },
+    )
+    def test_frames_dropped_by_a_full_queue_leave_a_sequence_gap(self):
+        emitter = SlowRecordingObserver(delay=0.01)
+        injector = Injector([ProcessorLauncherModule(emitter)])
+
+        for sequence in range(1, 11):
+            for observer in injector.get(List[Observer]):
+                observer.notify(STREAMING_DELTA, delta(sequence, f"chunk-{sequence}"))
+        injector.get(SessionEventDispatcher).wait_until_sent("session")
+
+        sequences = [sequence for _, _, _, sequence in emitter.events]
+        self.assertLess(len(sequences), 10)
+        self.assertNotEqual(sequences, list(range(1, len(sequences) + 1)))
+        for _, _, output, sequence in emitter.events:
+            self.assertEqual(output, f"chunk-{sequence}")
+
+    @patch.dict(os.environ, {"STREAMING_FLUSH_INTERVAL_MS": "1000"})
+    def test_pending_frames_are_sent_once_the_session_is_flushed(self):
+        emitter = RecordingObserver()
+        injector = Injector([ProcessorLauncherModule(emitter)])
+        coalescer = injector.get(StreamingEventCoalescer)
+
+        coalescer.notify(STREAMING_DELTA, delta(1, "Hello"))
+        coalescer.notify(STREAMING_DELTA, delta(1, "Hi", "llm", "other-session"))
+        coalescer.flush_session("session")
+        injector.get(SessionEventDispatcher).wait_until_sent("session")
+
+        self.assertEqual(emitter.events, [(STREAMING_DELTA, "llm", "Hello", 1)])
+        self.assertEqual(list(coalescer.buffers), [("other-session", "llm")])
+        coalescer.discard_session("other-session")
@@ -0,0 +1,41 @@
+import json
+
+from eventlet.queue import LightQueue
+from socketio import PubSubManager
+
+
+class InMemoryMessageBus:
+    """Message queue stand-in shared by the Socket.IO servers of a test, within one process."""
+
+    def __init__(self):
+        self.subscribers = []
+
+    def subscribe(self) -> LightQueue:
+        queue = LightQueue()
+        self.subscribers.append(queue)
+        return queue
+
+    def publish(self, message: str) -> None:
+        for queue in self.subscribers:
+            queue.put(message)
+
+
+class InMemoryPubSubManager(PubSubManager):
+    """
+    Socket.IO client manager publishing on an InMemoryMessageBus, as RedisManager does on Redis.
+    Messages are serialized to JSON, like on a real message queue.
+    """
+
+    name = "in-memory"
+
+    def __init__(self, bus: InMemoryMessageBus, write_only=False):
+        super().__init__(write_only=write_only)
+        self.bus = bus
+
+    def _publish(self, data):
+        self.bus.publish(json.dumps(data))
+
+    def _listen(self):
+        queue = self.bus.subscribe()
+        while True:
+            yield queue.get()
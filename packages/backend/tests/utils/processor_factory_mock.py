@@ -50,6 +50,8 @@ class ProcessorFactoryMock(ProcessorFactoryIterModules):
 
         mock_processor.name = config.get("name", "default_processor_name")
         mock_processor.processor_type = processor_type
+        mock_processor.provider = None
+        mock_processor.runs_inline = False
         mock_processor.input_processors = []
         mock_processor._processor_context = ProcessorContextMock("")
 
@@ -111,6 +113,9 @@ class ProcessorFactoryMock(ProcessorFactoryIterModules):
         def fake_has_dynamic_behavior():
             return False
 
+        def fake_is_output_cacheable():
+            return False
+
         def fake_get_input_by_name(input_name, default_value=""):
             return default_value
 
@@ -122,6 +127,7 @@ class ProcessorFactoryMock(ProcessorFactoryIterModules):
         mock_processor.add_input_processor = fake_add_input_processor
         mock_processor.get_input_processors = get_input_processors
         mock_processor.has_dynamic_behavior = fake_has_dynamic_behavior
+        mock_processor.is_output_cacheable = fake_is_output_cacheable
         mock_processor.get_input_by_name = fake_get_input_by_name
 
         self._mock_processors[processor_type] = mock_processor
@@ -130,7 +136,7 @@ class ProcessorFactoryMock(ProcessorFactoryIterModules):
 
     def create_processor(self, config, context=None, storage_strategy=None):
         processor_type = config["processorType"]
-        processor_class = self._processors.get(processor_type)
+        processor_class = self.get_processor_class(processor_type)
         if not processor_class:
             raise ValueError(f"Processor type '{processor_type}' not supported")
 
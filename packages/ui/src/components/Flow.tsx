@@ -37,6 +37,7 @@ import {
   FlowOnCurrentNodeRunningEventData,
   FlowOnErrorEventData,
   FlowOnProgressEventData,
+  FlowOnStreamDeltaEventData,
 } from "../sockets/flowEventTypes";
 import { useVisibility } from "../providers/VisibilityProvider";
 import { FlowMetadata } from "../layout/main-layout/AppLayout";
@@ -130,13 +131,62 @@ const Flow = forwardRef((props: FlowProps, ref) => {
     addNode,
   }));
 
+  // Text streamed by each running node, rebuilt from "stream_delta" events. The entry of a node
+  // is reset when the node starts or fails, and by its progress events, which carry the full output.
+  const streamedTexts = useRef<
+    Record<string, { sequence: number; text: string; desynced: boolean }>
+  >({});
+
   useSocketListeners<
     FlowOnProgressEventData,
     FlowOnErrorEventData,
-    FlowOnProgressEventData
-  >(onProgress, onError, () => {}, onCurrentNodeRunning);
+    FlowOnProgressEventData,
+    FlowOnStreamDeltaEventData
+  >(
+    onProgress,
+    onError,
+    () => {},
+    onCurrentNodeRunning,
+    undefined,
+    onStreamDelta,
+  );
+
+  function onStreamDelta(data: FlowOnStreamDeltaEventData) {
+    const streamed = streamedTexts.current[data.instanceName];
+    if (streamed?.desynced) {
+      return;
+    }
+
+    if (data.sequence !== (streamed?.sequence ?? 0) + 1) {
+      // A chunk is missing, the text is resynced by the next progress event of the node.
+      streamedTexts.current[data.instanceName] = {
+        sequence: data.sequence,
+        text: "",
+        desynced: true,
+      };
+      return;
+    }
+
+    const text = (streamed?.text ?? "") + data.delta;
+    streamedTexts.current[data.instanceName] = {
+      sequence: data.sequence,
+      text,
+      desynced: false,
+    };
+
+    updateNodeOutput({
+      instanceName: data.instanceName,
+      output: text,
+      isDone: false,
+    });
+  }
 
   function onProgress(data: FlowOnProgressEventData) {
+    delete streamedTexts.current[data.instanceName];
+    updateNodeOutput(data);
+  }
+
+  function updateNodeOutput(data: FlowOnProgressEventData) {
     const nodeToUpdate = data.instanceName;
     const output = data.output;
 
@@ -165,6 +215,9 @@ const Flow = forwardRef((props: FlowProps, ref) => {
   }
 
   function onError(data: FlowOnErrorEventData) {
+    if (data.instanceName) {
+      delete streamedTexts.current[data.instanceName];
+    }
     setCurrentNodesRunning((previous) => {
       return previous.filter((node) => node != data.instanceName);
     });
@@ -178,6 +231,7 @@ const Flow = forwardRef((props: FlowProps, ref) => {
   }
 
   function onCurrentNodeRunning(data: FlowOnCurrentNodeRunningEventData) {
+    delete streamedTexts.current[data.instanceName];
     setCurrentNodesRunning((previous) => {
       return [...previous, data.instanceName];
     });
@@ -2,24 +2,38 @@ import { useContext, useEffect } from "react";
 import { SocketContext } from "../providers/SocketProvider";
 import { useTranslation } from "react-i18next";
 import { toastInfoMessage } from "../utils/toastUtils";
+import {
+  decodeProgressEvent,
+  decodeStreamDeltaEvent,
+} from "../sockets/eventDecoding";
 
 export const useSocketListeners = <
   ProgressData,
   ErrorData,
   CurrentNodeRunningData,
+  StreamDeltaData = any,
 >(
   onProgress: (data: ProgressData) => void,
   onError: (data: ErrorData) => void,
   onRunEnd: () => void,
   onCurrentNodeRunning: (data: CurrentNodeRunningData) => void,
   onDisconnect?: (reason: string) => void,
+  onStreamDelta?: (data: StreamDeltaData) => void,
 ) => {
   const { t } = useTranslation("flow");
   const { socket } = useContext(SocketContext);
 
   useEffect(() => {
+    const handleProgress = (data: any) =>
+      onProgress(decodeProgressEvent(data) as ProgressData);
+    const handleStreamDelta = (data: any) =>
+      onStreamDelta?.(decodeStreamDeltaEvent(data) as StreamDeltaData);
+
     if (socket) {
-      socket.on("progress", onProgress);
+      socket.on("progress", handleProgress);
+      if (onStreamDelta) {
+        socket.on("stream_delta", handleStreamDelta);
+      }
       socket.on("error", onError);
       socket.on("run_end", onRunEnd);
       socket.on("current_node_running", onCurrentNodeRunning);
@@ -31,7 +45,10 @@ export const useSocketListeners = <
 
     return () => {
       if (socket) {
-        socket.off("progress", onProgress);
+        socket.off("progress", handleProgress);
+        if (onStreamDelta) {
+          socket.off("stream_delta", handleStreamDelta);
+        }
         socket.off("error", onError);
         socket.off("run_end", onRunEnd);
         socket.off("current_node_running", onCurrentNodeRunning);
@@ -14,6 +14,7 @@ import {
 import { toastInfoMessage } from "../utils/toastUtils";
 import { useTranslation } from "react-i18next";
 import { FlowEventOut, FlowSocket } from "../sockets/flowSocket";
+import { EVENT_ENCODING } from "../sockets/eventDecoding";
 
 import { FlowMetadata } from "../layout/main-layout/AppLayout";
 import { AppConfig } from "../components/popups/config-popup/configMetadata";
@@ -96,7 +97,9 @@ export const SocketProvider = ({ children }: SocketProviderProps) => {
   function createNewSocket(configuration?: WSConfiguration) {
     if (configuration) setConfig(configuration);
 
-    const newSocket = new FlowSocket(io(getWsUrl()));
+    const newSocket = new FlowSocket(
+      io(getWsUrl(), { auth: { eventEncoding: EVENT_ENCODING } }),
+    );
 
     const sendAppConfig = () => {
       const appConfig: Partial<AppConfig> = JSON.parse(
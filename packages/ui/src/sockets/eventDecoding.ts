@@ -0,0 +1,54 @@
+import {
+  FlowOnProgressEventData,
+  FlowOnStreamDeltaEventData,
+} from "./flowEventTypes";
+
+// The socket connects with the binary event encoding of the backend (see EventEncoding):
+// progress and stream_delta events are positional frames, large outputs are binary attachments.
+// JSON events are still accepted, some backend processes always send them.
+export const EVENT_ENCODING = "binary";
+
+const TEXT_PAYLOAD = 0;
+const JSON_PAYLOAD = 1;
+const TEXT_LIST_PAYLOAD = 2;
+const TEXT_LIST_SEPARATOR = "\x1e";
+
+const textDecoder = new TextDecoder();
+
+export function decodePayload(value: any): any {
+  if (!(value instanceof ArrayBuffer) && !ArrayBuffer.isView(value)) {
+    return value;
+  }
+
+  const bytes =
+    value instanceof ArrayBuffer
+      ? new Uint8Array(value)
+      : new Uint8Array(value.buffer, value.byteOffset, value.byteLength);
+  const payload = textDecoder.decode(bytes.subarray(1));
+
+  switch (bytes[0]) {
+    case JSON_PAYLOAD:
+      return JSON.parse(payload);
+    case TEXT_LIST_PAYLOAD:
+      return payload.split(TEXT_LIST_SEPARATOR);
+    case TEXT_PAYLOAD:
+    default:
+      return payload;
+  }
+}
+
+export function decodeProgressEvent(data: any): FlowOnProgressEventData {
+  if (!Array.isArray(data)) {
+    return data;
+  }
+  const [instanceName, isDone, output] = data;
+  return { instanceName, isDone, output: decodePayload(output) };
+}
+
+export function decodeStreamDeltaEvent(data: any): FlowOnStreamDeltaEventData {
+  if (!Array.isArray(data)) {
+    return data;
+  }
+  const [instanceName, sequence, delta] = data;
+  return { instanceName, sequence, delta: decodePayload(delta) };
+}
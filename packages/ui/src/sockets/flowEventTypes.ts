@@ -4,6 +4,12 @@ export interface FlowOnProgressEventData<T = any> {
   isDone: boolean;
 }
 
+export interface FlowOnStreamDeltaEventData {
+  instanceName: string;
+  delta: string;
+  sequence: number;
+}
+
 export interface FlowOnErrorEventData {
   instanceName: string;
   nodeName: string;
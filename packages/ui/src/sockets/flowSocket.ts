@@ -3,6 +3,7 @@ import { Socket } from "socket.io-client";
 export type FlowEventIn =
   | "connect"
   | "progress"
+  | "stream_delta"
   | "error"
   | "run_end"
   | "current_node_running"